@@ -0,0 +1,283 @@
+"""Streaming aggregation of telemetry segments.
+
+Reads the ``.jsonl.gz`` segments written by game.telemetry (any number of
+directories, e.g. one per cabinet, searched recursively) one record at a
+time and rolls them up per minigame: score histogram, success rate and
+reaction-time / frame-time percentiles from fixed-bucket histograms, so
+memory does not grow with the number of records.
+
+Rollups are kept per segment in a checkpoint file; a re-run only reads
+segments that are new or whose size changed (a cabinet still appending)
+and merges the rest from the checkpoint.
+
+Usage:
+    python -m game.aggregate [DIR ...] [--checkpoint FILE] [--rebuild] [--histogram] [--json]
+"""
+import argparse
+import gzip
+import json
+import os
+import sys
+import zlib
+from collections import Counter
+from typing import Dict, Iterator, Optional
+
+from .telemetry import SEGMENT_SUFFIX, get_telemetry_dir
+
+
+CHECKPOINT_NAME = "rollup.json"
+CHECKPOINT_VERSION = 1
+
+REACTION_BUCKET_MS = 10  # reaction-time histogram resolution
+FRAME_BUCKET_MS = 0.5  # mean frame-time histogram resolution
+
+
+class MinigameRollup:
+    """Mergeable per-minigame counters (histograms are Counters of bucket → count)."""
+
+    def __init__(self):
+        self.attempts = 0
+        self.successes = 0
+        self.scores = Counter()
+        self.reaction = Counter()  # bucket index (REACTION_BUCKET_MS)
+        self.no_reaction = 0  # the minigame ended without a press
+        self.frame_mean = Counter()  # bucket index (FRAME_BUCKET_MS)
+        self.frames = 0
+        self.late_frames = 0
+
+    def add(self, record: dict) -> None:
+        self.attempts += 1
+        self.successes += bool(record.get("success"))
+        score = record.get("score")
+        if isinstance(score, (int, float)):
+            self.scores[int(score)] += 1
+        reaction = record.get("reaction_ms")
+        if reaction is None:
+            self.no_reaction += 1
+        else:
+            self.reaction[int(reaction // REACTION_BUCKET_MS)] += 1
+        frames = record.get("frames") or {}
+        if frames.get("count"):
+            self.frame_mean[int(frames.get("mean_ms", 0.0) // FRAME_BUCKET_MS)] += 1
+            self.frames += frames["count"]
+            self.late_frames += frames.get("late", 0)
+
+    def merge(self, other: "MinigameRollup") -> None:
+        self.attempts += other.attempts
+        self.successes += other.successes
+        self.scores.update(other.scores)
+        self.reaction.update(other.reaction)
+        self.no_reaction += other.no_reaction
+        self.frame_mean.update(other.frame_mean)
+        self.frames += other.frames
+        self.late_frames += other.late_frames
+
+    def to_dict(self) -> dict:
+        return {
+            "attempts": self.attempts, "successes": self.successes,
+            "scores": {str(k): v for k, v in self.scores.items()},
+            "reaction": {str(k): v for k, v in self.reaction.items()},
+            "no_reaction": self.no_reaction,
+            "frame_mean": {str(k): v for k, v in self.frame_mean.items()},
+            "frames": self.frames, "late_frames": self.late_frames,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "MinigameRollup":
+        rollup = cls()
+        rollup.attempts = data["attempts"]
+        rollup.successes = data["successes"]
+        rollup.scores = Counter({int(k): v for k, v in data["scores"].items()})
+        rollup.reaction = Counter({int(k): v for k, v in data["reaction"].items()})
+        rollup.no_reaction = data["no_reaction"]
+        rollup.frame_mean = Counter({int(k): v for k, v in data["frame_mean"].items()})
+        rollup.frames = data["frames"]
+        rollup.late_frames = data["late_frames"]
+        return rollup
+
+
+class Rollup:
+    def __init__(self):
+        self.minigames: Dict[str, MinigameRollup] = {}
+        self.sessions = 0
+        self.session_total = 0
+        self.cabinets = Counter()
+        self.skipped = 0  # lines that were not valid records
+
+    def add(self, record: dict) -> None:
+        kind = record.get("type")
+        if kind == "attempt":
+            minigame = str(record.get("minigame"))
+            stats = self.minigames.get(minigame)
+            if stats is None:
+                stats = self.minigames[minigame] = MinigameRollup()
+            stats.add(record)
+        elif kind == "session":
+            self.sessions += 1
+            self.session_total += int(record.get("total") or 0)
+        else:
+            self.skipped += 1
+            return
+        self.cabinets[str(record.get("cabinet"))] += 1
+
+    def merge(self, other: "Rollup") -> None:
+        for minigame, stats in other.minigames.items():
+            self.minigames.setdefault(minigame, MinigameRollup()).merge(stats)
+        self.sessions += other.sessions
+        self.session_total += other.session_total
+        self.cabinets.update(other.cabinets)
+        self.skipped += other.skipped
+
+    def to_dict(self) -> dict:
+        return {"minigames": {k: v.to_dict() for k, v in self.minigames.items()},
+                "sessions": self.sessions, "session_total": self.session_total,
+                "cabinets": dict(self.cabinets), "skipped": self.skipped}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Rollup":
+        rollup = cls()
+        rollup.minigames = {k: MinigameRollup.from_dict(v) for k, v in data["minigames"].items()}
+        rollup.sessions = data["sessions"]
+        rollup.session_total = data["session_total"]
+        rollup.cabinets = Counter(data["cabinets"])
+        rollup.skipped = data["skipped"]
+        return rollup
+
+
+def percentile(hist: Counter, q: float, bucket: float = 1.0) -> Optional[float]:
+    """Value at quantile ``q`` of a bucketed histogram (bucket start), None if empty."""
+    total = sum(hist.values())
+    if not total:
+        return None
+    rank = q * (total - 1)
+    seen = 0
+    for key in sorted(hist):
+        seen += hist[key]
+        if seen > rank:
+            return key * bucket
+    return max(hist) * bucket
+
+
+def iter_segments(directories) -> Iterator[str]:
+    for directory in directories:
+        for dirpath, _dirs, files in os.walk(directory):
+            for name in sorted(files):
+                if name.endswith(SEGMENT_SUFFIX):
+                    yield os.path.abspath(os.path.join(dirpath, name))
+
+
+def read_segment(path: str) -> "tuple[Rollup, bool]":
+    """Roll up one segment in a single pass; False when it ends with a truncated member."""
+    rollup = Rollup()
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    rollup.skipped += 1
+                    continue
+                rollup.add(record)
+    except (EOFError, OSError, zlib.error):
+        # Being written or copied: keep what was read, read it again next run
+        return rollup, False
+    return rollup, True
+
+
+def load_checkpoint(path: str) -> dict:
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != CHECKPOINT_VERSION:
+        return {}
+    return data.get("segments", {})
+
+
+def save_checkpoint(path: str, segments: dict) -> None:
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"version": CHECKPOINT_VERSION, "segments": segments}, f, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
+def aggregate(directories, checkpoint_path: Optional[str] = None, rebuild: bool = False):
+    """Return (total rollup, segments read, segments reused from the checkpoint)."""
+    previous = {} if rebuild or not checkpoint_path else load_checkpoint(checkpoint_path)
+    segments = {}
+    total = Rollup()
+    read = reused = 0
+    for path in iter_segments(directories):
+        size = os.path.getsize(path)
+        entry = previous.get(path)
+        if entry is not None and entry["size"] == size:
+            rollup = Rollup.from_dict(entry["rollup"])
+            reused += 1
+        else:
+            rollup, complete = read_segment(path)
+            read += 1
+            if complete:
+                entry = {"size": size, "rollup": rollup.to_dict()}
+            else:
+                entry = None
+        if entry is not None:
+            segments[path] = entry
+        total.merge(rollup)
+    if checkpoint_path:
+        save_checkpoint(checkpoint_path, segments)
+    return total, read, reused
+
+
+def _fmt(value, digits=0) -> str:
+    return "-" if value is None else f"{value:.{digits}f}"
+
+
+def print_report(total: Rollup, histogram: bool = False) -> None:
+    print(f"{'minigame':<16}{'attempts':>9}{'win %':>7}{'score':>7}{'p50':>5}{'p90':>5}"
+          f"{'react p50':>11}{'p90':>7}{'p99':>7}{'frame p50':>11}{'late %':>8}")
+    for name in sorted(total.minigames):
+        s = total.minigames[name]
+        scores = sum(k * v for k, v in s.scores.items()) / max(1, sum(s.scores.values()))
+        print(f"{name:<16}{s.attempts:>9}{100.0 * s.successes / max(1, s.attempts):>7.1f}{scores:>7.1f}"
+              f"{_fmt(percentile(s.scores, 0.5)):>5}{_fmt(percentile(s.scores, 0.9)):>5}"
+              f"{_fmt(percentile(s.reaction, 0.5, REACTION_BUCKET_MS)):>9}ms"
+              f"{_fmt(percentile(s.reaction, 0.9, REACTION_BUCKET_MS)):>7}"
+              f"{_fmt(percentile(s.reaction, 0.99, REACTION_BUCKET_MS)):>7}"
+              f"{_fmt(percentile(s.frame_mean, 0.5, FRAME_BUCKET_MS), 1):>9}ms"
+              f"{100.0 * s.late_frames / max(1, s.frames):>8.2f}")
+        if histogram:
+            bins = [sum(v for k, v in s.scores.items() if lo <= k < lo + 10) for lo in range(0, 100, 10)]
+            bins[-1] += s.scores.get(100, 0)
+            print("    scores " + " ".join(f"{lo}-{lo + 9 if lo < 90 else 100}:{n}" for lo, n in zip(range(0, 100, 10), bins)))
+    mean_total = total.session_total / total.sessions if total.sessions else 0.0
+    print(f"{total.sessions} sessions (mean total {mean_total:.1f}) from {len(total.cabinets)} cabinets"
+          + (f", {total.skipped} unreadable lines" if total.skipped else ""))
+
+
+def main(argv) -> int:
+    parser = argparse.ArgumentParser(prog="python -m game.aggregate", description=__doc__.split("\n\n")[0])
+    parser.add_argument("directories", nargs="*", metavar="DIR", help="segment directories (default: telemetry/)")
+    parser.add_argument("--checkpoint", help=f"rollup checkpoint (default: DIR/{CHECKPOINT_NAME})")
+    parser.add_argument("--rebuild", action="store_true", help="ignore the checkpoint and read every segment")
+    parser.add_argument("--histogram", action="store_true", help="print score histograms (10-point bins)")
+    parser.add_argument("--json", action="store_true", help="print the merged rollup as JSON")
+    args = parser.parse_args(argv)
+
+    directories = args.directories or [get_telemetry_dir()]
+    checkpoint = args.checkpoint or os.path.join(directories[0], CHECKPOINT_NAME)
+    if not os.path.isdir(os.path.dirname(os.path.abspath(checkpoint))):
+        print(f"no telemetry in {directories[0]}")
+        return 1
+    total, read, reused = aggregate(directories, checkpoint, args.rebuild)
+    if args.json:
+        json.dump(total.to_dict(), sys.stdout, indent=1)
+        print()
+    else:
+        print_report(total, args.histogram)
+        print(f"segments: {read} read, {reused} from checkpoint {checkpoint}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,53 @@
+"""Texture atlases: several small images baked into one file.
+
+``shelf_pack`` places rectangles row by row (tallest first) and is used
+by ``python -m game.bake``; ``load_atlas`` opens and decodes a baked
+atlas once and hands out subsurfaces keyed by logical image name.
+"""
+import os
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pygame
+
+from . import manifest as asset_manifest
+from .config import BAKED_DIR
+
+
+def shelf_pack(sizes: Sequence[Tuple[int, int]], max_width: int = 2048, padding: int = 1):
+    """Pack (w, h) sizes into shelves of at most ``max_width`` pixels.
+
+    Returns (atlas_w, atlas_h, rects) with rects in the order of ``sizes``.
+    """
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    rects: List[Optional[pygame.Rect]] = [None] * len(sizes)
+    x = y = shelf_h = atlas_w = 0
+    for i in order:
+        w, h = sizes[i]
+        if x > 0 and x + w > max_width:
+            y += shelf_h + padding
+            x = shelf_h = 0
+        rects[i] = pygame.Rect(x, y, w, h)
+        x += w + padding
+        shelf_h = max(shelf_h, h)
+        atlas_w = max(atlas_w, x - padding)
+    return atlas_w, y + shelf_h, rects
+
+
+_ATLAS_CACHE: Dict[str, Dict[str, pygame.Surface]] = {}
+
+
+def load_atlas(group: str) -> Optional[Dict[str, pygame.Surface]]:
+    """Subsurfaces of a baked atlas by logical image name, or None if not baked.
+
+    The atlas file is opened and decoded once per process.
+    """
+    if group in _ATLAS_CACHE:
+        return _ATLAS_CACHE[group]
+    manifest = asset_manifest.get_manifest()
+    entry = manifest.get("atlases", {}).get(group) if manifest else None
+    if entry is None:
+        return None
+    sheet = pygame.image.load(os.path.join(BAKED_DIR, entry["file"])).convert_alpha()
+    images = {name: sheet.subsurface(pygame.Rect(r)) for name, r in entry["rects"].items()}
+    _ATLAS_CACHE[group] = images
+    return images
@@ -0,0 +1,150 @@
+"""Offline asset baking.
+
+Pre-scales the images under assets/images to the sizes the scenes ask
+``load_image`` for, packs image groups into atlases and writes
+assets/baked/manifest.json (dimensions, byte sizes, sha256 and logical
+names of every source, variant and atlas).
+
+Usage:
+    python -m game.bake          # bake everything
+    python -m game.bake --check  # report sources changed since the last bake
+"""
+import fnmatch
+import hashlib
+import json
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from .config import BAKED_DIR, IMG_DIR, SND_DIR
+from .atlas import shelf_pack
+from .manifest import MANIFEST_VERSION, get_manifest_path, image_name, variant_key
+
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".gif")
+
+ATLAS_MAX_WIDTH = 2048
+
+
+def image_variants():
+    """(logical name pattern, max_w, max_h): mirrors the load_image calls of the scenes."""
+    from .minigames.comic.scene import ComicScene
+    from .minigames.timeline_middle.scene import TimelineMiddleScene
+    return [
+        ("tree.png", 400, 500),          # NewtonAppleScene
+        ("newton.png", 100, 100),
+        ("apple.png", 30, 30),
+        ("trophy.png", 40, 40),          # UsernameScene
+        ("croix.png", 40, 40),
+        ("timeline/iphone/*", TimelineMiddleScene.CARD_W - 24, 120),
+        ("comic/*", *ComicScene.tile_image_size()),
+    ]
+
+
+# atlas group → logical name pattern (uses the pattern's variant size)
+ATLAS_GROUPS = {
+    "iphone": "timeline/iphone/*",
+    "comic": "comic/*",
+}
+
+
+def _file_info(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    return {"bytes": len(data), "sha256": hashlib.sha256(data).hexdigest()}
+
+
+def _walk(root, extensions=None):
+    for dirpath, _dirs, files in os.walk(root):
+        if os.path.abspath(dirpath).startswith(os.path.abspath(BAKED_DIR)):
+            continue
+        for fname in sorted(files):
+            if extensions is None or fname.lower().endswith(extensions):
+                yield os.path.join(dirpath, fname)
+
+
+def bake():
+    from .utils import fit_size
+
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    manifest = {"version": MANIFEST_VERSION, "images": {}, "variants": {}, "atlases": {}, "sounds": {}}
+    sources = {}
+    for path in _walk(IMG_DIR, IMAGE_EXTENSIONS):
+        name = image_name(path)
+        img = pygame.image.load(path)
+        entry = _file_info(path)
+        entry.update(width=img.get_width(), height=img.get_height())
+        manifest["images"][name] = entry
+        sources[name] = img
+
+    scaled = {}
+    for pattern, max_w, max_h in image_variants():
+        for name in fnmatch.filter(sources, pattern):
+            img = sources[name].convert_alpha()
+            size = fit_size(img.get_size(), max_w, max_h)
+            if size != img.get_size():
+                img = pygame.transform.smoothscale(img, size)
+            scaled.setdefault(pattern, {})[name] = img
+            stem = os.path.splitext(name)[0]
+            rel = f"{stem}@{max_w}x{max_h}.png"
+            out = os.path.join(BAKED_DIR, *rel.split("/"))
+            os.makedirs(os.path.dirname(out), exist_ok=True)
+            pygame.image.save(img, out)
+            entry = _file_info(out)
+            entry.update(file=rel, source=name, width=size[0], height=size[1])
+            manifest["variants"][variant_key(name, max_w, max_h)] = entry
+
+    for group, pattern in ATLAS_GROUPS.items():
+        images = scaled.get(pattern, {})
+        if not images:
+            continue
+        names = sorted(images)
+        atlas_w, atlas_h, rects = shelf_pack([images[n].get_size() for n in names], ATLAS_MAX_WIDTH)
+        sheet = pygame.Surface((atlas_w, atlas_h), pygame.SRCALPHA)
+        sheet.blits([(images[n], r) for n, r in zip(names, rects)], doreturn=False)
+        rel = f"atlas/{group}.png"
+        out = os.path.join(BAKED_DIR, "atlas", f"{group}.png")
+        os.makedirs(os.path.dirname(out), exist_ok=True)
+        pygame.image.save(sheet, out)
+        entry = _file_info(out)
+        entry.update(file=rel, width=atlas_w, height=atlas_h,
+                     rects={n: list(r) for n, r in zip(names, rects)})
+        manifest["atlases"][group] = entry
+
+    for path in _walk(SND_DIR):
+        manifest["sounds"][os.path.relpath(path, SND_DIR).replace(os.sep, "/")] = _file_info(path)
+
+    os.makedirs(BAKED_DIR, exist_ok=True)
+    with open(get_manifest_path(), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, ensure_ascii=False, sort_keys=True)
+    print(f"{get_manifest_path()}: {len(manifest['images'])} images, {len(manifest['variants'])} variants, "
+          f"{len(manifest['atlases'])} atlases, {len(manifest['sounds'])} sounds")
+    return manifest
+
+
+def check() -> int:
+    try:
+        with open(get_manifest_path(), encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        print("no manifest: run python -m game.bake")
+        return 1
+    stale = []
+    current = {image_name(p): p for p in _walk(IMG_DIR, IMAGE_EXTENSIONS)}
+    for name in sorted(set(current) | set(manifest["images"])):
+        entry = manifest["images"].get(name)
+        if name not in current or entry is None or _file_info(current[name])["sha256"] != entry["sha256"]:
+            stale.append(name)
+    for name in stale:
+        print(f"stale: {name}")
+    return 1 if stale else 0
+
+
+if __name__ == "__main__":
+    if "--check" in sys.argv[1:]:
+        sys.exit(check())
+    bake()
@@ -0,0 +1,490 @@
+"""Headless micro-benchmarks.
+
+Usage: python -m game.bench NAME [ARGS...]   (python -m game.bench lists them)
+"""
+import os
+import sys
+import time
+from typing import Callable, Dict
+
+# Benchmarks run without a window or audio device unless told otherwise
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+_BENCHMARKS: Dict[str, Callable] = {}
+
+
+def register_benchmark(name: str):
+    def wrap(fn):
+        _BENCHMARKS[name] = fn
+        return fn
+    return wrap
+
+
+def _time_frames(game, scene, frames, dt=1 / 120):
+    """Run update+draw like Game.run does and return ms per frame."""
+    start = time.perf_counter()
+    for _ in range(frames):
+        scene.update(dt)
+        scene.draw(game.game_surface)
+        game.last_drawn_scene = scene
+    return (time.perf_counter() - start) * 1000.0 / frames
+
+
+@register_benchmark("scenegraph")
+def bench_scenegraph(frames: str = "600"):
+    """Dirty-rect (retained) vs full repaint for the SpriteScene minigames."""
+    from .core import Game
+    from .input import ACTION_PRESS, Action
+    from .minigames.newton_apple.scene import NewtonAppleScene
+    from .minigames.comic.scene import ComicScene
+
+    frames = int(frames)
+    game = Game()
+    print(f"{'scene':<18}{'phase':<10}{'full repaint':>14}{'dirty rects':>14}")
+    for scene_cls in (NewtonAppleScene, ComicScene):
+        results = {}
+        for retained in (False, True):
+            scene = scene_cls(game)
+            scene.retained = retained
+            moving = _time_frames(game, scene, frames)
+            scene.handle_action(Action(ACTION_PRESS))
+            stopped = _time_frames(game, scene, frames)
+            results[retained] = (moving, stopped)
+        for i, phase in enumerate(("moving", "stopped")):
+            print(f"{scene_cls.__name__:<18}{phase:<10}{results[False][i]:>11.3f} ms{results[True][i]:>11.3f} ms")
+
+
+@register_benchmark("present")
+def bench_present(frames: str = "120"):
+    """Software scale+flip vs SDL2 Renderer streaming texture at 1080p and 4K."""
+    import pygame
+    from .config import WIDTH, HEIGHT
+    from .present import PRESENTERS
+
+    frames = int(frames)
+    pygame.display.init()
+    frame_surface = pygame.Surface((WIDTH, HEIGHT))
+    frame_surface.fill((0, 0, 170))
+    print(f"{'window':<12}" + "".join(f"{name:>14}" for name in PRESENTERS))
+    for size in ((1920, 1080), (3840, 2160)):
+        row = f"{size[0]}x{size[1]:<7}"
+        for name, cls in PRESENTERS.items():
+            # Software renderer: representative of a GPU-less cabinet
+            presenter = cls(size) if name == "software" else cls(size, accelerated=0)
+            start = time.perf_counter()
+            for _ in range(frames):
+                presenter.present(frame_surface)
+            row += f"{(time.perf_counter() - start) * 1000.0 / frames:>11.3f} ms"
+            if hasattr(presenter, "close"):
+                presenter.close()
+            pygame.display.quit()
+            pygame.display.init()
+        print(row)
+
+
+@register_benchmark("pacing")
+def bench_pacing(seconds: str = "3"):
+    """CPU time per second on a static screen (UsernameScene), FPS ticking vs idle wait."""
+    from .core import Game
+    from .pacing import MODE_ACTIVE, MODE_IDLE
+    from .scenes.username import UsernameScene
+
+    seconds = float(seconds)
+    game = Game()
+    game.push_scene(UsernameScene(game, on_submit=lambda name: None))
+    print(f"{'pacing':<10}{'frames/s':>10}{'cpu ms/s':>12}")
+    for enabled, mode in ((False, MODE_ACTIVE), (True, MODE_IDLE)):
+        game.pacer.enabled = enabled
+        game.frame()
+        game.pacer.reset_stats()
+        frames = 0
+        end = time.perf_counter() + seconds
+        while time.perf_counter() < end:
+            game.frame()
+            frames += 1
+        label = "idle" if enabled else "fps"
+        print(f"{label:<10}{frames / seconds:>10.1f}{game.pacer.cpu_ms_per_second(mode):>12.1f}")
+
+
+@register_benchmark("jitter")
+def bench_jitter(frames: str = "600"):
+    """Frame interval jitter at FPS: Clock.tick vs perf_counter_ns pacer (sleep only / sleep + spin)."""
+    from collections import Counter
+    import pygame
+    from .config import FPS, PACING_SPIN_US
+    from .pacing import JITTER_BUCKET_US, FramePacer, jitter_percentile
+
+    frames = int(frames)
+    period = round(1e9 / FPS)
+    print(f"{FPS} FPS, period {period / 1000:.0f} us")
+    print(f"{'pacer':<22}{'p50 us':>9}{'p99 us':>9}{'max us':>9}{'cpu ms/s':>10}")
+
+    def clock_tick():
+        clock = pygame.time.Clock()
+        hist = Counter()
+        clock.tick(FPS)
+        last = time.perf_counter_ns()
+        cpu, wall = time.process_time(), time.perf_counter()
+        for _ in range(frames):
+            clock.tick(FPS)
+            now = time.perf_counter_ns()
+            hist[abs(now - last - period) // (JITTER_BUCKET_US * 1000)] += 1
+            last = now
+        return hist, (time.process_time() - cpu) * 1000.0 / (time.perf_counter() - wall)
+
+    def paced(spin_us):
+        def run():
+            pacer = FramePacer(pygame.time.Clock(), spin_us=spin_us)
+            pacer.wait(True)
+            pacer.reset_stats()
+            for _ in range(frames):
+                pacer.wait(True)
+            pacer.wait(True)  # account the last frame
+            return pacer.jitter, pacer.cpu_ms_per_second("active")
+        return run
+
+    for label, run in (("Clock.tick", clock_tick), ("pacer, sleep only", paced(0)),
+                       (f"pacer, spin {PACING_SPIN_US} us", paced(PACING_SPIN_US))):
+        hist, cpu = run()
+        worst = (max(hist) + 1) * JITTER_BUCKET_US
+        print(f"{label:<22}{jitter_percentile(hist, 0.5):>9}{jitter_percentile(hist, 0.99):>9}{worst:>9}{cpu:>10.1f}")
+
+
+@register_benchmark("leaderboard")
+def bench_leaderboard(entries: str = "1000000", frames: str = "600"):
+    """Full leaderboard on a large table: load time and frame time while scrolling (paged view)."""
+    import random
+    import tempfile
+    import pygame
+    from .core import Game
+    from .leaderboard import LeaderboardEntry, load_entries, save_entries, set_data_dir
+    from .scenes.leaderboard import LeaderboardScene
+
+    entries, frames = int(entries), int(frames)
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory(prefix="bench-") as data_dir:
+        set_data_dir(data_dir)
+        try:
+            scores = sorted((rng.randint(0, 500) for _ in range(entries)), reverse=True)
+            save_entries([LeaderboardEntry(f"joueur{i}", score) for i, score in enumerate(scores)])
+            start = time.perf_counter()
+            load_entries()
+            print(f"{entries} entries, load_entries: {(time.perf_counter() - start) * 1000.0:.0f} ms")
+            game = Game()
+            start = time.perf_counter()
+            scene = LeaderboardScene(game, "joueur0", scores[entries // 2], highlight_rank=entries // 2 + 1)
+            print(f"LeaderboardScene(): {(time.perf_counter() - start) * 1000.0:.1f} ms")
+            game.push_scene(scene)
+            # Scroll down held, then jump around: Page Down, End, Home
+            keys = {0: pygame.K_DOWN, frames // 2: pygame.K_PAGEDOWN, 2 * frames // 3: pygame.K_END,
+                    5 * frames // 6: pygame.K_HOME}
+            times = []
+            for i in range(frames):
+                if i in keys:
+                    if i:
+                        scene.handle_event(pygame.event.Event(pygame.KEYUP, key=pygame.K_DOWN))
+                    scene.handle_event(pygame.event.Event(pygame.KEYDOWN, key=keys[i]))
+                start = time.perf_counter()
+                scene.update(1 / 120)
+                scene.draw(game.game_surface)
+                times.append((time.perf_counter() - start) * 1000.0)
+            times.sort()
+            print(f"frames: p50 {times[len(times) // 2]:.2f} ms, p99 {times[int(len(times) * 0.99)]:.2f} ms, "
+                  f"max {times[-1]:.2f} ms; {scene.pages.count()} rows indexed, complete={scene.pages.complete}")
+            game.telemetry.close()
+        finally:
+            set_data_dir(None)
+
+
+@register_benchmark("players")
+def bench_players(entries: str = "1000000", players: str = "50000", lookups: str = "1000"):
+    """Personal best lookup on a large table: player index vs scanning load_entries()."""
+    import random
+    import tempfile
+    from .leaderboard import (LeaderboardEntry, PlayerIndex, load_entries, normalize_username, save_entries,
+                              set_data_dir)
+
+    entries, players, lookups = int(entries), int(players), int(lookups)
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory(prefix="bench-") as data_dir:
+        set_data_dir(data_dir)
+        try:
+            rows = [LeaderboardEntry(f"joueur{rng.randrange(players)}", rng.randint(0, 500)) for _ in range(entries)]
+            rows.sort(key=lambda e: (-e.score, e.username.lower()))
+            save_entries(rows)
+            names = [f"joueur{rng.randrange(players)}" for _ in range(lookups)]
+
+            index = PlayerIndex()
+            calls, worst = 0, 0.0
+            start = time.perf_counter()
+            while True:
+                step = time.perf_counter()
+                done = index.load()
+                worst = max(worst, time.perf_counter() - step)
+                calls += 1
+                if done:
+                    break
+            print(f"{entries} entries, {players} players: index built in {calls} calls "
+                  f"({(time.perf_counter() - start) * 1000.0:.0f} ms total, {worst * 1000.0:.1f} ms max per call)")
+
+            start = time.perf_counter()
+            for name in names:
+                index.get(name)
+                index.prefix(name[:-1], 3)
+            indexed = (time.perf_counter() - start) * 1e6 / lookups
+
+            start = time.perf_counter()
+            for name in names[:3]:
+                key = normalize_username(name)
+                table = load_entries()
+                mine = [e.score for e in table if normalize_username(e.username) == key]
+                best = max(mine)
+                1 + sum(e.score > best for e in table)
+            scanned = (time.perf_counter() - start) * 1e6 / 3
+            print(f"lookup (best, attempts, rank + prefix): {indexed:.1f} us indexed, {scanned / 1000.0:.0f} ms scanning")
+        finally:
+            set_data_dir(None)
+
+
+@register_benchmark("quality")
+def bench_quality(frames: str = "30"):
+    """Startup micro-benchmark of each quality tier, at the default window size and 1080p."""
+    from .config import QUALITY_HEADROOM, WIDTH, HEIGHT
+    from .core import Game
+    from .quality import TIERS, benchmark_tier
+
+    frames = int(frames)
+    game = Game()
+    for size in ((WIDTH, HEIGHT), (1920, 1080)):
+        game.presenter.resize(size)
+        print(f"window {size[0]}x{size[1]}")
+        print(f"{'tier':<10}{'fps':>6}{'frame':>12}{'budget':>12}  fits ({QUALITY_HEADROOM:.0%} of budget)")
+        for tier in TIERS:
+            cost = benchmark_tier(game.presenter, tier, frames)
+            budget = 1000.0 / tier.fps
+            print(f"{tier.name:<10}{tier.fps:>6}{cost:>9.2f} ms{budget:>9.2f} ms  {cost <= QUALITY_HEADROOM * budget}")
+    game.telemetry.close()
+
+
+@register_benchmark("scoring")
+def bench_scoring(count: str = "10000000"):
+    """Scalar vs batch scoring kernels (evaluations per second)."""
+    import random
+    from . import scoring
+
+    count = int(count)
+    rng = random.Random(0)
+    sample = 100_000
+    cursors = [rng.random() for _ in range(sample)]
+    ys = [rng.uniform(100, 400) for _ in range(sample)]
+    years = [rng.randint(1900, 2030) for _ in range(sample)]
+    dists = [rng.randint(-6, 6) for _ in range(sample)]
+    # (name, scalar kernel, batch kernel, rule parameters, stop values)
+    kernels = [
+        ("center_word", scoring.center_word_score, scoring.center_word_score_batch, (700, 2), cursors),
+        ("newton", scoring.newton_score, scoring.newton_score_batch, (250, 100, 400, 2), ys),
+        ("timeline", scoring.timeline_score, scoring.timeline_score_batch, (2015.0, 2007, 2023), years),
+        ("life", scoring.life_score, scoring.life_score_batch, (1960, 1900, 2030), years),
+        ("comic", scoring.comic_score, scoring.comic_score_batch, (), dists),
+    ]
+    if scoring.np is not None:
+        print(f"numpy {scoring.np.__version__}, batch of {count}")
+    else:
+        print(f"numpy not installed: batch forms fall back to the scalar loop, batch of {sample}")
+        count = sample
+    print(f"{'kernel':<14}{'scalar':>14}{'batch':>14}")
+    for name, scalar, batch, args, values in kernels:
+        start = time.perf_counter()
+        expected = [scalar(v, *args) for v in values]
+        scalar_rate = sample / (time.perf_counter() - start)
+        scores, successes = batch(values, *args)
+        # Same rule: batch results must match the scalar form exactly
+        scalar_scores = [e[-2] for e in expected]
+        scalar_successes = [e[-1] for e in expected]
+        assert [int(s) for s in scores] == scalar_scores and [bool(s) for s in successes] == scalar_successes, name
+        data = values * (count // sample) if scoring.np is None else scoring.np.resize(scoring.np.asarray(values), count)
+        start = time.perf_counter()
+        batch(data, *args)
+        batch_rate = count / (time.perf_counter() - start)
+        print(f"{name:<14}{scalar_rate / 1e6:>9.2f} M/s{batch_rate / 1e6:>9.2f} M/s")
+
+
+@register_benchmark("telemetry")
+def bench_telemetry(attempts: str = "100000"):
+    """Render-thread cost of one attempt record (writer thread flushing to a temp dir)."""
+    import tempfile
+    from types import SimpleNamespace
+    from .telemetry import SEGMENT_SUFFIX, Attempt, Telemetry
+
+    attempts = int(attempts)
+    scene = SimpleNamespace(stop_error=3.5)
+    with tempfile.TemporaryDirectory() as directory:
+        # Buffer sized for the whole run: measures emission, not drops
+        telemetry = Telemetry(enabled=True, directory=directory, buffer_records=attempts)
+        for i in range(attempts):
+            attempt = Attempt("bench", "newton_apple", i % 3 + 1)
+            for _ in range(8):
+                attempt.frames.add(1 / 120)
+            attempt.mark_stopped()
+            telemetry.record_attempt(attempt, scene, 87, True)
+        start = time.perf_counter()
+        telemetry.close()
+        flush = time.perf_counter() - start
+        segments = [f for f in os.listdir(directory) if f.endswith(SEGMENT_SUFFIX)]
+        size = sum(os.path.getsize(os.path.join(directory, f)) for f in segments)
+    print(f"record_attempt: {telemetry.emit_cost_us():.2f} us/attempt on the render thread")
+    print(f"writer: {attempts} records in {len(segments)} segments, {size / attempts:.1f} bytes/record gzipped, "
+          f"final flush {flush * 1000:.0f} ms (off the render thread), dropped {telemetry.dropped}")
+
+
+@register_benchmark("memory")
+def bench_memory(sessions: str = "6", frames: str = "30"):
+    """Per-scene memory report and leak check over repeated headless sessions (3 attempts per minigame)."""
+    from .core import Game
+    from .input import ACTION_PRESS, Action
+    from .memory import MemoryMonitor
+    from .minigames import get_all_minigames
+
+    game = Game()
+    game.memory = MemoryMonitor(enabled=True)
+    for _ in range(int(sessions)):
+        for mg in get_all_minigames():
+            for _ in range(game.max_attempts_per_game):
+                scene = mg.create_initial_scene(game)
+                game.push_scene(scene)
+                _time_frames(game, scene, int(frames))
+                # Stop, then continue: the minigame pops itself
+                scene.handle_action(Action(ACTION_PRESS))
+                _time_frames(game, scene, 1)
+                scene.handle_action(Action(ACTION_PRESS))
+                del scene
+                game.memory.collect_popped()
+        game.memory.end_session(game.scenes)
+    game.telemetry.close()
+    print(f"traced baseline per session: {', '.join(f'{b / 1024:.0f} KiB' for b in game.memory.history)}")
+    print("no leak flagged" if not game.memory.leaks else f"{len(game.memory.leaks)} leak flags")
+
+
+@register_benchmark("pool")
+def bench_pool(rounds: str = "5"):
+    """Transition cost per minigame: new scene vs warm scene from the pool (reset)."""
+    from .core import Game
+    from .minigames import get_all_minigames, get_scene_pool
+
+    rounds = int(rounds)
+    game = Game()
+    pool = get_scene_pool()
+    print(f"{'minigame':<18}{'new scene':>12}{'pooled':>12}{'pool size':>12}")
+    for mg in get_all_minigames():
+        mg.create_initial_scene(game)  # first load fills the shared caches
+        start = time.perf_counter()
+        for _ in range(rounds):
+            scene = mg.create_initial_scene(game)
+        created = (time.perf_counter() - start) * 1000.0 / rounds
+        start = time.perf_counter()
+        for _ in range(rounds):
+            mg.release_scene(scene)
+            scene = mg.acquire_scene(game)
+        pooled = (time.perf_counter() - start) * 1000.0 / rounds
+        mg.release_scene(scene)
+        print(f"{mg.id:<18}{created:>9.2f} ms{pooled:>9.2f} ms{pool.bytes / 1048576:>8.1f} MiB")
+    print(f"pool: {len(pool)} idle scenes, {pool.bytes / 1048576:.1f} MiB (cap {pool.max_bytes / 1048576:.0f} MiB), "
+          f"{pool.hits} hits, {pool.misses} misses, {pool.evictions} evictions")
+    game.telemetry.close()
+
+
+@register_benchmark("pipeline")
+def bench_pipeline(frames: str = "300", width: str = "1920", height: str = "1080"):
+    """Direct vs pipelined compositing + scaling: frames/s and draw-to-flip latency."""
+    from .core import Game
+    from .minigames.newton_apple.scene import NewtonAppleScene
+    from .present import PipelinedPresenter
+
+    frames = int(frames)
+    game = Game()
+    game.presenter.resize((int(width), int(height)))
+    direct = game.presenter
+    scene = NewtonAppleScene(game)
+    scene.retained = False  # full repaint: main-thread work of the imperative scenes
+    print(f"{os.cpu_count()} cpu, window {width}x{height}")
+    print(f"{'path':<12}{'frames/s':>10}{'latency':>12}{'compositor':>14}")
+    for pipelined in (False, True):
+        game.presenter = PipelinedPresenter(direct) if pipelined else direct
+        latency = 0.0
+        start = time.perf_counter()
+        for _ in range(frames):
+            if scene.state != "falling":
+                scene.reset()
+            scene.update(1 / 120)
+            scene.draw(game.game_surface)
+            drawn = time.perf_counter()
+            game.present_frame()
+            latency += time.perf_counter() - drawn
+        if pipelined:
+            game.presenter.sync()
+        elapsed = time.perf_counter() - start
+        if pipelined:
+            latency_ms, worker = game.presenter.latency_ms(), f"{game.presenter.worker_ms():>11.2f} ms"
+            game.presenter.close()
+        else:
+            latency_ms, worker = latency * 1000.0 / frames, f"{'(main)':>14}"
+        print(f"{'pipelined' if pipelined else 'direct':<12}{frames / elapsed:>10.1f}{latency_ms:>9.2f} ms{worker}")
+    game.telemetry.close()
+
+
+@register_benchmark("capture")
+def bench_capture(frames: str = "600"):
+    """Frame time with capture off, raw and PNG on a moving scene, paced at FPS (writer included)."""
+    import tempfile
+    from .config import FPS
+    from .minigames.newton_apple.scene import NewtonAppleScene
+    from .core import Game
+
+    frames = int(frames)
+    game = Game()
+    scene = NewtonAppleScene(game)
+    print(f"{'capture':<10}{'ms/frame':>10}{'vs off':>10}{'copy':>10}{'writer':>11}{'captured':>10}"
+          f"{'dropped':>9}{'written':>9}")
+    baseline = None
+    for fmt in (None, "raw", "png"):
+        with tempfile.TemporaryDirectory() as directory:
+            if fmt:
+                game.start_capture(directory, fmt=fmt)
+            busy = 0.0
+            for _ in range(frames):
+                start = time.perf_counter()
+                if scene.state != "falling":
+                    scene.reset()
+                scene.update(1 / FPS)
+                scene.draw(game.game_surface)
+                game.present_frame()
+                spent = time.perf_counter() - start
+                busy += spent
+                # Real-time pacing: the writer gets the rest of each frame budget
+                time.sleep(max(0.0, 1 / FPS - spent))
+            frame_ms = busy * 1000.0 / frames
+            if fmt:
+                capture = game.capture
+                game.stop_capture()
+                print(f"{fmt:<10}{frame_ms:>10.3f}{frame_ms - baseline:>+10.3f}{capture.overhead_us():>7.1f} us"
+                      f"{capture.writer_ms():>8.2f} ms{capture.captured:>10}{capture.dropped:>9}{capture.written:>9}")
+            else:
+                baseline = frame_ms
+                print(f"{'off':<10}{frame_ms:>10.3f}{'-':>10}")
+    game.telemetry.close()
+
+
+def main(argv) -> int:
+    if not argv or argv[0] not in _BENCHMARKS:
+        print(__doc__.strip())
+        for name, fn in _BENCHMARKS.items():
+            print(f"  {name:<14}{(fn.__doc__ or '').strip()}")
+        return 2
+    _BENCHMARKS[argv[0]](*argv[1:])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,212 @@
+"""Non-blocking gameplay capture.
+
+Each composed WIDTH×HEIGHT frame is copied through the surface buffer
+interface (``Surface.get_buffer``, one memcpy of pitch × height bytes)
+into a slot of a preallocated ring. A background thread writes the
+filled slots out:
+- ``raw``: every frame appended to ``frames.raw`` (pixel layout in
+  ``capture.json``: size, pitch, bit size and masks), cheap enough to
+  keep up at full rate;
+- ``png``: one ``frame-NNNNNN.png`` per frame, much slower: frames are
+  dropped when the ring is full.
+
+``index.csv`` maps each written frame to its time and to the running
+attempt (session, minigame, attempt number) so a disputed score can be
+found in the recording. The render thread never waits: when no slot is
+free the frame is dropped and counted. The copy into the ring is timed
+per frame (``overhead_us``) and the writer's CPU time per written frame
+(``writer_ms``): the writer runs in the same process, so on a busy or
+single-core machine its work shows up in the frame time too. ``python -m
+game.bench capture`` reports the frame time against capture off.
+
+Recordings go to ``<data dir>/captures/<date-time>/`` (``-2``, ``-3``...
+when another started the same second; CAPTURE_ENABLED in config.py, or
+``Game.start_capture``).
+"""
+import csv
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+from collections import deque
+from typing import Optional
+
+import pygame
+
+from .config import CAPTURE_EVERY, CAPTURE_FORMAT, CAPTURE_RING_FRAMES
+from .leaderboard import get_data_dir
+
+
+CAPTURE_DIRNAME = "captures"
+CAPTURE_FORMATS = ("raw", "png")
+PNG_COMPRESSION = 1  # zlib level: speed over size, the writer must keep up
+
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+def encode_png(surface: pygame.Surface, rgb: Optional[bytearray] = None) -> bytes:
+    """RGB PNG of ``surface`` (any pixel format).
+
+    The channel shuffle and the pitch are handled by one blit into a packed
+    24-bit RGB buffer (``rgb``, width × height × 3 bytes, reusable), the
+    compression by zlib; both release the GIL (``pygame.image.save`` holds
+    it for the whole encode and would stall the render thread). Python only
+    slices the rows to put the filter byte in front of each.
+    """
+    width, height = surface.get_size()
+    row = width * 3
+    if rgb is None:
+        rgb = bytearray(row * height)
+    pygame.image.frombuffer(rgb, (width, height), "RGB").blit(surface, (0, 0))
+    pixels = memoryview(rgb)
+    # Filter type 0 (None) in front of each row; the join is the only copy
+    parts = [b"\x00"] * (2 * height)
+    parts[1::2] = [pixels[y * row:(y + 1) * row] for y in range(height)]
+    scanlines = b"".join(parts)
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (b"\x89PNG\r\n\x1a\n" + _png_chunk(b"IHDR", header)
+            + _png_chunk(b"IDAT", zlib.compress(scanlines, PNG_COMPRESSION)) + _png_chunk(b"IEND", b""))
+
+
+def get_capture_dir() -> str:
+    return os.path.join(get_data_dir(), CAPTURE_DIRNAME)
+
+
+def _new_capture_dir() -> str:
+    """``<date-time>`` under the capture dir, with a suffix when a capture already started that second."""
+    base = os.path.join(get_capture_dir(), time.strftime("%Y%m%d-%H%M%S"))
+    os.makedirs(get_capture_dir(), exist_ok=True)
+    path, n = base, 1
+    while True:
+        try:
+            os.mkdir(path)
+            return path
+        except FileExistsError:
+            n += 1
+            path = f"{base}-{n}"
+
+
+class FrameCapture:
+    def __init__(self, surface: pygame.Surface, directory: Optional[str] = None, fmt: str = CAPTURE_FORMAT,
+                 ring_frames: int = CAPTURE_RING_FRAMES, every: int = CAPTURE_EVERY):
+        """``surface`` gives the layout of the frames to capture (size, pitch, pixel format)."""
+        if fmt not in CAPTURE_FORMATS:
+            raise ValueError(f"capture format must be one of {CAPTURE_FORMATS}, got {fmt!r}")
+        self.fmt = fmt
+        self.every = max(1, every)
+        self.size = surface.get_size()
+        self.pitch = surface.get_pitch()
+        self.bitsize = surface.get_bitsize()
+        self.masks = surface.get_masks()
+        self.frame_bytes = self.pitch * self.size[1]
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            self.directory = directory
+        else:
+            self.directory = _new_capture_dir()
+        # Ring of preallocated frame buffers: free slot indices and filled
+        # (slot, frame number, time, tag) entries; deque append/popleft are atomic
+        self.slots = [bytearray(self.frame_bytes) for _ in range(max(2, ring_frames))]
+        self._free = deque(range(len(self.slots)))
+        self._filled: deque = deque()
+        self._wake = threading.Event()
+        self._stopping = False
+        # Render-thread counters
+        self.frame = 0  # frames offered
+        self.captured = 0
+        self.dropped = 0
+        self.overhead_ns = 0
+        # Writer-thread counters
+        self.written = 0
+        self.bytes_written = 0
+        self.writer_cpu = 0.0  # thread CPU seconds
+        with open(os.path.join(self.directory, "capture.json"), "w", encoding="utf-8") as f:
+            json.dump({"format": fmt, "size": list(self.size), "pitch": self.pitch, "bitsize": self.bitsize,
+                       "masks": list(self.masks), "every": self.every}, f, indent=1)
+        self._thread = threading.Thread(target=self._run, name="capture-writer", daemon=True)
+        self._thread.start()
+
+    def add(self, surface: pygame.Surface, tag=("", "", "")) -> None:
+        """Copy one composed frame into the ring (render thread; never blocks)."""
+        start = time.perf_counter_ns()
+        self.frame += 1
+        if self.frame % self.every == 0:
+            try:
+                slot = self._free.popleft()
+            except IndexError:
+                self.dropped += 1  # the writer is behind: skip this frame
+            else:
+                self.slots[slot][:] = surface.get_buffer()
+                self._filled.append((slot, self.frame, time.time(), tag))
+                self.captured += 1
+                self._wake.set()
+        self.overhead_ns += time.perf_counter_ns() - start
+
+    def overhead_us(self) -> float:
+        """Mean render-thread copy per offered frame, in microseconds (the writer's work not included)."""
+        return self.overhead_ns / self.frame / 1000.0 if self.frame else 0.0
+
+    def writer_ms(self) -> float:
+        """Mean writer-thread CPU per written frame, in milliseconds."""
+        return self.writer_cpu * 1000.0 / self.written if self.written else 0.0
+
+    def report(self, delta_ms: Optional[float] = None) -> str:
+        """Counters and costs; ``delta_ms``: measured frame time minus the same run with capture off."""
+        cost = f"{self.overhead_us():.1f} us/frame copy, {self.writer_ms():.2f} ms/frame writer cpu"
+        if delta_ms is not None:
+            cost += f", {delta_ms:+.2f} ms/frame vs capture off"
+        return (f"capture: {self.captured}/{self.frame} frames captured, {self.dropped} dropped, "
+                f"{self.written} written ({self.bytes_written / 1048576:.1f} MiB {self.fmt}), "
+                f"{cost} -> {self.directory}")
+
+    def close(self) -> None:
+        self._stopping = True
+        self._wake.set()
+        self._thread.join()
+
+    # ---------------- writer thread ----------------
+    def _run(self) -> None:
+        raw = open(os.path.join(self.directory, "frames.raw"), "ab") if self.fmt == "raw" else None
+        image = rgb = None
+        if self.fmt == "png":
+            # Same size and format as the captured surface, hence the same pitch: a slot is a plain copy
+            image = pygame.Surface(self.size, 0, self.bitsize, self.masks)
+            rgb = bytearray(self.size[0] * self.size[1] * 3)
+        with open(os.path.join(self.directory, "index.csv"), "a", newline="", encoding="utf-8") as f:
+            index = csv.writer(f)
+            if f.tell() == 0:
+                index.writerow(["frame", "time", "session", "minigame", "attempt", "file"])
+            while True:
+                self._wake.wait(0.5)
+                self._wake.clear()
+                while self._filled:
+                    start = time.thread_time()
+                    slot, number, stamp, tag = self._filled.popleft()
+                    if raw is not None:
+                        # Offset in the file: appending to a recording made earlier stays right
+                        name = f"frames.raw@{raw.tell()}"
+                        raw.write(self.slots[slot])
+                        size = self.frame_bytes
+                    else:
+                        name = f"frame-{number:06d}.png"
+                        path = os.path.join(self.directory, name)
+                        # Straight into the surface's pixels (BufferProxy.write takes only bytes: a copy more);
+                        # the view is released before the blit, which needs the surface unlocked
+                        with memoryview(image.get_buffer()) as pixels:
+                            pixels[:] = self.slots[slot]
+                        with open(path, "wb") as png:
+                            png.write(encode_png(image, rgb))
+                        size = os.path.getsize(path)
+                    self._free.append(slot)
+                    index.writerow([number, f"{stamp:.3f}", *tag, name])
+                    self.written += 1
+                    self.bytes_written += size
+                    self.writer_cpu += time.thread_time() - start
+                if self._stopping and not self._filled:
+                    break
+        if raw is not None:
+            raw.close()
@@ -13,6 +13,15 @@ GAME_HEIGHT = 540 - (FRAME_BEZEL_THICKNESS * 2) - FRAME_CHIN_HEIGHT
 # Total window size (including frame)
 WIDTH, HEIGHT = 960, 540
 FPS = 120
+IDLE_PACING = True  # block on input instead of ticking at FPS while nothing animates
+IDLE_WAIT_MS = 250  # longest idle wait before a frame is drawn anyway
+PACING_REPORT_INTERVAL = 0  # seconds between "pacing: … ms cpu/s" lines (0: off)
+PACING_SPIN_US = 1500  # end of each frame wait spun on perf_counter_ns instead of slept (0: sleep only, less CPU)
+PACING_FIXED_STEP = False  # update scenes in whole 1/FPS steps (catching up) instead of once with the measured dt
+PACING_MAX_STEPS = 5  # fixed step: most updates per frame, older lag is dropped
+PRESENT_BACKEND = "software"  # "software" (transform.scale + flip) or "renderer" (SDL2 Renderer/Texture)
+PRESENT_PIPELINE = False  # composite + scale on a worker thread (one frame of extra latency)
+CRT_TRANSITION_MS = 500  # CRT shutdown / power-on effect around the leaderboard
 TITLE = "Game Jam 2025 – Vous n'êtes pas au centre de l'histoire (Pygame)"
 
 # --- Palette de couleurs ---
@@ -30,6 +39,8 @@ IMG_DIR = os.path.join(ASSETS_DIR, "images")
 SND_DIR = os.path.join(ASSETS_DIR, "sounds")
 FONT_DIR = os.path.join(ASSETS_DIR, "fonts")
 FONT_PATH = os.path.join(FONT_DIR, "VCR_OSD_MONO.ttf")
+PACK_DIR = os.path.join(ASSETS_DIR, "packs")
+BAKED_DIR = os.path.join(ASSETS_DIR, "baked")  # output of python -m game.bake
 
 # Shared messages
 NOT_CENTER_MSG = "Vous n'êtes pas au centre de l'histoire."
@@ -52,4 +63,101 @@ CELEBRITIES = [
 # Life Midpoint minigame settings
 LIFE_KEY_SPEED = 220  # pixels per second left/right
 LIFE_TIMELINE_PADDING_YEARS = 20  # extra years before birth and after death
-LIFE_TARGET_KIND = "midpoint"  # "random" or "midpoint" (for fallback/testing)
\ No newline at end of file
+LIFE_TARGET_KIND = "midpoint"  # "random" or "midpoint" (for fallback/testing)
+LIFE_PACK = "celebrities"  # content pack name (see game/content.py)
+# No-repeat sampling: draws are stratified by era (birth year) then lifespan band
+LIFE_ERAS = [
+    ("Antiquité", -5000, 499),
+    ("Moyen Âge", 500, 1491),
+    ("Époque moderne", 1492, 1788),
+    ("Époque contemporaine", 1789, 9999),
+]
+LIFE_LIFESPAN_BANDS = [(0, 49), (50, 79), (80, 200)]  # years lived
+LIFE_SEEN_BITS = 1 << 16  # per-player Bloom filter size (8 KiB per generation)
+LIFE_SEEN_HASHES = 4
+LIFE_SAMPLE_PROBES = 32  # max candidates examined per draw
+
+# Timeline minigame settings
+TIMELINE_PACK = "iphone"
+TIMELINE_PREFETCH_CARDS = 2  # cards decoded ahead of the right edge
+TIMELINE_SPRITE_CACHE = 12  # LRU size; must exceed visible + prefetch cards
+# Leaderboard view (full table, read page by page from leaderboard.csv)
+LEADERBOARD_PAGE_ROWS = 64  # rows per page read from the file
+LEADERBOARD_PAGE_CACHE = 8  # pages kept in memory
+LEADERBOARD_SCAN_BYTES = 64 << 10  # file bytes indexed per frame until the row count is known
+LEADERBOARD_ROW_CACHE = 48  # rendered row surfaces kept (a few screens)
+LEADERBOARD_SCROLL_RATE = 14.0  # smooth scroll: fraction of the remaining distance covered per second
+LEADERBOARD_HOLD_ROWS = 25.0  # rows per second while ↑/↓ is held
+PLAYER_SUGGESTIONS = 3  # known players listed under the name being typed
+PLAYER_INDEX_BYTES = 32 << 10  # file bytes parsed per frame while the player index loads
+
+# Bot simulator (python -m game.simulate)
+# Timing error of a synthetic player relative to the ideal press, in seconds:
+# ex-Gaussian (mu, sigma, tau) = normal(mu, sigma) + exponential(tau), the usual
+# fit of human reaction times (the exponential tail = late presses)
+SIM_PLAYERS = {
+    "novice": (0.020, 0.090, 0.080),
+    "casual": (0.000, 0.060, 0.045),
+    "expert": (-0.005, 0.030, 0.015),
+}
+SIM_WARMUP = (0.3, 1.5)  # seconds spent reading the screen before aiming at the next crossing
+SIM_MAX_SECONDS = 20.0  # attempts still running after this are pressed anyway
+SIM_CHUNK = 2000  # attempts per worker task
+
+# Telemetry (per-attempt records, see game/telemetry.py)
+TELEMETRY_ENABLED = True
+TELEMETRY_CABINET = None  # name written in each record (None: host name)
+TELEMETRY_BUFFER_RECORDS = 4096  # in-memory records before the oldest are dropped
+TELEMETRY_FLUSH_SECONDS = 2.0  # writer thread period
+TELEMETRY_SEGMENT_RECORDS = 5000  # records per .jsonl.gz segment before rotating
+
+# Memory accounting (diagnostic, see game/memory.py; slows the game down)
+MEMORY_TRACKING = False
+MEMORY_TRACE_FRAMES = 16  # traceback depth kept per allocation (attribution to scenes)
+MEMORY_LEAK_SESSIONS = 5  # sessions over which a steadily rising baseline is flagged
+MEMORY_LEAK_BYTES = 1 << 20  # minimal growth over that window
+
+# Scene pool: finished minigame scenes are reset and reused by the next attempt/session
+SCENE_POOL_BYTES = 48 << 20  # cap on the surfaces of idle scenes (0: no pooling)
+SCENE_POOL_PER_GAME = 1  # idle scenes kept per minigame
+
+# Gameplay capture (see game/capture.py)
+CAPTURE_ENABLED = False
+CAPTURE_FORMAT = "raw"  # "raw" (frames.raw + capture.json) or "png" (one file per frame, drops more)
+CAPTURE_RING_FRAMES = 16  # preallocated frame buffers (2 MiB each at 960×540)
+CAPTURE_EVERY = 1  # capture one frame out of N
+
+# Soak test (python -m game.soak): endless scripted sessions, fails on drift
+SOAK_MINUTES = 10.0  # default run length
+SOAK_SAMPLE_SESSIONS = 5  # sessions between two samples
+SOAK_WARMUP_SAMPLES = 3  # first samples ignored (caches and scene pool filling up)
+SOAK_MIN_SAMPLES = 6  # samples needed after warm-up to judge drift
+SOAK_PLAYERS = 40  # distinct bot names, reused across sessions
+# metric → (relative, absolute) growth allowed between the first and last third of the samples
+SOAK_DRIFT = {
+    "rss_mib": (0.10, 8.0),
+    "objects": (0.05, 2000),
+    "surfaces": (0.05, 8),
+    "frame_p50_ms": (0.50, 1.0),
+    "frame_p99_ms": (1.00, 4.0),
+    "session_end_ms": (1.00, 20.0),
+    "leaderboard_bytes_per_session": (0.10, 2.0),
+}
+
+# Quality tiers (see game/quality.py), best first; knobs read by the pacer, loaders and scenes
+QUALITY_TIERS = {
+    "high": {"fps": FPS, "smoothscale": True, "scanline_alpha": 30, "comic_shadows": True, "comic_pulse": True,
+             "crt_ms": CRT_TRANSITION_MS},
+    "medium": {"fps": 90, "smoothscale": True, "scanline_alpha": 30, "comic_shadows": False, "comic_pulse": True,
+               "crt_ms": 250},
+    "low": {"fps": 60, "smoothscale": False, "scanline_alpha": 0, "comic_shadows": False, "comic_pulse": False,
+            "crt_ms": 0},
+}
+QUALITY_TIER = "auto"  # "auto" (startup micro-benchmark) or a tier name
+QUALITY_BENCH_FRAMES = 12  # frames drawn per tier by the startup benchmark
+QUALITY_HEADROOM = 0.5  # startup: a tier fits when its frame takes at most this share of its budget
+QUALITY_GOVERNOR = True  # step the tier down / up while playing
+QUALITY_WINDOW = 120  # animated frames per governor measurement (median work time)
+QUALITY_DOWN = 0.85  # step down when the median exceeds this share of the budget
+QUALITY_UP = 0.4  # step up when it stays under this share of the better tier's budget...
+QUALITY_UP_WINDOWS = 5  # ...for this many windows in a row
@@ -0,0 +1,245 @@
+"""Content packs: precompiled, memory-mappable minigame datasets.
+
+A pack is a single binary file holding items sorted by year with their
+precomputed midpoints, plus a blob of UTF-8 labels and image names.
+Records are fixed-size, so ``ContentPack.item(i)`` is a single
+``struct.unpack_from`` on the mapped file, whatever the pack size.
+
+Layout (little-endian):
+    header   MAGIC, version, kind, count, year_min, year_max, midpoint,
+             records offset, blob offset
+    records  count × (start, end, midpoint, label off/len, image off/len)
+    blob     UTF-8 strings referenced by the records
+
+Build packs with ``python -m game.content build``.
+"""
+import csv
+import mmap
+import os
+import random
+import struct
+import sys
+from typing import Iterable, List, NamedTuple, Sequence, Tuple
+
+from .config import PACK_DIR, CELEBRITIES
+
+
+MAGIC = b"GJCP"
+VERSION = 1
+
+KIND_TIMELINE = 0  # one year per item (products, events)
+KIND_LIFE = 1      # start/end span per item (people)
+
+_HEADER = struct.Struct("<4sHHIiidII")
+_RECORD = struct.Struct("<iidIIII")
+
+
+class ContentItem(NamedTuple):
+    start: int
+    end: int
+    midpoint: float
+    label: str
+    image: str  # logical image name relative to IMG_DIR, "" if none
+
+
+def compile_pack(kind: int, items: Iterable[Tuple[int, int, str, str]]) -> bytes:
+    """Compile (start, end, label, image) tuples into pack bytes."""
+    rows = sorted(items, key=lambda it: (it[0], it[1], it[2]))
+    blob = bytearray()
+    records = bytearray()
+    for start, end, label, image in rows:
+        label_b = label.encode("utf-8")
+        image_b = (image or "").encode("utf-8")
+        label_off = len(blob)
+        blob += label_b
+        image_off = len(blob)
+        blob += image_b
+        records += _RECORD.pack(int(start), int(end), (start + end) / 2.0,
+                                label_off, len(label_b), image_off, len(image_b))
+    if rows:
+        year_min = min(r[0] for r in rows)
+        year_max = max(r[1] for r in rows)
+    else:
+        year_min = year_max = 0
+    records_off = _HEADER.size
+    blob_off = records_off + len(records)
+    header = _HEADER.pack(MAGIC, VERSION, kind, len(rows), year_min, year_max,
+                          (year_min + year_max) / 2.0, records_off, blob_off)
+    return header + bytes(records) + bytes(blob)
+
+
+class ContentPack:
+    """Read-only view over pack bytes (an mmap or an in-memory buffer)."""
+
+    def __init__(self, buffer, source: str = "<memory>"):
+        self._buf = buffer
+        self.source = source
+        (magic, version, self.kind, self.count, self.year_min, self.year_max,
+         self.midpoint, self._records_off, self._blob_off) = _HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{source}: not a v{VERSION} content pack")
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _string(self, off: int, length: int) -> str:
+        if length == 0:
+            return ""
+        base = self._blob_off + off
+        return bytes(self._buf[base:base + length]).decode("utf-8")
+
+    def start_year(self, index: int) -> int:
+        return struct.unpack_from("<i", self._buf, self._records_off + index * _RECORD.size)[0]
+
+    def item(self, index: int) -> ContentItem:
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        start, end, mid, l_off, l_len, i_off, i_len = _RECORD.unpack_from(
+            self._buf, self._records_off + index * _RECORD.size)
+        return ContentItem(start, end, mid, self._string(l_off, l_len), self._string(i_off, i_len))
+
+    def __getitem__(self, index: int) -> ContentItem:
+        return self.item(index)
+
+    def __iter__(self):
+        for i in range(self.count):
+            yield self.item(i)
+
+    def sample(self, rng=random) -> ContentItem:
+        """Pick a uniformly random item in O(1)."""
+        return self.item(rng.randrange(self.count))
+
+    def index_range(self, year_from: int, year_to: int) -> Tuple[int, int]:
+        """Half-open index range of items whose start year is in [year_from, year_to].
+
+        Items are sorted by start year, so an era is a contiguous slice.
+        """
+        lo, hi = 0, self.count
+        while lo < hi:
+            m = (lo + hi) // 2
+            if self.start_year(m) < year_from:
+                lo = m + 1
+            else:
+                hi = m
+        first = lo
+        hi = self.count
+        while lo < hi:
+            m = (lo + hi) // 2
+            if self.start_year(m) <= year_to:
+                lo = m + 1
+            else:
+                hi = m
+        return first, lo
+
+    def close(self) -> None:
+        if isinstance(self._buf, mmap.mmap):
+            self._buf.close()
+
+
+def open_pack(path: str) -> ContentPack:
+    """Memory-map a pack file; nothing is parsed beyond the header."""
+    with open(path, "rb") as f:
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return ContentPack(buf, source=path)
+
+
+def write_pack(path: str, kind: int, items: Iterable[Tuple[int, int, str, str]]) -> int:
+    data = compile_pack(kind, items)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+    return len(data)
+
+
+# ------------------ Built-in packs ------------------
+
+def _iphone_items():
+    from .minigames.timeline_middle.data import IPHONE_MODELS
+    for year, label in IPHONE_MODELS:
+        yield year, year, label, f"timeline/iphone/{label}.png"
+
+
+def _celebrity_items():
+    for name, birth, death in CELEBRITIES:
+        yield birth, death, name, ""
+
+
+BUILTIN_PACKS = {
+    # name → (kind, item source)
+    "iphone": (KIND_TIMELINE, _iphone_items),
+    "celebrities": (KIND_LIFE, _celebrity_items),
+}
+
+_PACK_CACHE = {}
+
+
+def get_pack_path(name: str) -> str:
+    return os.path.join(PACK_DIR, f"{name}.pack")
+
+
+def load_pack(name: str) -> ContentPack:
+    """Return the named pack, memory-mapped from PACK_DIR when built,
+    otherwise compiled in memory from the built-in Python lists."""
+    if name in _PACK_CACHE:
+        return _PACK_CACHE[name]
+    path = get_pack_path(name)
+    if os.path.isfile(path):
+        pack = open_pack(path)
+    elif name in BUILTIN_PACKS:
+        kind, source = BUILTIN_PACKS[name]
+        pack = ContentPack(compile_pack(kind, source()), source=f"<builtin:{name}>")
+    else:
+        raise FileNotFoundError(path)
+    _PACK_CACHE[name] = pack
+    return pack
+
+
+def read_csv_items(path: str) -> List[Tuple[int, int, str, str]]:
+    """Read ``label,start[,end[,image]]`` rows (header line optional)."""
+    items = []
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.reader(f):
+            if len(row) < 2:
+                continue
+            try:
+                start = int(row[1])
+                end = int(row[2]) if len(row) > 2 and row[2] else start
+            except ValueError:
+                continue  # header or malformed line
+            image = row[3] if len(row) > 3 else ""
+            items.append((start, end, row[0], image))
+    return items
+
+
+def _main(argv: Sequence[str]) -> int:
+    usage = ("usage: python -m game.content build [NAME ...]\n"
+             "       python -m game.content build-csv FILE.csv OUT.pack [timeline|life]\n"
+             "       python -m game.content info FILE.pack")
+    if not argv:
+        print(usage)
+        return 2
+    cmd, args = argv[0], list(argv[1:])
+    if cmd == "build":
+        for name in args or list(BUILTIN_PACKS):
+            kind, source = BUILTIN_PACKS[name]
+            size = write_pack(get_pack_path(name), kind, source())
+            print(f"{get_pack_path(name)}: {size} bytes")
+    elif cmd == "build-csv" and len(args) >= 2:
+        kind = KIND_LIFE if (args[2:] or ["timeline"])[0] == "life" else KIND_TIMELINE
+        items = read_csv_items(args[0])
+        size = write_pack(args[1], kind, items)
+        print(f"{args[1]}: {len(items)} items, {size} bytes")
+    elif cmd == "info" and args:
+        pack = open_pack(args[0])
+        print(f"{args[0]}: kind={pack.kind} count={pack.count} "
+              f"years={pack.year_min}..{pack.year_max} midpoint={pack.midpoint}")
+    else:
+        print(usage)
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(_main(sys.argv[1:]))
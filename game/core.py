@@ -1,31 +1,59 @@
 import sys
+import time
 import pygame
-from .config import WIDTH, HEIGHT, FPS, TITLE, GAME_WIDTH, GAME_HEIGHT
-from .utils import draw_80s_computer_frame, get_game_area_rect, create_scanlines, get_music_path
+from .capture import FrameCapture
+from .config import (WIDTH, HEIGHT, TITLE, GAME_WIDTH, GAME_HEIGHT, PRESENT_BACKEND, PRESENT_PIPELINE, CAPTURE_ENABLED,
+                     CRT_TRANSITION_MS)
+from .input import InputSystem, Action
+from .memory import MemoryMonitor
+from .pacing import MODE_ACTIVE, FramePacer
+from .present import PipelinedPresenter, compose_frame, create_presenter
+from .quality import QualityGovernor
+from .telemetry import Attempt, Telemetry
+from .utils import create_scanlines, get_music_path
 
 
 class Scene:
+    # Raw event types read by handle_event (None: every event) and input
+    # actions read by handle_action; SDL only queues what the top scene reads
+    event_types = None
+    actions = ()
+
     def __init__(self, game):
         self.game = game
+        game.memory.on_create(self)
 
     def handle_event(self, event):
         pass
 
+    def handle_action(self, action):
+        pass
+
     def update(self, dt):
         pass
 
     def draw(self, screen):
         pass
 
+    def is_animating(self):
+        """False when the scene looks the same until the next input (lets the loop idle)."""
+        return True
+
 
 class Game:
     def __init__(self):
         pygame.init()
         pygame.display.set_caption(TITLE)
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
+        # Before any scene exists: scenes register with it on creation
+        self.memory = MemoryMonitor()
+        self.presenter = create_presenter(PRESENT_BACKEND, pipelined=PRESENT_PIPELINE)
         self.game_surface = pygame.Surface((GAME_WIDTH, GAME_HEIGHT))
         self.scanlines = create_scanlines(GAME_WIDTH, GAME_HEIGHT)
         self.clock = pygame.time.Clock()
+        self.input = InputSystem(self)
+        self.pacer = FramePacer(self.clock)
+        # Quality tier (starts at the best one; Game.run benchmarks and arms the governor)
+        self.quality = QualityGovernor(self)
 
         try:
             pygame.mixer.init()
@@ -49,14 +77,34 @@ class Game:
         self.last_minigame_success = None
         # Attempts HUD shared state (read-only for minigames)
         self.max_attempts_per_game = 3
+        # CRT effect length around the leaderboard (blocking; 0 in headless soak runs)
+        self.transition_ms = CRT_TRANSITION_MS
         self.current_attempts_left = None
+        # Scene that last drew on game_surface (lets dirty-rect scenes detect re-exposure)
+        self.last_drawn_scene = None
+        # Name of the player in the running session (None outside sessions)
+        self.current_player = None
+        # Per-attempt telemetry: the running attempt is set by SessionScene
+        self.telemetry = Telemetry()
+        self.attempt = None
+        # Gameplay recording (start_capture)
+        self.capture = None
+
+    @property
+    def screen(self):
+        """Window surface for the software backend (None with the renderer backend)."""
+        return self.presenter.screen
 
     def push_scene(self, scene):
         self.scenes.append(scene)
 
     def pop_scene(self):
         if self.scenes:
-            self.scenes.pop()
+            scene = self.scenes.pop()
+            if self.last_drawn_scene is scene:
+                # Don't keep the popped scene (and its surfaces) alive until the next draw
+                self.last_drawn_scene = None
+            self.memory.on_pop(scene)
 
     def top_scene(self):
         return self.scenes[-1] if self.scenes else None
@@ -64,41 +112,108 @@ class Game:
     def quit(self):
         self.running = False
 
+    def begin_attempt(self, session: str, minigame_id: str, number: int):
+        self.attempt = Attempt(session, minigame_id, number)
+
+    def mark_attempt_stopped(self):
+        """Called by minigames when the player stops (reaction time of the attempt)."""
+        if self.attempt is not None:
+            self.attempt.mark_stopped()
+
     def complete_minigame(self, score: int, success: bool):
         """Called by a minigame when it ends to submit a score and close itself."""
+        self.telemetry.record_attempt(self.attempt, self.top_scene(), score, success)
+        self.attempt = None
         self.last_minigame_score = score
         self.last_minigame_success = success
         self.pop_scene()
 
+    def start_capture(self, directory=None, **options):
+        """Record every composed frame (see game.capture); ``options``: fmt, ring_frames, every."""
+        if isinstance(self.presenter, PipelinedPresenter):
+            self.capture = FrameCapture(self.presenter.frame_surface, directory, **options)
+            self.presenter.capture = self.capture
+        else:
+            self.capture = FrameCapture(pygame.Surface((WIDTH, HEIGHT)), directory, **options)
+
+    def stop_capture(self):
+        if self.capture is None:
+            return
+        if isinstance(self.presenter, PipelinedPresenter):
+            self.presenter.sync()
+            self.presenter.capture = None
+        self.capture.close()
+        print(self.capture.report())
+        self.capture = None
+
+    def capture_tag(self):
+        """Running attempt written next to each captured frame: (session, minigame, attempt)."""
+        if self.attempt is None:
+            return ("", "", "")
+        return (self.attempt.session, self.attempt.minigame, self.attempt.number)
+
+    def apply_quality(self, tier):
+        """Frame rate, scanlines and CRT transition of a quality tier; the top scene is repainted."""
+        self.pacer.fps = tier.fps
+        self.transition_ms = tier.crt_ms
+        self.scanlines = None
+        if tier.scanline_alpha:
+            self.scanlines = create_scanlines(GAME_WIDTH, GAME_HEIGHT, alpha=tier.scanline_alpha)
+        scene = self.top_scene()
+        if scene is not None and hasattr(scene, "invalidate"):
+            scene.invalidate()
+
     def run(self):
+        self.quality.start()
+        if CAPTURE_ENABLED:
+            self.start_capture()
         while self.running and self.top_scene() is not None:
-            dt = self.clock.tick(FPS) / 1000.0
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.quit()
-                elif event.type == pygame.VIDEORESIZE:
-                    self.screen = pygame.display.set_mode(event.size, pygame.RESIZABLE)
-                else:
-                    scene = self.top_scene()
-                    if scene:
-                        scene.handle_event(event)
-            scene = self.top_scene()
-            if scene:
-                scene.update(dt)
-                # Draw game content to the game surface (smaller area)
-                scene.draw(self.game_surface)
-            
-            # Create the full frame surface
-            frame_surface = pygame.Surface((WIDTH, HEIGHT))
-            draw_80s_computer_frame(frame_surface)
-            
-            # Blit the game content into the frame
-            game_area = get_game_area_rect()
-            self.game_surface.blit(self.scanlines, (0, 0))
-            frame_surface.blit(self.game_surface, (game_area.x, game_area.y))
-            
-            # Scale the frame surface to the screen size and blit it
-            self.screen.blit(pygame.transform.scale(frame_surface, self.screen.get_rect().size), (0, 0))
-            pygame.display.flip()
+            self.frame()
+        self.stop_capture()
+        self.telemetry.close()
+        if hasattr(self.presenter, "close"):
+            self.presenter.close()
         pygame.quit()
         sys.exit(0)
+
+    def frame(self):
+        """One iteration of the main loop: wait, dispatch input, update, draw, present."""
+        self.memory.collect_popped()
+        scene = self.top_scene()
+        dt, pending = self.pacer.wait(scene is None or scene.is_animating())
+        work_start = time.perf_counter()
+        if self.attempt is not None:
+            self.attempt.frames.add(dt, self.pacer.fps)
+        for item in self.input.poll(self.top_scene(), pending):
+            scene = self.top_scene()
+            if isinstance(item, Action):
+                if scene:
+                    scene.handle_action(item)
+            elif item.type in (pygame.QUIT, pygame.WINDOWCLOSE):
+                self.quit()
+            elif item.type == pygame.VIDEORESIZE:
+                self.presenter.resize(item.size)
+            elif scene and (scene.event_types is None or item.type in scene.event_types):
+                scene.handle_event(item)
+        scene = self.top_scene()
+        if scene:
+            for step in self.pacer.steps(dt):
+                scene.update(step)
+            # Draw game content to the game surface (smaller area)
+            scene.draw(self.game_surface)
+            self.last_drawn_scene = scene
+        self.present_frame()
+        if self.pacer.mode == MODE_ACTIVE:
+            self.quality.observe((time.perf_counter() - work_start) * 1000.0)
+
+    def present_frame(self):
+        """Composite the game surface into the 80s frame and show it (on the worker when pipelined)."""
+        if isinstance(self.presenter, PipelinedPresenter):
+            self.presenter.submit(self.game_surface, self.scanlines,
+                                  self.capture_tag() if self.capture is not None else None)
+            return
+        frame_surface = compose_frame(pygame.Surface((WIDTH, HEIGHT)), self.game_surface, self.scanlines)
+        if self.capture is not None:
+            self.capture.add(frame_surface, self.capture_tag())
+        # Scale the frame surface to the window and present it
+        self.presenter.present(frame_surface)
@@ -0,0 +1,123 @@
+"""Input layer: event filtering, motion coalescing and minigame actions.
+
+Each scene declares the raw event types its ``handle_event`` reads
+(``event_types``) and the actions its ``handle_action`` reads
+(``actions``). ``InputSystem`` lets SDL queue only the union of those
+(plus quit/resize) through ``pygame.event.set_allowed``, so floods the top
+scene ignores (mouse motion, window and audio device events) never reach
+Python. Mouse motion that is allowed is coalesced to one event per frame.
+
+Actions are the compact form of the inputs the minigames share:
+- ``press``: Space / Enter / mouse click (``value`` = mouse button, 0 for
+  keys; ``pos`` = click position on the game surface);
+- ``move``: held direction (←/→ or A/D) changed, ``value`` -1, 0 or +1.
+"""
+import itertools
+import weakref
+from typing import List, NamedTuple, Optional, Tuple, Union
+
+import pygame
+
+from .utils import scale_mouse_to_game_surface
+
+
+ACTION_PRESS = "press"
+ACTION_MOVE = "move"
+
+CONFIRM_KEYS = (pygame.K_SPACE, pygame.K_RETURN)
+LEFT_KEYS = (pygame.K_LEFT, pygame.K_a)
+RIGHT_KEYS = (pygame.K_RIGHT, pygame.K_d)
+PRESS_BUTTONS = (1, 2, 3)  # wheel "buttons" (4+) don't count as clicks
+
+# Raw event types each action is built from
+ACTION_SOURCES = {
+    ACTION_PRESS: (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN),
+    ACTION_MOVE: (pygame.KEYDOWN, pygame.KEYUP),
+}
+
+# Handled by the Game loop itself, whatever the scene (WINDOWCLOSE: the renderer
+# backend has a second, hidden window, so closing the visible one sends no QUIT)
+ALWAYS_ALLOWED = (pygame.QUIT, pygame.WINDOWCLOSE, pygame.VIDEORESIZE, pygame.WINDOWRESIZED, pygame.WINDOWSIZECHANGED)
+
+
+class Action(NamedTuple):
+    kind: str
+    value: int = 0
+    pos: Optional[Tuple[int, int]] = None
+
+
+def allowed_event_types(scene) -> Optional[set]:
+    """Union of the event types ``scene`` declares, None when it reads everything."""
+    event_types = getattr(scene, "event_types", None)
+    if event_types is None:
+        return None
+    allowed = set(ALWAYS_ALLOWED) | set(event_types)
+    for kind in getattr(scene, "actions", ()):
+        allowed.update(ACTION_SOURCES[kind])
+    return allowed
+
+
+class InputSystem:
+    def __init__(self, game):
+        self.game = game
+        self._scene = None
+        self._actions = ()
+        self._left = self._right = False
+
+    def configure(self, scene) -> None:
+        """Restrict the SDL queue to what ``scene`` reads (no-op while it stays on top)."""
+        if scene is not None and self._scene is not None and self._scene() is scene:
+            return
+        # Weak: a popped scene must not be kept alive until the next poll
+        self._scene = weakref.ref(scene) if scene is not None else None
+        self._actions = getattr(scene, "actions", ())
+        # Key state of the previous scene doesn't carry over
+        self._left = self._right = False
+        allowed = allowed_event_types(scene)
+        if allowed is None:
+            pygame.event.set_allowed(None)
+        else:
+            pygame.event.set_blocked(None)
+            pygame.event.set_allowed(sorted(allowed))
+
+    def poll(self, scene, pending=()) -> List[Union[pygame.event.Event, Action]]:
+        """This frame's queue: raw events for ``handle_event`` and Actions, in order.
+
+        ``pending`` are events already taken off the SDL queue (idle wait).
+        """
+        self.configure(scene)
+        queue: List[Union[pygame.event.Event, Action]] = []
+        motion = None
+        for event in itertools.chain(pending, pygame.event.get()):
+            if event.type == pygame.MOUSEMOTION:
+                # Coalesce: last position, accumulated relative motion
+                if motion is not None:
+                    rel = (motion.rel[0] + event.rel[0], motion.rel[1] + event.rel[1])
+                    event = pygame.event.Event(pygame.MOUSEMOTION, pos=event.pos, rel=rel, buttons=event.buttons)
+                motion = event
+                continue
+            queue.append(event)
+            queue.extend(self.translate(event))
+        if motion is not None:
+            queue.append(motion)
+        return queue
+
+    def translate(self, event) -> List[Action]:
+        """Actions produced by one raw event for the current scene."""
+        actions = []
+        if ACTION_PRESS in self._actions:
+            if event.type == pygame.KEYDOWN and event.key in CONFIRM_KEYS:
+                actions.append(Action(ACTION_PRESS))
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button in PRESS_BUTTONS:
+                screen_rect = pygame.Rect((0, 0), self.game.presenter.get_size())
+                actions.append(Action(ACTION_PRESS, event.button, scale_mouse_to_game_surface(event.pos, screen_rect)))
+        if ACTION_MOVE in self._actions and event.type in (pygame.KEYDOWN, pygame.KEYUP):
+            held = event.type == pygame.KEYDOWN
+            if event.key in LEFT_KEYS:
+                self._left = held
+            elif event.key in RIGHT_KEYS:
+                self._right = held
+            else:
+                return actions
+            actions.append(Action(ACTION_MOVE, int(self._right) - int(self._left)))
+        return actions
@@ -1,18 +1,47 @@
 import csv
 import os
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+from .config import LEADERBOARD_PAGE_CACHE, LEADERBOARD_PAGE_ROWS, LEADERBOARD_SCAN_BYTES, PLAYER_INDEX_BYTES
 
 
 LEADERBOARD_FILENAME = "leaderboard.csv"
 
 
+# Set by set_data_dir (soak runs): None keeps the project root
+_data_dir = None
+
+
 def _get_storage_path() -> str:
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    data_dir = os.path.join(base_dir, "..")
+    return os.path.join(get_data_dir(), LEADERBOARD_FILENAME)
+
+
+def get_data_dir() -> str:
+    """Directory holding the leaderboard and other per-player files."""
+    if _data_dir is not None:
+        return _data_dir
     # Store at project root alongside game_jam.py for simplicity
-    root_dir = os.path.abspath(os.path.join(base_dir, ".."))
-    return os.path.join(root_dir, LEADERBOARD_FILENAME)
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.abspath(os.path.join(base_dir, ".."))
+
+
+def set_data_dir(path) -> None:
+    """Redirect the leaderboard, telemetry and per-player files (None: project root).
+
+    Takes effect for files opened afterwards: call it before creating the Game.
+    """
+    global _data_dir
+    _data_dir = os.path.abspath(path) if path is not None else None
+
+
+def normalize_username(username: str) -> str:
+    """Case-insensitive, filename-safe key for a player name."""
+    key = "".join(ch for ch in username.strip().lower() if ch.isalnum())
+    return key or "anonyme"
 
 
 @dataclass
@@ -50,22 +79,275 @@ def save_entries(entries: List[LeaderboardEntry]) -> None:
             writer.writerow([e.username, e.score])
 
 
+def _sort_key(entry: LeaderboardEntry):
+    # Score desc, then username asc for stability
+    return -entry.score, entry.username.lower()
+
+
 def add_score(username: str, score: int) -> Tuple[int, List[LeaderboardEntry]]:
     """Add a score, sort descending by score, persist, and return the 1-based rank.
 
-    Returns (rank, sorted_entries).
+    Returns (rank, sorted_entries). The player index is updated in place.
     """
+    index = get_player_index()
+    index.load_all()  # from the file as it was before this score
     entries = load_entries()
     entries.append(LeaderboardEntry(username=username, score=score))
-    # Sort by score desc, then username asc for stability
-    entries.sort(key=lambda e: (-e.score, e.username.lower()))
+    entries.sort(key=_sort_key)
     save_entries(entries)
-    # Compute rank (first matching occurrence)
-    rank = 1
-    for idx, e in enumerate(entries, start=1):
-        if e.username == username and e.score == score:
-            rank = idx
-            break
+    # Rank: first row with this score and name
+    rank = bisect_left(entries, (-score, username.lower()), key=_sort_key) + 1
+    while entries[rank - 1].username != username:
+        rank += 1  # same name in another case sorts equal
+    index.add(username, score)
     return rank, entries
 
 
+def _parse_row(row: List[str]) -> Optional[LeaderboardEntry]:
+    if len(row) < 2:
+        return None
+    try:
+        return LeaderboardEntry(row[0], int(row[1]))
+    except ValueError:
+        return None
+
+
+class LeaderboardPages:
+    """The saved (sorted) leaderboard read page by page, never loaded whole.
+
+    The start offset of each row is indexed incrementally: ``scan`` reads at
+    most ``LEADERBOARD_SCAN_BYTES`` more of the file per call, so a caller
+    can spread the indexing of a huge table over frames while the rows
+    already indexed are browsable. Pages of ``page_rows`` rows are read with
+    one seek and kept in a small LRU. Unreadable rows come back as None so
+    row numbers stay ranks.
+    """
+
+    def __init__(self, path: Optional[str] = None, page_rows: int = LEADERBOARD_PAGE_ROWS,
+                 cache_pages: int = LEADERBOARD_PAGE_CACHE):
+        self.path = path or _get_storage_path()
+        self.page_rows = page_rows
+        self.cache_pages = cache_pages
+        # offsets[i]: start of row i; the last one ends the last indexed row
+        self._offsets = array("q", [0])
+        self._scanned = 0
+        self._size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        self.complete = self._size == 0
+        self._pages: "OrderedDict[int, list]" = OrderedDict()
+
+    def count(self) -> int:
+        """Rows indexed so far (the total once ``complete``)."""
+        return len(self._offsets) - 1
+
+    def scan(self, budget: int = LEADERBOARD_SCAN_BYTES) -> bool:
+        """Index up to ``budget`` more bytes; True once the whole file is indexed."""
+        if self.complete:
+            return True
+        with open(self.path, "rb") as f:
+            f.seek(self._scanned)
+            data = f.read(min(budget, self._size - self._scanned))
+        offsets = self._offsets
+        pos = data.find(b"\n")
+        while pos != -1:
+            offsets.append(self._scanned + pos + 1)
+            pos = data.find(b"\n", pos + 1)
+        self._scanned += len(data)
+        if not data or self._scanned >= self._size:
+            if offsets[-1] < self._scanned:
+                offsets.append(self._scanned)  # last row without a line break
+            self.complete = True
+        return self.complete
+
+    def page(self, number: int) -> List[Optional[LeaderboardEntry]]:
+        """Rows ``number * page_rows`` onwards (shorter at the end of what is indexed)."""
+        page = self._pages.get(number)
+        if page is not None:
+            self._pages.move_to_end(number)
+            return page
+        first = number * self.page_rows
+        last = min(first + self.page_rows, self.count())
+        if first >= last:
+            return []
+        with open(self.path, "rb") as f:
+            f.seek(self._offsets[first])
+            data = f.read(self._offsets[last] - self._offsets[first])
+        page = [_parse_row(row) for row in csv.reader(data.decode("utf-8").splitlines())]
+        if last - first == self.page_rows or self.complete:
+            # Partial pages grow as the index does: only cache final ones
+            self._pages[number] = page
+            if len(self._pages) > self.cache_pages:
+                self._pages.popitem(last=False)
+        return page
+
+    def entry(self, index: int) -> Optional[LeaderboardEntry]:
+        """Row ``index`` (rank - 1); None when unreadable or not indexed yet."""
+        page = self.page(index // self.page_rows)
+        offset = index % self.page_rows
+        return page[offset] if offset < len(page) else None
+
+
+def _file_stamp(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _key_prefix(text: str) -> str:
+    """``normalize_username`` of a name being typed (no fallback for an empty one)."""
+    return "".join(ch for ch in text.strip().lower() if ch.isalnum())
+
+
+@dataclass(frozen=True)
+class PlayerStats:
+    username: str  # spelling used for the personal best
+    best: int
+    attempts: int  # scores saved
+    best_rank: int  # current rank of the personal best, numbered like add_score and the leaderboard
+
+
+class PlayerIndex:
+    """Per-player summary of the leaderboard, keyed by ``normalize_username``.
+
+    Built from the file incrementally (``load`` parses PLAYER_INDEX_BYTES
+    more per call, so a scene can spread it over frames), then kept up to
+    date by ``add_score`` without rereading the file. The keys are kept
+    sorted for prefix lookup, every score in one sorted list and, per score,
+    the sorted lowercased names of its rows: the rank of a personal best is
+    two bisections, with the same name tie-break as ``add_score``.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or _get_storage_path()
+        # key → [username, best, attempts]
+        self._players: Dict[str, list] = {}
+        self._keys: List[str] = []
+        self._scores: List[int] = []  # ascending
+        self._names: Dict[int, List[str]] = {}  # score → lowercased names of its rows, sorted
+        # While loading: spelling → (key, lowercased), and whether the rows came sorted
+        self._spellings: Dict[str, Tuple[str, str]] = {}
+        self._descending = True
+        self._offset = 0
+        self.stamp = _file_stamp(self.path)
+        self.complete = self.stamp is None
+
+    def _count(self, username: str, score: int) -> bool:
+        """Account one saved score; True for a new player."""
+        key = normalize_username(username)
+        player = self._players.get(key)
+        if player is None:
+            self._players[key] = [username, score, 1]
+            return True
+        player[2] += 1
+        if score > player[1]:
+            player[0], player[1] = username, score
+        return False
+
+    def load(self, budget: int = PLAYER_INDEX_BYTES) -> bool:
+        """Index up to about ``budget`` more bytes of the file; True once it is all indexed."""
+        if self.complete:
+            return True
+        with open(self.path, "rb") as f:
+            f.seek(self._offset)
+            data = f.read(budget)
+            if len(data) == budget:
+                data += f.readline()  # finish the row cut by the budget
+        # Each spelling is normalized once, when first seen
+        spellings = self._spellings
+        scores = self._scores
+        names = self._names
+        # Score being read and the names of its rows
+        last = scores[-1] if scores else None
+        tied = names.get(last)
+        for row in csv.reader(data.decode("utf-8").splitlines()):
+            entry = _parse_row(row)
+            if entry is None:
+                continue
+            spelling = spellings.get(entry.username)
+            if spelling is None:
+                spelling = spellings[entry.username] = (normalize_username(entry.username), entry.username.lower())
+            key, lower = spelling
+            score = entry.score
+            if score != last:
+                if last is not None and score > last:
+                    self._descending = False
+                tied = names.get(score)
+                if tied is None:
+                    tied = names[score] = []
+                else:
+                    self._descending = False  # this score came earlier, not in one run
+                last = score
+            elif lower < tied[-1]:
+                self._descending = False
+            scores.append(score)
+            tied.append(lower)
+            player = self._players.get(key)
+            if player is None:
+                self._players[key] = [entry.username, entry.score, 1]
+            else:
+                player[2] += 1
+                if entry.score > player[1]:
+                    player[0], player[1] = entry.username, entry.score
+        self._offset += len(data)
+        if not data or self._offset >= self.stamp[0]:
+            # As saved by add_score the file is in leaderboard order: no sort, a reversal
+            if self._descending:
+                scores.reverse()
+            else:
+                scores.sort()
+                for tied in names.values():
+                    tied.sort()
+            self._spellings = {}
+            self._keys = sorted(self._players)
+            self.complete = True
+        return self.complete
+
+    def load_all(self) -> None:
+        while not self.load():
+            pass
+
+    def add(self, username: str, score: int) -> None:
+        """Account a score ``add_score`` just saved."""
+        self.load_all()
+        if self._count(username, score):
+            insort(self._keys, normalize_username(username))
+        insort(self._scores, score)
+        insort(self._names.setdefault(score, []), username.lower())
+        self.stamp = _file_stamp(self.path)
+
+    def _stats(self, key: str) -> PlayerStats:
+        username, best, attempts = self._players[key]
+        # First row of the best as add_score ranks it: higher scores, then same score with a smaller name
+        ahead = len(self._scores) - bisect_right(self._scores, best)
+        return PlayerStats(username, best, attempts, ahead + bisect_left(self._names[best], username.lower()) + 1)
+
+    def get(self, username: str) -> Optional[PlayerStats]:
+        """Stats of one player (None when unknown or not indexed yet)."""
+        key = normalize_username(username)
+        return self._stats(key) if self.complete and key in self._players else None
+
+    def prefix(self, text: str, limit: int) -> List[PlayerStats]:
+        """Up to ``limit`` players whose key starts with the typed ``text``, alphabetically."""
+        prefix = _key_prefix(text)
+        if not prefix or not self.complete:
+            return []
+        found = []
+        keys = self._keys
+        i = bisect_left(keys, prefix)
+        while i < len(keys) and len(found) < limit and keys[i].startswith(prefix):
+            found.append(self._stats(keys[i]))
+            i += 1
+        return found
+
+
+_index: Optional[PlayerIndex] = None
+
+
+def get_player_index() -> PlayerIndex:
+    """Index of the current leaderboard file, rebuilt when the file changed behind its back."""
+    global _index
+    path = _get_storage_path()
+    if _index is None or _index.path != path or (_index.complete and _index.stamp != _file_stamp(path)):
+        _index = PlayerIndex(path)
+    return _index
@@ -0,0 +1,74 @@
+"""Baked asset manifest (written by ``python -m game.bake``).
+
+The manifest lists every source image and sound with its size and
+content hash, plus pre-scaled image variants keyed by the (max_w, max_h)
+the scenes request. When present, the runtime loaders answer every
+existence check and directory listing from it instead of the filesystem.
+"""
+import json
+import os
+from typing import List, Optional
+
+from .config import BAKED_DIR, IMG_DIR
+
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+_MANIFEST = None
+_LOADED = False
+
+
+def get_manifest_path() -> str:
+    return os.path.join(BAKED_DIR, MANIFEST_NAME)
+
+
+def image_name(path: str) -> str:
+    """Logical name of an image: its path relative to IMG_DIR, with '/' separators."""
+    rel = os.path.relpath(os.path.normpath(path), os.path.normpath(IMG_DIR))
+    return rel.replace(os.sep, "/")
+
+
+def variant_key(name: str, max_w: int, max_h: int) -> str:
+    return f"{name}@{int(max_w)}x{int(max_h)}"
+
+
+def get_manifest() -> Optional[dict]:
+    """Load the manifest once; None when assets have not been baked."""
+    global _MANIFEST, _LOADED
+    if not _LOADED:
+        _LOADED = True
+        try:
+            with open(get_manifest_path(), encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == MANIFEST_VERSION:
+                _MANIFEST = data
+        except (OSError, ValueError):
+            _MANIFEST = None
+    return _MANIFEST
+
+
+def reset_manifest() -> None:
+    global _MANIFEST, _LOADED
+    _MANIFEST = None
+    _LOADED = False
+
+
+def baked_variant_path(manifest: dict, path: str, max_w: int, max_h: int) -> Optional[str]:
+    entry = manifest["variants"].get(variant_key(image_name(path), max_w, max_h))
+    return os.path.join(BAKED_DIR, entry["file"]) if entry else None
+
+
+def has_image(manifest: dict, path: str) -> bool:
+    return image_name(path) in manifest["images"]
+
+
+def has_sound(manifest: dict, filename: str) -> bool:
+    return filename in manifest["sounds"]
+
+
+def list_images(manifest: dict, folder: str) -> List[str]:
+    """Sorted file names of the images directly inside ``folder`` (relative to IMG_DIR)."""
+    prefix = folder.strip("/") + "/"
+    names = [n[len(prefix):] for n in manifest["images"] if n.startswith(prefix)]
+    return sorted(n for n in names if "/" not in n)
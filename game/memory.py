@@ -0,0 +1,235 @@
+"""Per-scene memory accounting and leak detection (diagnostic, off by default).
+
+With MEMORY_TRACKING on, ``tracemalloc`` keeps MEMORY_TRACE_FRAMES frames
+per allocation and ``MemoryMonitor``:
+- after each ``pop_scene`` (measured once the caller has let go of it)
+  prints the surface bytes (pitch × height) reachable from the popped
+  scene, the traced bytes still held compared to when its
+  ``Scene.__init__`` ran, and whether reference counting freed it or it
+  had to wait for the cyclic GC;
+- at the end of each session prints the traced bytes per scene (the most
+  recent frame of an allocation's traceback that lies in a scene module)
+  and flags growth: the post-GC baseline rising session after session by
+  more than MEMORY_LEAK_BYTES over MEMORY_LEAK_SESSIONS sessions, or
+  scenes popped during the previous session still alive (outside the
+  scene pool, which keeps some on purpose).
+
+``python -m game.bench memory`` replays sessions headless with the monitor on.
+"""
+import gc
+import os
+import tracemalloc
+import weakref
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+import pygame
+
+from .config import MEMORY_LEAK_BYTES, MEMORY_LEAK_SESSIONS, MEMORY_TRACE_FRAMES, MEMORY_TRACKING
+
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+_MINIGAMES_DIR = os.path.join(_PACKAGE_DIR, "minigames") + os.sep
+_SCENES_DIR = os.path.join(_PACKAGE_DIR, "scenes") + os.sep
+OTHER = "(other)"
+
+# Reachability walk from a scene: how deep to follow attributes and containers
+WALK_DEPTH = 6
+
+
+def format_bytes(size: Optional[float]) -> str:
+    if size is None:
+        return "?"
+    sign = "-" if size < 0 else ""
+    size = abs(size)
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024 or unit == "MiB":
+            return f"{sign}{size:.0f} {unit}" if unit == "B" else f"{sign}{size:.1f} {unit}"
+        size /= 1024.0
+
+
+def surface_bytes(surface: pygame.Surface) -> int:
+    if surface.get_parent() is not None:
+        return 0  # subsurface: the pixels belong to its parent (atlas)
+    return surface.get_pitch() * surface.get_height()
+
+
+def sound_bytes(sound: pygame.mixer.Sound) -> int:
+    init = pygame.mixer.get_init()
+    if not init:
+        return 0
+    frequency, size, channels = init
+    return int(sound.get_length() * frequency) * channels * (abs(size) // 8)
+
+
+class SceneAssets:
+    """Surfaces, sounds and fonts reachable from one scene (shared caches included)."""
+
+    __slots__ = ("surfaces", "surface_bytes", "sounds", "sound_bytes", "fonts")
+
+    def __init__(self):
+        self.surfaces = self.surface_bytes = 0
+        self.sounds = self.sound_bytes = 0
+        self.fonts = 0
+
+    def __str__(self):
+        return (f"{self.surfaces} surfaces {format_bytes(self.surface_bytes)}, "
+                f"{self.sounds} sounds {format_bytes(self.sound_bytes)}, {self.fonts} fonts")
+
+
+def scene_assets(scene) -> SceneAssets:
+    """Walk the scene's attributes (containers, widgets, sprites) without entering other scenes or the Game."""
+    from .core import Scene
+
+    assets = SceneAssets()
+    seen = {id(scene.game)}
+    stack = [(scene, 0)]
+    while stack:
+        obj, depth = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        if isinstance(obj, pygame.Surface):
+            assets.surfaces += 1
+            assets.surface_bytes += surface_bytes(obj)
+            continue
+        if isinstance(obj, pygame.mixer.Sound):
+            assets.sounds += 1
+            assets.sound_bytes += sound_bytes(obj)
+            continue
+        if isinstance(obj, pygame.font.Font):
+            assets.fonts += 1
+            continue
+        if depth >= WALK_DEPTH or isinstance(obj, (str, bytes, int, float, type)):
+            continue
+        if isinstance(obj, Scene) and obj is not scene:
+            continue
+        if isinstance(obj, dict):
+            children = obj.values()
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            children = obj
+        elif isinstance(obj, pygame.sprite.AbstractGroup):
+            children = obj.sprites()
+        elif hasattr(obj, "__dict__") and not callable(obj):
+            children = vars(obj).values()
+        else:
+            continue
+        stack.extend((child, depth + 1) for child in children)
+    return assets
+
+
+@lru_cache(maxsize=None)
+def _scene_label(filename: str) -> Optional[str]:
+    """Minigame id or scene module name owning ``filename``, None outside scene code."""
+    path = os.path.abspath(filename)
+    if path.startswith(_MINIGAMES_DIR):
+        rest = path[len(_MINIGAMES_DIR):]
+        return rest.split(os.sep, 1)[0] if os.sep in rest else None
+    if path.startswith(_SCENES_DIR):
+        return os.path.splitext(path[len(_SCENES_DIR):])[0]
+    return None
+
+
+def allocations_by_scene(snapshot: tracemalloc.Snapshot) -> Dict[str, int]:
+    """Live traced bytes keyed by the innermost scene module in each traceback."""
+    sizes: Counter = Counter()
+    for trace in snapshot.traces:
+        label = OTHER
+        for frame in reversed(trace.traceback):  # most recent call first
+            found = _scene_label(frame.filename)
+            if found is not None:
+                label = found
+                break
+        sizes[label] += trace.size
+    return dict(sizes)
+
+
+class MemoryMonitor:
+    def __init__(self, enabled: bool = MEMORY_TRACKING, frames: int = MEMORY_TRACE_FRAMES,
+                 leak_sessions: int = MEMORY_LEAK_SESSIONS, leak_bytes: int = MEMORY_LEAK_BYTES, out=print):
+        self.enabled = enabled
+        self.leak_sessions = leak_sessions
+        self.leak_bytes = leak_bytes
+        self.out = out
+        # scene → traced bytes when its Scene.__init__ ran
+        self._created = weakref.WeakKeyDictionary()
+        # (ref, label, traced at creation, assets) popped but not measured yet
+        self._popped: list = []
+        self._this_session: list = []
+        self._previous_session: list = []
+        # Post-GC traced bytes at the end of each session
+        self.history: List[int] = []
+        # Scenes parked in the scene pool: alive on purpose
+        self._pooled = weakref.WeakSet()
+        self.leaks: List[str] = []
+        if enabled and not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+
+    def on_create(self, scene) -> None:
+        if not self.enabled:
+            return
+        # Pops pending from this frame are measured before the next scene allocates
+        self.collect_popped()
+        self._created[scene] = tracemalloc.get_traced_memory()[0]
+
+    def on_pop(self, scene) -> None:
+        if not self.enabled:
+            return
+        ref = weakref.ref(scene)
+        label = type(scene).__name__
+        self._popped.append((ref, label, self._created.get(scene), scene_assets(scene)))
+        self._this_session.append((ref, label))
+
+    def on_pool(self, scene) -> None:
+        if self.enabled:
+            self._pooled.add(scene)
+
+    def collect_popped(self) -> None:
+        """Measure the scenes popped since the last call (start of frame or next scene)."""
+        if not self._popped:
+            return
+        popped, self._popped = self._popped, []
+        # Still alive before collecting: only the cyclic GC would free them
+        waiting = {id(ref) for ref, *_ in popped if ref() is not None}
+        gc.collect()
+        traced = tracemalloc.get_traced_memory()[0]
+        for ref, label, created, assets in popped:
+            if ref() is not None:
+                fate = "kept in the scene pool" if ref() in self._pooled else "still referenced when measured"
+            elif id(ref) in waiting:
+                fate = "freed by the cyclic GC"
+            else:
+                fate = "freed on pop"
+            retained = traced - created if created is not None else None
+            self.out(f"memory: pop {label}: {assets}; {format_bytes(retained)} traced retained since created, {fate}")
+
+    def end_session(self, live_scenes=()) -> bool:
+        """Session report; returns True when it flags a leak."""
+        if not self.enabled:
+            return False
+        gc.collect()
+        leaked = [label for ref, label in self._previous_session
+                  if ref() is not None and ref() not in self._pooled]
+        self._previous_session, self._this_session = self._this_session, []
+        traced, peak = tracemalloc.get_traced_memory()
+        self.history.append(traced)
+
+        per_scene = allocations_by_scene(tracemalloc.take_snapshot())
+        self.out(f"memory: session {len(self.history)}: {format_bytes(traced)} traced (peak {format_bytes(peak)})")
+        for label, size in sorted(per_scene.items(), key=lambda item: -item[1]):
+            self.out(f"    {label:<20}{format_bytes(size):>12}")
+        for scene in live_scenes:
+            self.out(f"    live {type(scene).__name__}: {scene_assets(scene)}")
+
+        flags = []
+        if leaked:
+            flags.append(f"{len(leaked)} scenes from the previous session still alive ({', '.join(sorted(set(leaked)))})")
+        window = self.history[-self.leak_sessions:]
+        if (len(window) == self.leak_sessions and all(b >= a for a, b in zip(window, window[1:]))
+                and window[-1] - window[0] > self.leak_bytes):
+            flags.append(f"traced memory grew {format_bytes(window[-1] - window[0])} over {len(window)} sessions")
+        for flag in flags:
+            self.out(f"memory: LEAK? {flag}")
+        self.leaks.extend(flags)
+        return bool(flags)
@@ -1,4 +1,4 @@
-from .base import MiniGame, get_all_minigames, get_minigame_by_id, register_minigame
+from .base import MiniGame, ScenePool, get_all_minigames, get_minigame_by_id, get_scene_pool, register_minigame
 
 # Import built-in minigames to ensure registration side-effects
 from .center_word import *  # noqa: F401,F403
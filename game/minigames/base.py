@@ -1,5 +1,9 @@
+from collections import OrderedDict
 from typing import Callable, Dict, List, Optional
+from ..config import SCENE_POOL_BYTES, SCENE_POOL_PER_GAME
 from ..core import Game, Scene
+from ..input import ACTION_PRESS
+from ..memory import scene_assets
 
 
 class MiniGame:
@@ -14,8 +18,124 @@ class MiniGame:
     def create_initial_scene(self, game: Game) -> Scene:
         raise NotImplementedError
 
+    def reset_scene(self, scene: Scene) -> None:
+        """Bring a pooled scene back to the state of a new one (default: ``scene.reset()``)."""
+        scene.reset()
+
+    def acquire_scene(self, game: Game) -> Scene:
+        """Warm scene from the pool (reset, fonts/images/sounds already loaded) or a new one."""
+        scene = _POOL.take(self.id, game)
+        if scene is None:
+            return self.create_initial_scene(game)
+        self.reset_scene(scene)
+        return scene
+
+    def release_scene(self, scene: Scene) -> None:
+        """Hand back a scene that popped itself; it may be reused by acquire_scene."""
+        _POOL.put(self.id, scene)
+
+
+class ScenePool:
+    """Idle minigame scenes kept for the next attempt or session.
+
+    At most ``per_game`` idle scenes per minigame; the least recently released
+    are dropped once their surfaces (pitch × height) exceed ``max_bytes``.
+    """
+
+    def __init__(self, max_bytes: int = SCENE_POOL_BYTES, per_game: int = SCENE_POOL_PER_GAME):
+        self.max_bytes = max_bytes
+        self.per_game = per_game
+        # (minigame id, id(scene)) → (scene, surface bytes), least recently released first
+        self._idle: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self.bytes = 0
+        self.hits = self.misses = self.evictions = 0
+
+    def take(self, minigame_id: str, game: Game) -> Optional[Scene]:
+        for key in reversed(list(self._idle)):
+            if key[0] != minigame_id:
+                continue
+            scene, size = self._idle.pop(key)
+            self.bytes -= size
+            if scene.game is game:
+                self.hits += 1
+                return scene
+        self.misses += 1
+        return None
+
+    def put(self, minigame_id: str, scene: Scene) -> None:
+        if self.max_bytes <= 0 or self.per_game <= 0:
+            return
+        size = scene_assets(scene).surface_bytes
+        same = [key for key in self._idle if key[0] == minigame_id]
+        for key in same[:max(0, len(same) - self.per_game + 1)]:
+            self._drop(key)
+        if size > self.max_bytes:
+            self.evictions += 1
+            return
+        self._idle[(minigame_id, id(scene))] = (scene, size)
+        self.bytes += size
+        scene.game.memory.on_pool(scene)
+        while self.bytes > self.max_bytes:
+            self._drop(next(iter(self._idle)))
+
+    def _drop(self, key) -> None:
+        _scene, size = self._idle.pop(key)
+        self.bytes -= size
+        self.evictions += 1
+
+    def clear(self) -> None:
+        self._idle.clear()
+        self.bytes = 0
+
+    def __len__(self):
+        return len(self._idle)
+
+    def scenes(self) -> List[Scene]:
+        """Idle scenes, least recently released first."""
+        return [scene for scene, _ in self._idle.values()]
+
+
+class StopContinueMixin:
+    """Input of the "press to stop, press again to continue" minigames.
+
+    A ``press`` action while ``state == playing_state`` calls ``on_stop``;
+    once the result is shown (``state == "stopped"``) it calls ``on_continue``.
+    Put it before the Scene base: ``class X(StopContinueMixin, Scene)``.
+    """
+
+    playing_state = "moving"
+    event_types = ()
+    actions = (ACTION_PRESS,)
+
+    def handle_action(self, action):
+        if action.kind != ACTION_PRESS:
+            return
+        if self.state == self.playing_state:
+            self.on_stop()
+        elif self.state == "stopped":
+            self.on_continue()
+
+    def is_animating(self):
+        # The result overlay is static until the next press
+        return self.state == self.playing_state
+
+    def on_stop(self):
+        self.game.mark_attempt_stopped()
+        self.validate()
+        self.state = "stopped"
+
+    def on_continue(self):
+        # Don't play sounds when clicking to continue
+        self.validate(play_sounds=False)
+        self.game.complete_minigame(getattr(self, "score", 0), self.result == "win")
+
 
 _REGISTRY: Dict[str, MiniGame] = {}
+_POOL = ScenePool()
+
+
+def get_scene_pool() -> ScenePool:
+    return _POOL
 
 
 def register_minigame(minigame: MiniGame) -> None:
@@ -1,25 +1,34 @@
 import math
 import pygame
 from ...core import Scene
+from ..base import StopContinueMixin
 from ...config import PRIMARY_COLOR, BG_COLOR, ACCENT_COLOR, GOOD_COLOR, BAD_COLOR, SECONDARY_COLOR, WIDTH, HEIGHT, FONT_PATH
-from ...utils import blit_text_center, load_sound, render_not_center_message, render_win_message, draw_attempts
+from ...scoring import center_word_score
+from ...utils import load_sound
+from ...widgets import AttemptsHud, Label, ResultPanel
 
 
-class CenterWordScene(Scene):
+class CenterWordScene(StopContinueMixin, Scene):
     WORD = "HISTOIRE"
     TOLERANCE = 2
     BASE_SPEED = 400
     PADDING = 40
+    WORD_FONT_SIZE = 160
+    MAX_WORD_HEIGHT = 240  # longer phrases / several lines shrink the font to fit
+    BASE_COLOR = (100, 110, 120)
 
     def __init__(self, game):
         super().__init__(game)
         self.title_font = pygame.font.Font(FONT_PATH, 40)
         self.title_font_small = pygame.font.Font(FONT_PATH, 38)
-        self.word_font = pygame.font.Font(FONT_PATH, 160)
+        self.word_font = self._fit_word_font(self.WORD)
         self.ui_font = pygame.font.Font(FONT_PATH, 22)
 
-        self.word_surf = self.word_font.render(self.WORD, True, PRIMARY_COLOR)
+        # Word layers are rendered once: grey base + one fill per result color
+        self.word_surf = self._render_word(self.WORD, PRIMARY_COLOR)
         self.word_rect = self.word_surf.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 20))
+        self.base_surf = self._render_word(self.WORD, self.BASE_COLOR)
+        self.fill_surfs = {color: self._render_word(self.WORD, color) for color in (ACCENT_COLOR, GOOD_COLOR, BAD_COLOR)}
         self.true_center_x = self.word_rect.centerx
         # Instead of an external line, we'll fill the text from left to right
 
@@ -30,8 +39,37 @@ class CenterWordScene(Scene):
         self.snd_fail = load_sound("fail.wav")
         self.snd_click = load_sound("click.wav")
 
+        # HUD widgets (re-rendered only when their text changes)
+        self.title_label = Label(self.title_font, 60, PRIMARY_COLOR)
+        self.hint_label = Label(self.ui_font, 92, SECONDARY_COLOR)
+        self.diff_label = Label(self.ui_font, HEIGHT - 28, PRIMARY_COLOR)
+        self.attempts_hud = AttemptsHud(game, pos=(None, 26))
+        self.result_panel = ResultPanel((WIDTH, HEIGHT))
+
         self.reset()
 
+    def _fit_word_font(self, text):
+        """Largest font (≤ WORD_FONT_SIZE) that fits the text's lines on screen."""
+        lines = text.split("\n")
+        size = self.WORD_FONT_SIZE
+        font = pygame.font.Font(FONT_PATH, size)
+        width = max(font.size(line)[0] for line in lines)
+        height = font.get_linesize() * len(lines)
+        scale = min(1.0, (WIDTH - 2 * self.PADDING) / max(1, width), self.MAX_WORD_HEIGHT / max(1, height))
+        if scale < 1.0:
+            size = max(12, int(size * scale))
+            font = pygame.font.Font(FONT_PATH, size)
+        return font
+
+    def _render_word(self, text, color):
+        """Render (possibly multi-line) text, each line centered, into one surface."""
+        lines = [self.word_font.render(line, True, color) for line in text.split("\n")]
+        line_h = self.word_font.get_linesize()
+        surf = pygame.Surface((max(l.get_width() for l in lines), line_h * (len(lines) - 1) + lines[-1].get_height()), pygame.SRCALPHA)
+        for i, line in enumerate(lines):
+            surf.blit(line, line.get_rect(midtop=(surf.get_width() // 2, i * line_h)))
+        return surf
+
     def reset(self):
         self.state = "moving"
         self.cursor_x = self.min_x
@@ -40,27 +78,6 @@ class CenterWordScene(Scene):
         self.error_px = None
         self.time_acc = 0.0
 
-    def handle_event(self, e):
-        if e.type == pygame.KEYDOWN:
-            if e.key in (pygame.K_SPACE, pygame.K_RETURN):
-                if self.state == "moving":
-                    self.validate()
-                    self.state = "stopped"
-                elif self.state == "stopped":
-                    # Don't play sounds when clicking to continue
-                    self.validate(play_sounds=False)
-                    score = getattr(self, "score", 0)
-                    success = (self.result == "win")
-                    self.game.complete_minigame(score, success)
-        elif e.type == pygame.MOUSEBUTTONDOWN:
-            if self.state == "moving":
-                self.validate()
-                self.state = "stopped"
-            elif self.state == "stopped":
-                # Don't play sounds when clicking to continue
-                self.validate(play_sounds=False)
-                self.game.complete_minigame(getattr(self, "score", 0), self.result == "win")
-
     def update(self, dt):
         if self.state != "moving":
             return
@@ -79,9 +96,10 @@ class CenterWordScene(Scene):
     def validate(self, play_sounds=True):
         if play_sounds and self.snd_click:
             self.snd_click.play()
-        # Evaluate error relative to 50% fill
-        self.error_px = abs(self.cursor_x - 0.5) * self.word_rect.width
-        if abs(self.cursor_x - 0.5) * self.word_rect.width <= self.TOLERANCE:
+        # Evaluate error relative to 50% fill; score 100 at 0 error, 0 at word width/2
+        self.error_px, self.score, success = center_word_score(self.cursor_x, self.word_rect.width, self.TOLERANCE)
+        self.stop_error = self.error_px
+        if success:
             self.result = "win"
             if play_sounds and self.snd_success:
                 self.snd_success.play()
@@ -89,64 +107,41 @@ class CenterWordScene(Scene):
             self.result = "lose"
             if play_sounds and self.snd_fail:
                 self.snd_fail.play()
-        # Compute score: 100 max, linearly reduced by error, clamped to [0, 100]
-        # 0 error -> 100, error == word width/2 -> 0
-        max_error_for_zero = self.word_rect.width / 2
-        raw = int(100 * max(0.0, 1.0 - (self.error_px / max_error_for_zero)))
-        self.score = max(0, min(100, raw))
 
     def draw(self, screen):
         screen.fill(BG_COLOR)
-        blit_text_center(screen, self.title_font.render("Arrête la barre au centre du mot", True, PRIMARY_COLOR), 60)
+        self.title_label.draw(screen, "Arrête la barre au centre du mot")
         hint = (
             "Espace/clic pour ARRÊTER"
             if self.state == "moving"
             else "Espace/clic pour CONTINUER"
         )
-        blit_text_center(screen, self.ui_font.render(hint, True, SECONDARY_COLOR), 92)
-        draw_attempts(screen, self.game, pos=(None, 26))
+        self.hint_label.draw(screen, hint)
+        self.attempts_hud.draw(screen)
 
         # Draw the word, with a fill mask up to cursor_x
         # Base word in desaturated color
-        base_surf = self.word_font.render(self.WORD, True, (100, 110, 120))
-        screen.blit(base_surf, self.word_rect.topleft)
+        screen.blit(self.base_surf, self.word_rect.topleft)
 
-        # Filled overlay up to fraction
+        # Filled overlay up to fraction: area blit of the prerendered layer
         filled_color = ACCENT_COLOR if self.result is None else (GOOD_COLOR if self.result == "win" else BAD_COLOR)
-        filled_surf = self.word_font.render(self.WORD, True, filled_color)
         clip_width = max(0, min(self.word_rect.width, int(self.cursor_x * self.word_rect.width)))
         if clip_width > 0:
-            clip_rect = pygame.Rect(self.word_rect.left, self.word_rect.top, clip_width, self.word_rect.height)
-            screen.set_clip(clip_rect)
-            screen.blit(filled_surf, self.word_rect.topleft)
-            screen.set_clip(None)
+            area = pygame.Rect(0, 0, clip_width, self.word_rect.height)
+            screen.blit(self.fill_surfs[filled_color], self.word_rect.topleft, area)
 
         diff = abs(self.cursor_x - 0.5) * self.word_rect.width
-        blit_text_center(
-            screen,
-            self.ui_font.render(
-                f"Décalage: {int(diff)} px (Tolérance: {self.TOLERANCE}px)", True, PRIMARY_COLOR
-            ),
-            HEIGHT - 28,
-        )
+        self.diff_label.draw(screen, f"Décalage: {int(diff)} px (Tolérance: {self.TOLERANCE}px)")
 
         if self.state == "stopped":
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 150))
-            screen.blit(overlay, (0, 0))
+            t1 = self.result_panel.title(self.result == "win", self.title_font, self.title_font_small)
             if self.result == "win":
-                t1 = render_win_message(self.title_font)
-                t2 = self.ui_font.render(
-                    f"Erreur: {int(self.error_px)} px (≤ {self.TOLERANCE}px)", True, PRIMARY_COLOR
-                )
+                t2 = f"Erreur: {int(self.error_px)} px (≤ {self.TOLERANCE}px)"
             else:
-                t1 = render_not_center_message(self.title_font_small)
-                t2 = self.ui_font.render(
-                    f"Erreur: {int(self.error_px)} px (> {self.TOLERANCE}px)", True, PRIMARY_COLOR
-                )
-            t3 = self.ui_font.render(f"Score: {getattr(self, 'score', 0)}", True, PRIMARY_COLOR)
-            blit_text_center(screen, t1, HEIGHT // 2 - 10)
-            blit_text_center(screen, t2, HEIGHT // 2 + 26)
-            blit_text_center(screen, t3, HEIGHT // 2 + 50)
-            hint = self.ui_font.render("ESPACE ou clic pour continuer", True, SECONDARY_COLOR)
-            blit_text_center(screen, hint, HEIGHT // 2 + 72)
\ No newline at end of file
+                t2 = f"Erreur: {int(self.error_px)} px (> {self.TOLERANCE}px)"
+            self.result_panel.draw(screen, [
+                (*t1, HEIGHT // 2 - 10),
+                (self.ui_font, t2, PRIMARY_COLOR, HEIGHT // 2 + 26),
+                (self.ui_font, f"Score: {getattr(self, 'score', 0)}", PRIMARY_COLOR, HEIGHT // 2 + 50),
+                (self.ui_font, "ESPACE ou clic pour continuer", SECONDARY_COLOR, HEIGHT // 2 + 72),
+            ])
@@ -1,26 +1,41 @@
 import os
 import random
 import pygame
-from ...core import Scene
-from ...config import GAME_WIDTH, GAME_HEIGHT, PRIMARY_COLOR, SECONDARY_COLOR, BG_COLOR, ACCENT_COLOR, GOOD_COLOR, BAD_COLOR, IMG_DIR, FONT_PATH
-from ...utils import blit_text_center, load_image, load_sound, draw_attempts, render_not_center_message, render_win_message
+from ... import manifest as asset_manifest
+from ...atlas import load_atlas
+from ...scenegraph import SpriteScene, WidgetSprite
+from ..base import StopContinueMixin
+from ...config import GAME_WIDTH, GAME_HEIGHT, PRIMARY_COLOR, SECONDARY_COLOR, BG_COLOR, ACCENT_COLOR, IMG_DIR, FONT_PATH
+from ...quality import current_tier
+from ...scoring import comic_score
+from ...utils import blit_text_center, load_image, load_sound
+from ...widgets import AttemptsHud, Label, ResultPanel
 
 
-def blit_fit(surface, img, rect):
-    """Blitte l'image en conservant le ratio pour remplir au mieux rect (letterbox)."""
+def fit_image(img, rect):
+    """Redimensionne l'image en conservant le ratio pour remplir au mieux rect (letterbox).
+
+    Retourne (image, dst) ou None si rien à dessiner.
+    """
     iw, ih = img.get_size()
     rw, rh = rect.width, rect.height
     if iw == 0 or ih == 0 or rw <= 0 or rh <= 0:
-        return
+        return None
     scale = min(rw / iw, rh / ih)
     tw, th = int(iw * scale), int(ih * scale)
     if scale != 1.0:
-        img = pygame.transform.smoothscale(img, (tw, th))
-    dst = img.get_rect(center=rect.center)
-    surface.blit(img, dst)
+        img = (pygame.transform.smoothscale if current_tier().smoothscale else pygame.transform.scale)(img, (tw, th))
+    return img, img.get_rect(center=rect.center)
 
 
-class ComicScene(Scene):
+def blit_fit(surface, img, rect):
+    """Blitte l'image en conservant le ratio pour remplir au mieux rect (letterbox)."""
+    fitted = fit_image(img, rect)
+    if fitted:
+        surface.blit(*fitted)
+
+
+class ComicScene(StopContinueMixin, SpriteScene):
     """
     Niveau BD 7 cases : layout 4 (haut) + 3 (bas centré).
     Highlight animé ; validation quand la VRAIE case du milieu (tri alphabétique) est surlignée.
@@ -44,10 +59,15 @@ class ComicScene(Scene):
 
         # --- chargement images ---
         self.comic_dir = os.path.join(IMG_DIR, "comic")
-        os.makedirs(self.comic_dir, exist_ok=True)
-        valid_ext = (".png", ".jpg", ".jpeg", ".bmp", ".gif")
-        files = [f for f in os.listdir(self.comic_dir) if f.lower().endswith(valid_ext)]
-        files.sort()
+        manifest = asset_manifest.get_manifest()
+        if manifest is not None:
+            # assets cuits : liste issue du manifeste, sans accès disque
+            files = asset_manifest.list_images(manifest, "comic")
+        else:
+            os.makedirs(self.comic_dir, exist_ok=True)
+            valid_ext = (".png", ".jpg", ".jpeg", ".bmp", ".gif")
+            files = [f for f in os.listdir(self.comic_dir) if f.lower().endswith(valid_ext)]
+            files.sort()
         selected = files[:self.TARGET_COUNT]
 
         if not selected:
@@ -56,8 +76,13 @@ class ComicScene(Scene):
             self.names = ["(placez vos images dans assets/images/comic)"] * self.TARGET_COUNT
         else:
             self.paths = [os.path.join(self.comic_dir, f) for f in selected]
-            # on charge grand, c'est `blit_fit` qui fait l'adaptation au rendu
-            self.images = [load_image(p, 2000, 2000) for p in self.paths]
+            # images réduites une fois à la taille des cases ; depuis l'atlas si les assets sont cuits
+            atlas = load_atlas("comic")
+            max_w, max_h = self.tile_image_size()
+            self.images = [
+                atlas[f"comic/{f}"] if atlas and f"comic/{f}" in atlas else load_image(p, max_w, max_h)
+                for f, p in zip(selected, self.paths)
+            ]
             self.names = selected
 
         # "milieu" de l'histoire basé sur le tri des noms
@@ -81,41 +106,61 @@ class ComicScene(Scene):
         self.snd_click = load_sound("click.wav")
 
         # pré-calc layout rects (4 haut, 3 bas centré)
-        self.tile_rects = self.compute_layout()
+        self.tile_rects = self.compute_layout(len(self.images))
+
+        # widgets HUD (re-rendus seulement quand leur texte change)
+        self.title_label = Label(self.title_font, 64, PRIMARY_COLOR)
+        self.hint_label = Label(self.ui_font, 96, SECONDARY_COLOR)
+        self.attempts_hud = AttemptsHud(game, pos=(None, 26))
+        self.result_panel = ResultPanel((GAME_WIDTH, GAME_HEIGHT))
+
+        # calques mobiles ; fond, titre et cases sont dans le background
+        self.highlight_img = self._render_highlight(self.tile_rects[0].size) if self.tile_rects else None
+        self.highlight_sprite = WidgetSprite(layer=1)
+        self.attempts_sprite = WidgetSprite(layer=1)
+        self.panel_sprite = WidgetSprite(layer=2)
+        self.group.add(self.highlight_sprite, self.attempts_sprite, self.panel_sprite)
 
     # ---------------- layout & events ----------------
-    def compute_layout(self):
+    @classmethod
+    def tile_image_size(cls):
+        """Taille maximale d'une image dans une case (intérieur du cadre)."""
+        rect = cls.compute_layout()[0]
+        return rect.width - cls.TILE_PADDING * 2, rect.height - cls.TILE_PADDING * 2
+
+    @classmethod
+    def compute_layout(cls, count=None):
         """Layout 4 (haut) + 3 (bas), CENTRÉ horizontalement et verticalement,
         en maximisant la taille sans couper."""
-        usable_w = GAME_WIDTH - 2 * self.MARGIN_SIDE
-        usable_h = GAME_HEIGHT - self.MARGIN_TOP - self.MARGIN_BOTTOM
+        usable_w = GAME_WIDTH - 2 * cls.MARGIN_SIDE
+        usable_h = GAME_HEIGHT - cls.MARGIN_TOP - cls.MARGIN_BOTTOM
 
         # Taille brute depuis la hauteur (2 rangées + 1 gouttière)
-        tile_h = max(60, int((usable_h - self.GUTTER_Y) / 2))
-        tile_w = max(60, int(tile_h * self.TILE_ASPECT))
+        tile_h = max(60, int((usable_h - cls.GUTTER_Y) / 2))
+        tile_w = max(60, int(tile_h * cls.TILE_ASPECT))
 
         # Si la rangée du haut (4 tuiles) dépasse en largeur, on réduit
-        total_w_top = 4 * tile_w + 3 * self.GUTTER_X
+        total_w_top = 4 * tile_w + 3 * cls.GUTTER_X
         if total_w_top > usable_w:
             scale = usable_w / total_w_top
             tile_w = max(60, int(tile_w * scale))
-            tile_h = max(60, int(tile_w / self.TILE_ASPECT))
-            total_w_top = 4 * tile_w + 3 * self.GUTTER_X
+            tile_h = max(60, int(tile_w / cls.TILE_ASPECT))
+            total_w_top = 4 * tile_w + 3 * cls.GUTTER_X
 
-        total_w_bot = 3 * tile_w + 2 * self.GUTTER_X  # rangée du bas
+        total_w_bot = 3 * tile_w + 2 * cls.GUTTER_X  # rangée du bas
 
         # Centre VERTICALEMENT le bloc 2 rangées
-        block_h = 2 * tile_h + self.GUTTER_Y
-        top_y = self.MARGIN_TOP + (usable_h - block_h) // 2
+        block_h = 2 * tile_h + cls.GUTTER_Y
+        top_y = cls.MARGIN_TOP + (usable_h - block_h) // 2
         row1_y = top_y + tile_h // 2
-        row2_y = row1_y + tile_h + self.GUTTER_Y
+        row2_y = row1_y + tile_h + cls.GUTTER_Y
 
         # Centre HORIZONTALLEMENT CHAQUE rangée
-        left_top = self.MARGIN_SIDE + (usable_w - total_w_top) // 2 + tile_w // 2
-        xs_top = [left_top + i * (tile_w + self.GUTTER_X) for i in range(4)]
+        left_top = cls.MARGIN_SIDE + (usable_w - total_w_top) // 2 + tile_w // 2
+        xs_top = [left_top + i * (tile_w + cls.GUTTER_X) for i in range(4)]
 
-        left_bot = self.MARGIN_SIDE + (usable_w - total_w_bot) // 2 + tile_w // 2
-        xs_bot = [left_bot + i * (tile_w + self.GUTTER_X) for i in range(3)]
+        left_bot = cls.MARGIN_SIDE + (usable_w - total_w_bot) // 2 + tile_w // 2
+        xs_bot = [left_bot + i * (tile_w + cls.GUTTER_X) for i in range(3)]
 
         rects = []
         for x in xs_top:
@@ -123,28 +168,9 @@ class ComicScene(Scene):
         for x in xs_bot:
             rects.append(pygame.Rect(0, 0, tile_w, tile_h).move(x - tile_w // 2, row2_y - tile_h // 2))
 
-        return rects[:len(self.images)]
-
-
-
-    def handle_event(self, e):
-        if e.type == pygame.KEYDOWN:
-            if e.key == pygame.K_SPACE or e.key == pygame.K_RETURN:
-                if self.state == "moving":
-                    self.validate()
-                elif self.state == "stopped":
-                    # Don't play sounds when clicking to continue
-                    self.validate(play_sounds=False)
-                    score = getattr(self, "score", 0)
-                    success = (self.result == "win")
-                    self.game.complete_minigame(score, success)
-        elif e.type == pygame.MOUSEBUTTONDOWN:
-            if self.state == "moving":
-                self.validate()
-            elif self.state == "stopped":
-                # Don't play sounds when clicking to continue
-                self.validate(play_sounds=False)
-                self.game.complete_minigame(getattr(self, "score", 0), self.result == "win")
+        return rects[:cls.TARGET_COUNT if count is None else count]
+
+
 
     def reset(self):
         self.state = "moving"
@@ -153,6 +179,7 @@ class ComicScene(Scene):
         self.current_idx = 0
         self.timer = 0.0
         random.shuffle(self.grid_order)
+        self.invalidate()
 
     # ---------------- update/draw ----------------
     def update(self, dt):
@@ -164,30 +191,41 @@ class ComicScene(Scene):
             total = max(1, len(self.images))
             self.current_idx = (self.current_idx + 1) % total
 
-    def draw_tile(self, screen, rect, img, highlighted):
-        # ombre douce
-        shadow = rect.move(0, 8)
-        srf = pygame.Surface((shadow.width, shadow.height), pygame.SRCALPHA)
-        pygame.draw.rect(srf, (0, 0, 0, 70), srf.get_rect(), border_radius=16)
-        screen.blit(srf, shadow.topleft)
+    def tile_blits(self, rect, img):
+        """Séquence (surface, position) d'une case : ombre, fond carte, image ajustée."""
+        seq = []
+        # ombre douce (selon le niveau de qualité)
+        if current_tier().comic_shadows:
+            shadow = rect.move(0, 8)
+            srf = pygame.Surface((shadow.width, shadow.height), pygame.SRCALPHA)
+            pygame.draw.rect(srf, (0, 0, 0, 70), srf.get_rect(), border_radius=16)
+            seq.append((srf, shadow.topleft))
 
         # fond carte
         card = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
         pygame.draw.rect(card, (30, 34, 44), card.get_rect(), border_radius=16)
         pygame.draw.rect(card, (70, 78, 90), card.get_rect(), 2, border_radius=16)
-        screen.blit(card, rect.topleft)
+        seq.append((card, rect.topleft))
 
         # image ajustée (avec padding intérieur)
         inner = rect.inflate(-self.TILE_PADDING * 2, -self.TILE_PADDING * 2)
-        blit_fit(screen, img, inner)
-
-        # highlight animé (pulse alpha)
-        if highlighted:
-            pulse = (pygame.time.get_ticks() // 10) % 200
-            alpha = 80 + int(60 * abs(100 - pulse) / 100)  # 80..140
-            hi = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-            pygame.draw.rect(hi, (*ACCENT_COLOR[:3], alpha), hi.get_rect(), 6, border_radius=18)
-            screen.blit(hi, rect.topleft)
+        fitted = fit_image(img, inner)
+        if fitted:
+            seq.append(fitted)
+        return seq
+
+    def _render_highlight(self, size):
+        hi = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.rect(hi, ACCENT_COLOR[:3], hi.get_rect(), 6, border_radius=18)
+        return hi
+
+    @staticmethod
+    def _pulse_alpha():
+        # highlight animé (pulse alpha), fixe en qualité basse
+        if not current_tier().comic_pulse:
+            return 110
+        pulse = (pygame.time.get_ticks() // 10) % 200
+        return 80 + int(60 * abs(100 - pulse) / 100)  # 80..140
 
     def validate(self, play_sounds=True):
         if play_sounds and self.snd_click: self.snd_click.play()
@@ -199,58 +237,51 @@ class ComicScene(Scene):
         shown_img_idx = self.grid_order[self.current_idx]
         shown_path = self.paths[shown_img_idx]
         middle_idx = self.story_middle_idx  # index de l'image du milieu (4 si 7 images)
-        distance = abs(shown_img_idx - middle_idx)
-        if distance == 0:
-            self.score = 100
+        self.stop_error = abs(shown_img_idx - middle_idx)  # tiles
+        self.score, success = comic_score(shown_img_idx - middle_idx)
+        if success:
             self.result = "win"
             if play_sounds and self.snd_success: self.snd_success.play()
-        elif distance == 1:
-            self.score = 80
-            self.result = "lose"
-            if play_sounds and self.snd_fail: self.snd_fail.play()
-        elif distance == 2:
-            self.score = 60
-            self.result = "lose"
-            if play_sounds and self.snd_fail: self.snd_fail.play()
-        elif distance == 3:
-            self.score = 40
-            self.result = "lose"
-            if play_sounds and self.snd_fail: self.snd_fail.play()
         else:
-            self.score = 0
             self.result = "lose"
             if play_sounds and self.snd_fail: self.snd_fail.play()
 
-    def draw(self, screen):
-        self.tile_rects = self.compute_layout()
-        screen.fill(BG_COLOR)
-        blit_text_center(screen, self.title_font.render("Quel est le milieu de l'histoire ?", True, PRIMARY_COLOR), 64)
-        blit_text_center(screen, self.ui_font.render("ESPACE/Click pour valider", True, SECONDARY_COLOR), 96)
-        
-        # Draw attempts HUD
-        draw_attempts(screen, self.game, pos=(None, 26))
+    def build_background(self, surface):
+        surface.fill(BG_COLOR)
+        blit_text_center(surface, self.title_label.render("Quel est le milieu de l'histoire ?"), 64)
+        blit_text_center(surface, self.hint_label.render("ESPACE/Click pour valider"), 96)
 
-        # dessine les 7 cases suivant l'ordre mélangé
+        # dessine les 7 cases suivant l'ordre mélangé, en un seul appel blits
+        seq = []
         for grid_idx, rect in enumerate(self.tile_rects):
             img_idx = self.grid_order[grid_idx]
-            img = self.images[img_idx]
-            self.draw_tile(screen, rect, img, highlighted=(self.state == "moving" and grid_idx == self.current_idx))
+            seq.extend(self.tile_blits(rect, self.images[img_idx]))
+        surface.blits(seq, doreturn=False)
+
+    def sync_sprites(self):
+        # Draw attempts HUD
+        attempts, topleft = self.attempts_hud.render()
+        if attempts is not None:
+            self.attempts_sprite.show(attempts, topleft=topleft)
+
+        if self.state == "moving" and self.highlight_img is not None:
+            rect = self.tile_rects[self.current_idx]
+            alpha = self._pulse_alpha()
+            if alpha != self.highlight_img.get_alpha() or self.highlight_sprite.rect != rect:
+                self.highlight_img.set_alpha(alpha)
+                self.highlight_sprite.dirty = 1
+            self.highlight_sprite.show(self.highlight_img, topleft=rect.topleft)
+        else:
+            self.highlight_sprite.hide()
 
         # overlay résultat
         if self.state == "stopped":
-            overlay = pygame.Surface((GAME_WIDTH, GAME_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 150))
-            screen.blit(overlay, (0, 0))
-            if self.result == "win":
-                t1 = render_win_message(self.title_font)
-                t2 = self.ui_font.render("ESPACE/clic pour continuer", True, PRIMARY_COLOR)
-            else:
-                t1 = render_not_center_message(self.title_font_small)
-                ans = os.path.basename(self.story_middle_path) if self.story_middle_path else "N/A"
-                t2 = self.ui_font.render(f" ESPACE/clic pour continuer", True, PRIMARY_COLOR)
-            blit_text_center(screen, t1, GAME_HEIGHT // 2 - 10)
-            blit_text_center(screen, t2, GAME_HEIGHT // 2 + 26)
-            
-            # Affichage du score
-            t3 = self.ui_font.render(f"Score : {self.score}", True, PRIMARY_COLOR)
-            blit_text_center(screen, t3, GAME_HEIGHT // 2 + 60)
\ No newline at end of file
+            t1 = self.result_panel.title(self.result == "win", self.title_font, self.title_font_small)
+            self.panel_sprite.show(self.result_panel.render([
+                (*t1, GAME_HEIGHT // 2 - 10),
+                (self.ui_font, "ESPACE/clic pour continuer", PRIMARY_COLOR, GAME_HEIGHT // 2 + 26),
+                # Affichage du score
+                (self.ui_font, f"Score : {self.score}", PRIMARY_COLOR, GAME_HEIGHT // 2 + 60),
+            ]), topleft=(0, 0))
+        else:
+            self.panel_sprite.hide()
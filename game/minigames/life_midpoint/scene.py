@@ -1,13 +1,20 @@
 import random
 import pygame
 from ...core import Scene
-from ...config import WIDTH, HEIGHT, PRIMARY_COLOR, SECONDARY_COLOR, BG_COLOR, ACCENT_COLOR, GOOD_COLOR, BAD_COLOR, CELEBRITIES, LIFE_KEY_SPEED, LIFE_TIMELINE_PADDING_YEARS, LIFE_TARGET_KIND, FONT_PATH
-from ...utils import blit_text_center, clamp, draw_attempts, load_sound, render_not_center_message, render_win_message
+from ...config import WIDTH, HEIGHT, PRIMARY_COLOR, SECONDARY_COLOR, BG_COLOR, ACCENT_COLOR, GOOD_COLOR, BAD_COLOR, LIFE_KEY_SPEED, LIFE_TIMELINE_PADDING_YEARS, LIFE_TARGET_KIND, LIFE_PACK, FONT_PATH
+from ...content import load_pack
+from ...input import ACTION_MOVE, ACTION_PRESS
+from ...sampling import get_sampler
+from ...scoring import life_score
+from ...utils import clamp, load_sound
+from ...widgets import AttemptsHud, Label, ResultPanel
 
 
 class LifeMidpointScene(Scene):
     CURSOR_SPEED = LIFE_KEY_SPEED  # pixels per second for keyboard
     TOLERANCE_YEARS = 0  # years within target for success
+    event_types = ()
+    actions = (ACTION_PRESS, ACTION_MOVE)
 
     def __init__(self, game):
         super().__init__(game)
@@ -15,32 +22,50 @@ class LifeMidpointScene(Scene):
         self.title_font_small = pygame.font.Font(FONT_PATH, 34)
         self.ui_font = pygame.font.Font(FONT_PATH, 22)
         self.large_font = pygame.font.Font(FONT_PATH, 28)
-        self.person = random.choice(CELEBRITIES)
-        name, birth, death = self.person
-        self.name = name
-        self.birth = birth
-        self.death = death
+        self.pack = load_pack(LIFE_PACK)
+        self.timeline_rect = pygame.Rect(120, HEIGHT // 2 + 20, WIDTH - 240, 8)
+        # sounds
+        self.snd_success = load_sound("success.wav")
+        self.snd_fail = load_sound("fail.wav")
+        self.snd_click = load_sound("click.wav")
+
+        self.difficulty_multiplier = 1.0
+
+        # HUD widgets (re-rendered only when their text changes)
+        self.title_label = Label(self.title_font, 70, PRIMARY_COLOR)
+        self.subtitle_label = Label(self.ui_font, 96, SECONDARY_COLOR)
+        self.keys_label = Label(self.ui_font, 120, SECONDARY_COLOR)
+        self.hint_label = Label(self.ui_font, HEIGHT - 26, SECONDARY_COLOR)
+        self.year_labels = [Label(self.large_font, color=ACCENT_COLOR) for _ in range(2)]
+        self.attempts_hud = AttemptsHud(game, pos=(None, 26))
+        self.result_panel = ResultPanel((WIDTH, HEIGHT))
+        self.reset()
+
+    def reset(self, person=None):
+        """Start a round with ``person`` (default: next no-repeat draw for the current player)."""
+        if person is None:
+            # No-repeat draw for the current player (falls back to anonymous history)
+            sampler = get_sampler(self.pack, LIFE_PACK, self.game.current_player)
+            person = sampler.draw()
+            sampler.save()
+        self.person = person
+        self.name = self.person.label
+        self.birth = self.person.start
+        self.death = self.person.end
         self.min_year = self.birth - LIFE_TIMELINE_PADDING_YEARS
         self.max_year = self.death + LIFE_TIMELINE_PADDING_YEARS
-        self.timeline_rect = pygame.Rect(120, HEIGHT // 2 + 20, WIDTH - 240, 8)
         # Target year: random within life by default, or midpoint when configured
         if LIFE_TARGET_KIND == "midpoint":
-            self.target_year = int((self.birth + self.death) / 2)
+            self.target_year = int(self.person.midpoint)
         else:
             self.target_year = random.randint(self.birth, self.death)
         # Start cursor at the leftmost visible bound
         self.cursor_x = self.year_to_x(self.min_year)
-        self.holding_left = False
-        self.holding_right = False
+        self.steer = 0  # held direction: -1, 0 or +1
         self.state = "aim"
         self.selected_year = None
+        self.stop_error = None
         self.score = 0
-        # sounds
-        self.snd_success = load_sound("success.wav")
-        self.snd_fail = load_sound("fail.wav")
-        self.snd_click = load_sound("click.wav")
-
-        self.difficulty_multiplier = 1.0
 
     def year_to_x(self, year):
         # Map [min_year..max_year] to [timeline.left..timeline.right]
@@ -57,50 +82,41 @@ class LifeMidpointScene(Scene):
         t = (x - self.timeline_rect.left) / self.timeline_rect.width
         return self.min_year + t * span
 
-    def handle_event(self, e):
-        if e.type == pygame.KEYDOWN:
-            if self.state == "aim":
-                if e.key in (pygame.K_LEFT, pygame.K_a):
-                    self.holding_left = True
-                elif e.key in (pygame.K_RIGHT, pygame.K_d):
-                    self.holding_right = True
-                elif e.key in (pygame.K_SPACE, pygame.K_RETURN):
-                    self.validate_selection()
-            elif self.state == "result" and e.key in (pygame.K_SPACE, pygame.K_RETURN):
-                # Don't play sounds when clicking to continue
-                self.validate_selection(play_sounds=False)
-                self.game.complete_minigame(getattr(self, "score", 0), self._is_success())
-        elif e.type == pygame.KEYUP and self.state == "aim":
-            if e.key in (pygame.K_LEFT, pygame.K_a):
-                self.holding_left = False
-            elif e.key in (pygame.K_RIGHT, pygame.K_d):
-                self.holding_right = False
-        elif e.type == pygame.MOUSEBUTTONDOWN and self.state == "aim":
-            if e.button == 1:  # Left click
-                mouse_x, mouse_y = pygame.mouse.get_pos()
-                if self.timeline_rect.collidepoint(mouse_x, mouse_y):
-                    self.cursor_x = mouse_x
-                    self.validate_selection()
+    def handle_action(self, action):
+        if action.kind == ACTION_MOVE:
+            self.steer = action.value if self.state == "aim" else 0
+            return
+        if self.state == "aim":
+            if action.pos is None:
+                self.game.mark_attempt_stopped()
+                self.validate_selection()
+            elif action.value == 1 and self.timeline_rect.collidepoint(action.pos):  # Left click
+                self.game.mark_attempt_stopped()
+                self.cursor_x = action.pos[0]
+                self.validate_selection()
+        elif self.state == "result" and action.pos is None:
+            # Don't play sounds when clicking to continue
+            self.validate_selection(play_sounds=False)
+            self.game.complete_minigame(getattr(self, "score", 0), self._is_success())
 
     def update(self, dt):
         if self.state != "aim":
             return
-        delta = 0
-        if self.holding_left:
-            delta -= self.CURSOR_SPEED * dt
-        if self.holding_right:
-            delta += self.CURSOR_SPEED * dt
+        delta = self.steer * self.CURSOR_SPEED * dt
         if delta != 0:
             x = clamp(self.cursor_x + delta, self.timeline_rect.left, self.timeline_rect.right)
             self.cursor_x = x
 
+    def is_animating(self):
+        # The cursor only moves while a direction is held
+        return self.state == "aim" and self.steer != 0
+
     def validate_selection(self, play_sounds=True):
         year = round(self.x_to_year(self.cursor_x))
         self.selected_year = int(year)
-        error_years = abs(self.selected_year - self.target_year)
-        visible_span = max(1, abs(self.max_year - self.min_year))
-        precision = max(0.0, 1.0 - (error_years / (visible_span / 2)))
-        self.score = int(100 * precision * self.difficulty_multiplier)
+        self.stop_error = abs(self.selected_year - self.target_year)  # years
+        self.score, _ = life_score(self.selected_year, self.target_year, self.min_year, self.max_year,
+                                   self.TOLERANCE_YEARS, self.difficulty_multiplier)
         self.state = "result"
         # play sfx
         if play_sounds:
@@ -124,20 +140,20 @@ class LifeMidpointScene(Scene):
     def draw(self, screen):
         screen.fill(BG_COLOR)
         subtitle = f"Trouve le milieu de vie de {self.name}"
-        blit_text_center(screen, self.title_font.render("Sur la frise: vise l'année", True, PRIMARY_COLOR), 70)
-        blit_text_center(screen, self.ui_font.render(subtitle, True, SECONDARY_COLOR), 96)
-        blit_text_center(screen, self.ui_font.render("Utilise <- et ->", True, SECONDARY_COLOR), 120)
+        self.title_label.draw(screen, "Sur la frise: vise l'année")
+        self.subtitle_label.draw(screen, subtitle)
+        self.keys_label.draw(screen, "Utilise <- et ->")
 
         # Timeline background
         pygame.draw.rect(screen, (40, 40, 60), self.timeline_rect)
         pygame.draw.rect(screen, PRIMARY_COLOR, self.timeline_rect, 2)
 
         # Ticks and labels (birth and death only)
-        for year in (self.birth, self.death):
+        for year, year_label in zip((self.birth, self.death), self.year_labels):
             x = self.year_to_x(year)
             color = ACCENT_COLOR
             pygame.draw.line(screen, color, (x, self.timeline_rect.centery - 12), (x, self.timeline_rect.centery + 12), 3)
-            label = self.large_font.render(str(year), True, color)
+            label = year_label.render(str(year))
             screen.blit(label, label.get_rect(center=(x, self.timeline_rect.centery - 25)))
 
         # Target marker (only visible after validation)
@@ -153,35 +169,23 @@ class LifeMidpointScene(Scene):
 
         # Instructions
         hint = "flèches directionnelles pour viser • ESPACE/clic pour valider" if self.state == "aim" else "ESPACE pour continuer"
-        blit_text_center(screen, self.ui_font.render(hint, True, SECONDARY_COLOR), HEIGHT - 26)
-        draw_attempts(screen, self.game, pos=(None, 26))
+        self.hint_label.draw(screen, hint)
+        self.attempts_hud.draw(screen)
 
         if self.state == "result":
-            # Result overlay
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 150))
-            screen.blit(overlay, (0, 0))
-            
             diff_years = abs(self.selected_year - self.target_year)
             is_success = diff_years <= self.TOLERANCE_YEARS
             
             # Result title
-            if is_success:
-                blit_text_center(screen, render_win_message(self.title_font), HEIGHT // 2 - 60)
-            else:
-                blit_text_center(screen, render_not_center_message(self.title_font_small), HEIGHT // 2 - 60)
+            title = self.result_panel.title(is_success, self.title_font, self.title_font_small)
             
             # Details
-            chosen = self.large_font.render(f"Votre année: {self.selected_year}", True, PRIMARY_COLOR)
             exact_val = int(self.target_year) if isinstance(self.target_year, int) or float(self.target_year).is_integer() else self.target_year
-            exact = self.large_font.render(f"Cible exacte: {exact_val}", True, PRIMARY_COLOR)
             result_color = GOOD_COLOR if is_success else BAD_COLOR
-            diff = self.large_font.render(f"Écart: {int(round(diff_years))} ans", True, result_color)
-            score_s = self.large_font.render(f"Score: {self.score}", True, PRIMARY_COLOR)
-            
-            blit_text_center(screen, chosen, HEIGHT // 2 - 20)
-            blit_text_center(screen, exact, HEIGHT // 2 + 10)
-            blit_text_center(screen, diff, HEIGHT // 2 + 40)
-            blit_text_center(screen, score_s, HEIGHT // 2 + 70)
-
-
+            self.result_panel.draw(screen, [
+                (*title, HEIGHT // 2 - 60),
+                (self.large_font, f"Votre année: {self.selected_year}", PRIMARY_COLOR, HEIGHT // 2 - 20),
+                (self.large_font, f"Cible exacte: {exact_val}", PRIMARY_COLOR, HEIGHT // 2 + 10),
+                (self.large_font, f"Écart: {int(round(diff_years))} ans", result_color, HEIGHT // 2 + 40),
+                (self.large_font, f"Score: {self.score}", PRIMARY_COLOR, HEIGHT // 2 + 70),
+            ])
@@ -1,10 +1,14 @@
 import pygame
-from ...core import Scene
-from ...config import GAME_WIDTH, GAME_HEIGHT, ACCENT_COLOR, PRIMARY_COLOR, BG_COLOR, GOOD_COLOR, BAD_COLOR, SECONDARY_COLOR, FONT_PATH
-from ...utils import blit_text_center, load_sound, render_not_center_message, render_win_message, load_image, draw_attempts
+from ...scenegraph import SpriteScene, WidgetSprite
+from ..base import StopContinueMixin
+from ...config import GAME_WIDTH, GAME_HEIGHT, ACCENT_COLOR, PRIMARY_COLOR, BG_COLOR, SECONDARY_COLOR, FONT_PATH
+from ...scoring import newton_score
+from ...utils import blit_text_center, load_sound, load_image
+from ...widgets import AttemptsHud, Label, ResultPanel
 
 
-class NewtonAppleScene(Scene):
+class NewtonAppleScene(StopContinueMixin, SpriteScene):
+    playing_state = "falling"
     TOLERANCE = 2
     FALL_SPEED = 150
 
@@ -34,6 +38,21 @@ class NewtonAppleScene(Scene):
         self.snd_success = load_sound("success.wav")
         self.snd_fail = load_sound("fail.wav")
         self.snd_click = load_sound("click.wav")
+
+        # HUD widgets (re-rendered only when their text changes)
+        self.title_label = Label(self.title_font, 60, PRIMARY_COLOR)
+        self.hint_label = Label(self.ui_font, 92, SECONDARY_COLOR)
+        self.diff_label = Label(self.ui_font, GAME_HEIGHT - 28, PRIMARY_COLOR)
+        self.attempts_hud = AttemptsHud(game, pos=(None, 26))
+        self.result_panel = ResultPanel((GAME_WIDTH, GAME_HEIGHT))
+
+        # Moving layers; ground, tree, Newton and title live in the background
+        self.hint_sprite = WidgetSprite(layer=1)
+        self.attempts_sprite = WidgetSprite(layer=1)
+        self.apple_sprite = WidgetSprite(self.apple_img, layer=2)
+        self.diff_sprite = WidgetSprite(layer=3)
+        self.panel_sprite = WidgetSprite(layer=4)
+        self.group.add(self.hint_sprite, self.attempts_sprite, self.apple_sprite, self.diff_sprite, self.panel_sprite)
         self.reset()
 
     def reset(self):
@@ -41,28 +60,7 @@ class NewtonAppleScene(Scene):
         self.apple_y = self.start_y
         self.result = None
         self.error_px = None
-
-    def handle_event(self, e):
-        if e.type == pygame.KEYDOWN:
-            if e.key in (pygame.K_SPACE, pygame.K_RETURN):
-                if self.state == "falling":
-                    self.validate()
-                    self.state = "stopped"
-                elif self.state == "stopped":
-                    # Don't play sounds when clicking to continue
-                    self.validate(play_sounds=False)
-                    score = getattr(self, "score", 0)
-                    success = (self.result == "win")
-                    self.game.complete_minigame(score, success)
-        elif e.type == pygame.MOUSEBUTTONDOWN:
-            if self.state == "falling":
-                self.validate()
-                self.state = "stopped"
-            elif self.state == "stopped":
-                # Don't play sounds when clicking to continue
-                self.validate(play_sounds=False)
-                score = getattr(self, "score", 0)
-                self.game.complete_minigame(score, self.result == "win")
+        self.invalidate()
 
     def update(self, dt):
         if self.state != "falling":
@@ -75,48 +73,50 @@ class NewtonAppleScene(Scene):
 
     def validate(self, play_sounds=True):
         if play_sounds and self.snd_click: self.snd_click.play()
-        self.error_px = abs(self.apple_y - self.target_y)
-        if self.error_px <= self.TOLERANCE:
+        self.error_px, self.score, success = newton_score(self.apple_y, self.target_y, self.start_y, self.end_y,
+                                                          self.TOLERANCE)
+        self.stop_error = self.error_px
+        if success:
             self.result = "win"
             if play_sounds and self.snd_success: self.snd_success.play()
         else:
             self.result = "lose"
             if play_sounds and self.snd_fail: self.snd_fail.play()
-        max_error_for_zero = (self.end_y - self.start_y) / 2
-        raw = int(100 * max(0.0, 1.0 - (self.error_px / max_error_for_zero)))
-        self.score = max(0, min(100, raw))
 
-    def draw(self, screen):
-        screen.fill(BG_COLOR)
+    def build_background(self, surface):
+        surface.fill(BG_COLOR)
         
         # Draw ground behind other objects
-        pygame.draw.rect(screen, self.tree_foliage_color, (0, self.ground_y, GAME_WIDTH, GAME_HEIGHT - self.ground_y))
+        pygame.draw.rect(surface, self.tree_foliage_color, (0, self.ground_y, GAME_WIDTH, GAME_HEIGHT - self.ground_y))
 
-        screen.blit(self.tree_img, self.tree_rect)
-        screen.blit(self.newton_img, self.newton_rect)
+        surface.blits(((self.tree_img, self.tree_rect), (self.newton_img, self.newton_rect)), doreturn=False)
         
         # Draw text on top of tree
-        blit_text_center(screen, self.title_font.render("Arrêtez la pomme au milieu de sa chute !", True, PRIMARY_COLOR), 60)
+        blit_text_center(surface, self.title_label.render("Arrêtez la pomme au milieu de sa chute !"), 60)
+
+    def sync_sprites(self):
         hint = "ESPACE/clic pour ARRÊTER " if self.state == "falling" else "ESPACE/clic pour continuer"
-        blit_text_center(screen, self.ui_font.render(hint, True, SECONDARY_COLOR), 92)
-        draw_attempts(screen, self.game, pos=(None, 26))
+        self.hint_sprite.show(self.hint_label.render(hint), center=(GAME_WIDTH // 2, 92))
+        attempts, topleft = self.attempts_hud.render()
+        if attempts is not None:
+            self.attempts_sprite.show(attempts, topleft=topleft)
 
         apple_x = self.tree_rect.centerx + 30
-        self.apple_rect.center = (apple_x, int(self.apple_y))
-        screen.blit(self.apple_img, self.apple_rect)
+        self.apple_sprite.show(self.apple_img, center=(apple_x, int(self.apple_y)))
         
         diff = abs(self.apple_y - self.target_y)
-        blit_text_center(screen, self.ui_font.render(f"Décalage: {int(diff)} px (Tolérance: {self.TOLERANCE}px)", True, PRIMARY_COLOR), GAME_HEIGHT - 28)
+        diff_text = f"Décalage: {int(diff)} px (Tolérance: {self.TOLERANCE}px)"
+        self.diff_sprite.show(self.diff_label.render(diff_text), center=(GAME_WIDTH // 2, GAME_HEIGHT - 28))
         if self.state == "stopped":
-            overlay = pygame.Surface((GAME_WIDTH, GAME_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 150))
-            screen.blit(overlay, (0, 0))
+            t1 = self.result_panel.title(self.result == "win", self.title_font, self.title_font_small)
             if self.result == "win":
-                t1 = render_win_message(self.title_font)
-                t2 = self.ui_font.render(f"Erreur: {int(self.error_px)} px (≤ {self.TOLERANCE}px)", True, PRIMARY_COLOR)
+                t2 = f"Erreur: {int(self.error_px)} px (≤ {self.TOLERANCE}px)"
             else:
-                t1 = render_not_center_message(self.title_font_small)
-                t2 = self.ui_font.render(f"Erreur: {int(self.error_px)} px (> {self.TOLERANCE}px)", True, PRIMARY_COLOR)
-            blit_text_center(screen, t1, GAME_HEIGHT // 2 - 10)
-            blit_text_center(screen, t2, GAME_HEIGHT // 2 + 26)
-            blit_text_center(screen, self.ui_font.render(f"Score: {getattr(self, 'score', 0)}", True, PRIMARY_COLOR), GAME_HEIGHT // 2 + 50)
\ No newline at end of file
+                t2 = f"Erreur: {int(self.error_px)} px (> {self.TOLERANCE}px)"
+            self.panel_sprite.show(self.result_panel.render([
+                (*t1, GAME_HEIGHT // 2 - 10),
+                (self.ui_font, t2, PRIMARY_COLOR, GAME_HEIGHT // 2 + 26),
+                (self.ui_font, f"Score: {getattr(self, 'score', 0)}", PRIMARY_COLOR, GAME_HEIGHT // 2 + 50),
+            ]), topleft=(0, 0))
+        else:
+            self.panel_sprite.hide()
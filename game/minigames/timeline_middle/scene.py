@@ -1,14 +1,21 @@
 import math
 import os
 import random
+from array import array
+from collections import OrderedDict
 import pygame
 from ...core import Scene
-from ...config import WIDTH, HEIGHT, PRIMARY_COLOR, BG_COLOR, ACCENT_COLOR, GOOD_COLOR, BAD_COLOR, SECONDARY_COLOR, IMG_DIR, FONT_PATH
-from ...utils import blit_text_center, load_image, load_sound, render_not_center_message, render_win_message, draw_attempts
-from .data import IPHONE_MODELS
+from ..base import StopContinueMixin
+from ...config import WIDTH, HEIGHT, PRIMARY_COLOR, BG_COLOR, ACCENT_COLOR, SECONDARY_COLOR, IMG_DIR, FONT_PATH, TIMELINE_PACK, TIMELINE_SPRITE_CACHE, TIMELINE_PREFETCH_CARDS
+from ...atlas import load_atlas
+from ...content import load_pack
+from ...scoring import timeline_score
+from ...utils import load_image, load_sound
+from ...widgets import AttemptsHud, Label, ResultPanel
 
 
-class TimelineMiddleScene(Scene):
+class TimelineMiddleScene(StopContinueMixin, Scene):
+    playing_state = "scrolling"
     SCROLL_SPEED = 400
     CARD_W = 320
     CARD_H = 220
@@ -22,61 +29,98 @@ class TimelineMiddleScene(Scene):
         self.card_title_font = pygame.font.Font(FONT_PATH, 26)
         self.card_desc_font = pygame.font.Font(FONT_PATH, 24)
 
-        self.cards = self._build_cards(IPHONE_MODELS)
+        self.pack = load_pack(TIMELINE_PACK)
+        self.cards = self._build_cards(self.pack)
+        # LRU of rendered card sprites keyed by position in self.cards;
+        # images are decoded only when a card approaches the viewport
+        self.sprites = OrderedDict()
+        # Baked atlas (one decode for every card image) when available
+        self.atlas = load_atlas("iphone")
         self.scroll_x = 0.0
         self.state = "scrolling"
         self.result = None
         self.error_idx = None
-        # Middle year is arithmetic midpoint between min and max years (not median of entries)
-        years_sorted = sorted([c["year"] for c in self.cards])
-        if years_sorted:
-            self.year_min = years_sorted[0]
-            self.year_max = years_sorted[-1]
-            self.middle_year_value = (self.year_min + self.year_max) / 2.0
-        else:
-            self.year_min = 0
-            self.year_max = 0
-            self.middle_year_value = 0.0
+        # Middle year is arithmetic midpoint between min and max years (not median of entries),
+        # precomputed in the pack header
+        self.year_min = self.pack.year_min
+        self.year_max = self.pack.year_max
+        self.middle_year_value = self.pack.midpoint
 
         self.snd_success = load_sound("success.wav")
         self.snd_fail = load_sound("fail.wav")
         self.snd_click = load_sound("click.wav")
 
-    def _build_cards(self, items):
-        # Shuffle items so timeline is not ordered
-        items_list = list(items)
-        random.shuffle(items_list)
-        cards = []
-        for year, label in items_list:
-            # Image path convention: IMG_DIR/timeline/iphone/<label>.png (spaces allowed)
-            img_path = os.path.join(IMG_DIR, "timeline", "iphone", f"{label}.png")
-            img = load_image(img_path, max_w=self.CARD_W - 24, max_h=120)
-            cards.append({
-                "year": year,
-                "label": label,
-                "image": img,
-            })
+        # HUD widgets (re-rendered only when their text changes)
+        self.title_label = Label(self.title_font, 56, PRIMARY_COLOR)
+        self.hint_label = Label(self.ui_font, 86, SECONDARY_COLOR)
+        self.attempts_hud = AttemptsHud(game, pos=(None, 26))
+        self.result_panel = ResultPanel((WIDTH, HEIGHT))
+
+    def _build_cards(self, pack):
+        # Shuffle pack indices so timeline is not ordered; items are read lazily.
+        # 4 bytes per card in an array, not a list of ints
+        cards = array("I", range(len(pack)))
+        random.shuffle(cards)
         return cards
 
-    def handle_event(self, e):
-        if e.type == pygame.KEYDOWN:
-            if e.key in (pygame.K_SPACE, pygame.K_RETURN):
-                if self.state == "scrolling":
-                    self._validate(); self.state = "stopped"
-                elif self.state == "stopped":
-                    # Don't play sounds when clicking to continue
-                    self._validate(play_sounds=False)
-                    score = getattr(self, "score", 0)
-                    success = (self.result == "win")
-                    self.game.complete_minigame(score, success)
-        elif e.type == pygame.MOUSEBUTTONDOWN:
-            if self.state == "scrolling":
-                self._validate(); self.state = "stopped"
-            elif self.state == "stopped":
-                # Don't play sounds when clicking to continue
-                self._validate(play_sounds=False)
-                score = getattr(self, "score", 0)
-                self.game.complete_minigame(score, self.result == "win")
+    def _card_sprite(self, idx):
+        sprite = self.sprites.get(idx)
+        if sprite is not None:
+            self.sprites.move_to_end(idx)
+            return sprite
+        item = self.pack.item(self.cards[idx])
+        # Image name is relative to IMG_DIR, e.g. timeline/iphone/<label>.png (spaces allowed)
+        img = self.atlas.get(item.image) if self.atlas else None
+        if img is None:
+            img_path = os.path.join(IMG_DIR, item.image)
+            img = load_image(img_path, max_w=self.CARD_W - 24, max_h=120)
+        sprite = self._render_card({"year": item.start, "label": item.label, "image": img})
+        self.sprites[idx] = sprite
+        if len(self.sprites) > TIMELINE_SPRITE_CACHE:
+            self.sprites.popitem(last=False)
+        return sprite
+
+    def _visible_range(self):
+        """Range of slot offsets n (relative to first_index) whose card overlaps the screen."""
+        card_span = self.CARD_W + self.GAP
+        base = WIDTH // 2 - self.CARD_W // 2 - (self.scroll_x % card_span)
+        n_min = math.floor((-self.CARD_W - base) / card_span)
+        n_max = math.ceil((WIDTH - base) / card_span)
+        return n_min, n_max
+
+    def _render_card(self, card):
+        """Render a card (background, image, label band) once into a sprite."""
+        sprite = pygame.Surface((self.CARD_W, self.CARD_H), pygame.SRCALPHA)
+        rect = sprite.get_rect()
+        # Card background
+        pygame.draw.rect(sprite, (40, 45, 55), rect, border_radius=10)
+        pygame.draw.rect(sprite, (80, 90, 100), rect, width=2, border_radius=10)
+        # Image
+        img = card["image"]
+        if img:
+            img_rect = img.get_rect(midtop=(rect.centerx, rect.top + 14))
+            sprite.blit(img, img_rect)
+        # Text with backdrop and slight shadow for readability
+        label_surf = self.card_desc_font.render(card["label"], True, (240, 245, 255))
+        label_rect = label_surf.get_rect(midtop=(rect.centerx, rect.bottom - 34))
+        # Backdrop band
+        band_h = 40
+        band_rect = pygame.Rect(rect.left + 6, rect.bottom - band_h - 6, rect.width - 12, band_h)
+        overlay = pygame.Surface((band_rect.width, band_rect.height), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 120))
+        sprite.blit(overlay, band_rect.topleft)
+        # Shadow
+        shadow = self.card_desc_font.render(card["label"], True, (0, 0, 0))
+        sprite.blit(shadow, (label_rect.x + 1, label_rect.y + 1))
+        # Text
+        sprite.blit(label_surf, label_rect)
+        return sprite.convert_alpha()
+
+    def reset(self):
+        """New round with the cards dealt again, as in a new scene."""
+        self.cards = self._build_cards(self.pack)
+        self.sprites.clear()
+        self._reset()
 
     def _reset(self):
         self.scroll_x = 0.0
@@ -96,7 +140,7 @@ class TimelineMiddleScene(Scene):
         if loop_len > 0:
             self.scroll_x = self.scroll_x % loop_len
 
-    def _validate(self, play_sounds=True):
+    def validate(self, play_sounds=True):
         if play_sounds and self.snd_click:
             self.snd_click.play()
         # Which card is at the screen center? Match the draw logic exactly
@@ -108,10 +152,12 @@ class TimelineMiddleScene(Scene):
         first_index = int(self.scroll_x // card_span) % total
         frac = (self.scroll_x % card_span) / card_span  # in [0,1)
         nearest_idx = (first_index + int(round(frac))) % total
-        selected_year = self.cards[nearest_idx]["year"]
+        selected_year = self.pack.start_year(self.cards[nearest_idx])
 
-        # Win if selected year equals exact arithmetic midpoint
-        if abs(selected_year - self.middle_year_value) == 0:
+        # Win if selected year equals exact arithmetic midpoint; score scaled by distance to it
+        self.stop_error = abs(selected_year - self.middle_year_value)  # years
+        self.score, success = timeline_score(selected_year, self.middle_year_value, self.year_min, self.year_max)
+        if success:
             self.result = "win"
             if play_sounds and self.snd_success:
                 self.snd_success.play()
@@ -119,58 +165,35 @@ class TimelineMiddleScene(Scene):
             self.result = "lose"
             if play_sounds and self.snd_fail:
                 self.snd_fail.play()
-        # Score scaled by distance to arithmetic midpoint
-        span = max(1.0, float(self.year_max - self.year_min))
-        year_range_half = max(1.0, span / 2.0)
-        year_distance = abs(selected_year - self.middle_year_value)
-        raw = int(100 * max(0.0, 1.0 - (year_distance / year_range_half)))
-        self.score = max(0, min(100, raw))
 
     def draw(self, screen):
         screen.fill(BG_COLOR)
-        blit_text_center(screen, self.title_font.render("Stoppe au milieu de l'histoire (iPhone)", True, PRIMARY_COLOR), 56)
+        self.title_label.draw(screen, "Stoppe au milieu de l'histoire (iPhone)")
         hint = "ESPACE/clic pour ARRÊTER" if self.state == "scrolling" else "ESPACE/clic pour continuer"
-        blit_text_center(screen, self.ui_font.render(hint, True, SECONDARY_COLOR), 86)
-        draw_attempts(screen, self.game, pos=(None, 26))
+        self.hint_label.draw(screen, hint)
+        self.attempts_hud.draw(screen)
 
         # Draw cards horizontally with current scroll offset
         card_span = self.CARD_W + self.GAP
         start_x = - (self.scroll_x % card_span)
         y = HEIGHT // 2 - self.CARD_H // 2 + 10
-        # Draw extra copies on both sides to avoid early popping
-        padding = 2
-        total_draw = len(self.cards) + padding * 2 + 1
-        first_index = int(self.scroll_x // card_span) % len(self.cards)
-        for n in range(-padding, -padding + total_draw):
-            idx = (first_index + n) % len(self.cards)
-            card = self.cards[idx]
+        total = len(self.cards)
+        first_index = int(self.scroll_x // card_span) % total
+        n_min, n_max = self._visible_range()
+        for n in range(n_min, n_max + 1):
+            idx = (first_index + n) % total
             x = start_x + n * card_span - self.CARD_W // 2 + WIDTH // 2
             rect = pygame.Rect(int(x), int(y), self.CARD_W, self.CARD_H)
             # Cull strictly off-screen so cards disappear only when fully outside
             if rect.right <= 0 or rect.left >= WIDTH:
                 continue
-            # Card background
-            pygame.draw.rect(screen, (40, 45, 55), rect, border_radius=10)
-            pygame.draw.rect(screen, (80, 90, 100), rect, width=2, border_radius=10)
-            # Image
-            img = card["image"]
-            if img:
-                img_rect = img.get_rect(midtop=(rect.centerx, rect.top + 14))
-                screen.blit(img, img_rect)
-            # Text with backdrop and slight shadow for readability
-            label_surf = self.card_desc_font.render(card["label"], True, (240, 245, 255))
-            label_rect = label_surf.get_rect(midtop=(rect.centerx, rect.bottom - 34))
-            # Backdrop band
-            band_h = 40
-            band_rect = pygame.Rect(rect.left + 6, rect.bottom - band_h - 6, rect.width - 12, band_h)
-            overlay = pygame.Surface((band_rect.width, band_rect.height), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 120))
-            screen.blit(overlay, band_rect.topleft)
-            # Shadow
-            shadow = self.card_desc_font.render(card["label"], True, (0, 0, 0))
-            screen.blit(shadow, (label_rect.x + 1, label_rect.y + 1))
-            # Text
-            screen.blit(label_surf, label_rect)
+            screen.blit(self._card_sprite(idx), rect.topleft)
+        # Warm the cache for the next card entering from the right (one decode per frame at most)
+        for n in range(n_max + 1, n_max + 1 + TIMELINE_PREFETCH_CARDS):
+            idx = (first_index + n) % total
+            if idx not in self.sprites:
+                self._card_sprite(idx)
+                break
 
         # Draw center cursor on top of images
         cursor_y0 = 120
@@ -178,18 +201,13 @@ class TimelineMiddleScene(Scene):
         pygame.draw.line(screen, ACCENT_COLOR, (WIDTH // 2, cursor_y0), (WIDTH // 2, cursor_y1), 2)
 
         if self.state == "stopped":
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 150))
-            screen.blit(overlay, (0, 0))
+            t1 = self.result_panel.title(self.result == "win", self.title_font, self.title_font_small)
             if self.result == "win":
-                t1 = render_win_message(self.title_font)
-                t2 = self.ui_font.render("Tu as stoppé au milieu de l'histoire.", True, PRIMARY_COLOR)
+                t2 = "Tu as stoppé au milieu de l'histoire."
             else:
-                t1 = render_not_center_message(self.title_font_small)
-                t2 = self.ui_font.render("Ce n'était pas le milieu exact.", True, PRIMARY_COLOR)
-            blit_text_center(screen, t1, HEIGHT // 2 - 8)
-            blit_text_center(screen, t2, HEIGHT // 2 + 24)
-            blit_text_center(screen, self.ui_font.render(f"Score: {getattr(self, 'score', 0)}", True, PRIMARY_COLOR), HEIGHT // 2 + 48)
-
-
-
+                t2 = "Ce n'était pas le milieu exact."
+            self.result_panel.draw(screen, [
+                (*t1, HEIGHT // 2 - 8),
+                (self.ui_font, t2, PRIMARY_COLOR, HEIGHT // 2 + 24),
+                (self.ui_font, f"Score: {getattr(self, 'score', 0)}", PRIMARY_COLOR, HEIGHT // 2 + 48),
+            ])
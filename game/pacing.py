@@ -0,0 +1,182 @@
+"""Idle-aware, high-precision frame pacing.
+
+While the top scene animates, frames are paced at FPS against absolute
+``time.perf_counter_ns`` deadlines: the wait sleeps until PACING_SPIN_US
+before the deadline (``time.sleep`` wakes up late by up to a
+millisecond or more) and spins for the rest. The next deadline is the
+previous one plus the period, so an early or late wake-up is paid back
+on the next frame instead of accumulating; after a frame that overran
+by more than a period the schedule restarts from now (no burst of short
+frames to catch up).
+
+When the top scene reports ``is_animating() == False`` (menus,
+leaderboard, result overlays) the loop blocks in ``pygame.event.wait``
+for at most IDLE_WAIT_MS instead: the first input wakes it up and the
+next frames run at full rate again.
+
+Scene updates get either the measured dt (variable step) or, with
+PACING_FIXED_STEP, whole 1/FPS steps taken from an accumulator of the
+measured time (``FramePacer.steps``), at most PACING_MAX_STEPS per frame.
+
+The deviation of each active frame interval from the period is kept in a
+histogram (JITTER_BUCKET_US buckets). CPU time (``time.process_time``)
+and wall time are accounted per mode so the saving can be checked on the
+target machine: set PACING_REPORT_INTERVAL or run ``python -m game.bench
+pacing`` (``jitter`` compares with ``Clock.tick``).
+"""
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+from .config import (FPS, IDLE_PACING, IDLE_WAIT_MS, PACING_FIXED_STEP, PACING_MAX_STEPS, PACING_REPORT_INTERVAL,
+                     PACING_SPIN_US)
+
+
+MODE_ACTIVE = "active"
+MODE_IDLE = "idle"
+
+JITTER_BUCKET_US = 100
+
+
+def jitter_percentile(hist: Counter, q: float) -> Optional[int]:
+    """Upper edge (µs) of the bucket holding the ``q`` quantile, None when empty."""
+    total = sum(hist.values())
+    if not total:
+        return None
+    rank = q * total
+    seen = 0
+    for bucket in sorted(hist):
+        seen += hist[bucket]
+        if seen >= rank:
+            return (bucket + 1) * JITTER_BUCKET_US
+    return (max(hist) + 1) * JITTER_BUCKET_US
+
+
+class FramePacer:
+    def __init__(self, clock, fps=FPS, idle_wait_ms=IDLE_WAIT_MS, enabled=IDLE_PACING,
+                 report_interval=PACING_REPORT_INTERVAL, spin_us=PACING_SPIN_US, fixed_step=PACING_FIXED_STEP,
+                 max_steps=PACING_MAX_STEPS):
+        self.clock = clock  # still ticked (unthrottled): Clock.get_fps keeps working
+        self.fps = fps
+        self.idle_wait_ms = idle_wait_ms
+        self.enabled = enabled
+        self.report_interval = report_interval
+        self.spin_us = spin_us
+        self.fixed_step = fixed_step
+        self.max_steps = max_steps
+        self.mode = MODE_ACTIVE
+        # mode → [wall seconds, cpu seconds]
+        self.totals: Dict[str, list] = {MODE_ACTIVE: [0.0, 0.0], MODE_IDLE: [0.0, 0.0]}
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+        self._last_report = self._wall
+        # |frame interval - period| in JITTER_BUCKET_US buckets (active frames only)
+        self.jitter: Counter = Counter()
+        self.resyncs = 0  # frames that overran by more than a period
+        self._deadline: Optional[int] = None
+        self._last_frame = time.perf_counter_ns()
+        self._accumulator = 0  # fixed step: measured time not yet handed to updates (ns)
+
+    def wait(self, animating: bool) -> Tuple[float, tuple]:
+        """Wait for the next frame; returns (dt, events taken off the queue while waiting)."""
+        self._account()
+        self.clock.tick()
+        if animating or not self.enabled:
+            if self.mode != MODE_ACTIVE:
+                self._deadline = None  # back from idle: don't measure the wait as jitter
+            self.mode = MODE_ACTIVE
+            now = self._wait_deadline()
+            dt = now - self._last_frame
+            self._last_frame = now
+            return dt / 1e9, ()
+        self.mode = MODE_IDLE
+        event = pygame.event.wait(self.idle_wait_ms)
+        pending = () if event.type == pygame.NOEVENT else (event,)
+        now = time.perf_counter_ns()
+        # Nothing moves while idle: don't hand a long wait to the next update as dt
+        dt = min(now - self._last_frame, self._period())
+        self._last_frame = now
+        return dt / 1e9, pending
+
+    def steps(self, dt: float) -> List[float]:
+        """The update dts for a frame of measured ``dt``: ``[dt]``, or whole 1/fps steps."""
+        period = self._period()
+        if not self.fixed_step or not period:
+            return [dt]
+        self._accumulator += round(dt * 1e9)
+        count = self._accumulator // period
+        if count > self.max_steps:
+            # Too far behind: drop the backlog rather than spiral
+            count = self.max_steps
+            self._accumulator = 0
+        else:
+            self._accumulator -= count * period
+        return [period / 1e9] * count
+
+    def _period(self) -> int:
+        return round(1e9 / self.fps) if self.fps else 0
+
+    def _wait_deadline(self) -> int:
+        period = self._period()
+        now = time.perf_counter_ns()
+        if not period:
+            self._deadline = None
+            return now
+        # Intervals are only measured against a running schedule
+        measured = self._deadline is not None
+        if self._deadline is None:
+            self._deadline = now + period
+        else:
+            self._deadline += period
+            if now - self._deadline > period:
+                # Overran by more than a frame: restart the schedule from now
+                self.resyncs += 1
+                self._deadline = now + period
+                measured = False
+        remaining = self._deadline - now
+        sleep_ns = remaining - self.spin_us * 1000
+        if sleep_ns > 0:
+            time.sleep(sleep_ns / 1e9)
+        while time.perf_counter_ns() < self._deadline:
+            pass
+        now = time.perf_counter_ns()
+        if measured:
+            self.jitter[abs(now - self._last_frame - period) // (JITTER_BUCKET_US * 1000)] += 1
+        return now
+
+    def _account(self):
+        wall, cpu = time.perf_counter(), time.process_time()
+        totals = self.totals[self.mode]
+        totals[0] += wall - self._wall
+        totals[1] += cpu - self._cpu
+        self._wall, self._cpu = wall, cpu
+        if self.report_interval and wall - self._last_report >= self.report_interval:
+            self._last_report = wall
+            print(self.report())
+
+    def cpu_ms_per_second(self, mode: str) -> float:
+        wall, cpu = self.totals[mode]
+        return cpu * 1000.0 / wall if wall > 0 else 0.0
+
+    def jitter_report(self) -> str:
+        if not self.jitter:
+            return "jitter: no paced frames"
+        p50, p99 = jitter_percentile(self.jitter, 0.5), jitter_percentile(self.jitter, 0.99)
+        worst = (max(self.jitter) + 1) * JITTER_BUCKET_US
+        return (f"jitter: p50 <{p50} us, p99 <{p99} us, max <{worst} us over {sum(self.jitter.values())} frames, "
+                f"{self.resyncs} resyncs")
+
+    def report(self) -> str:
+        parts = [f"{mode} {self.cpu_ms_per_second(mode):.1f} ms cpu/s over {self.totals[mode][0]:.1f} s"
+                 for mode in (MODE_ACTIVE, MODE_IDLE)]
+        return "pacing: " + ", ".join(parts) + "; " + self.jitter_report()
+
+    def reset_stats(self):
+        for totals in self.totals.values():
+            totals[0] = totals[1] = 0.0
+        self._wall, self._cpu = time.perf_counter(), time.process_time()
+        self.jitter.clear()
+        self.resyncs = 0
+        self._deadline = None
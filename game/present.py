@@ -0,0 +1,259 @@
+"""Presentation backends: put the composed WIDTH×HEIGHT frame on the window.
+
+- ``SoftwarePresenter``: ``transform.scale`` to the window surface + ``display.flip``
+  (the original path).
+- ``RendererPresenter``: ``pygame._sdl2.video`` Window/Renderer; the frame is
+  uploaded once per frame to a streaming texture and the renderer scales it.
+  Works with SDL's software renderer (no GPU needed).
+
+``python -m game.bench present`` compares both at 1080p and 4K.
+
+``PipelinedPresenter`` (PRESENT_PIPELINE) wraps either backend and moves
+the per-frame compositing (bezel, game surface, scanlines) and the window
+scaling to a worker thread: the main thread copies the finished game
+surface into one of two hand-off buffers and goes on with the next frame
+while the worker composites the previous one. pygame's blitters and
+``transform.scale`` release the GIL, so both stages can overlap on two
+cores; the frame is shown one frame later. The worker scales into a
+staging surface of the pipeline, never into the window surface (pygame
+replaces it on resize, from the main thread); the main thread copies it
+to the window when flipping. An exception on the worker is raised again
+by the next ``submit`` / ``sync``. ``python -m game.bench
+pipeline`` measures throughput and latency against the direct path.
+"""
+import threading
+import time
+
+import pygame
+from .config import WIDTH, HEIGHT, GAME_WIDTH, GAME_HEIGHT, TITLE
+from .utils import draw_80s_computer_frame, get_game_area_rect
+
+
+def compose_frame(frame_surface, game_surface, scanlines):
+    """Bezel + game content + scanlines into the WIDTH×HEIGHT frame."""
+    draw_80s_computer_frame(frame_surface)
+    # Scanlines go on the frame so the game surface keeps its content
+    # between frames (dirty-rect scenes)
+    game_area = get_game_area_rect()
+    frame_surface.blit(game_surface, game_area.topleft)
+    if scanlines is not None:  # None: low quality tier
+        frame_surface.blit(scanlines, game_area.topleft)
+    return frame_surface
+
+
+class SoftwarePresenter:
+    name = "software"
+
+    def __init__(self, size=(WIDTH, HEIGHT)):
+        self.screen = pygame.display.set_mode(size, pygame.RESIZABLE)
+
+    def get_size(self):
+        return self.screen.get_size()
+
+    def resize(self, size):
+        self.screen = pygame.display.set_mode(size, pygame.RESIZABLE)
+
+    def present(self, frame_surface):
+        self.flip(self.prepare(frame_surface))
+
+    def prepare(self, frame_surface, staging=None):
+        """CPU part of present: scale into ``staging`` (any thread) or the window surface (main thread)."""
+        target = self.screen if staging is None else staging
+        pygame.transform.scale(frame_surface, target.get_size(), target)
+        return target
+
+    def flip(self, prepared):
+        """Show a prepared frame (main thread)."""
+        if prepared is not self.screen:
+            self.screen.blit(prepared, (0, 0))
+        pygame.display.flip()
+
+
+class RendererPresenter:
+    name = "renderer"
+
+    def __init__(self, size=(WIDTH, HEIGHT), accelerated=-1):
+        from pygame._sdl2.video import Window, Renderer, Texture
+        # A window used by the display module cannot get a renderer; convert()/convert_alpha()
+        # still need a display mode, so a hidden 1×1 one provides the pixel format
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+        self.screen = None
+        self.window = Window(TITLE, size=size, resizable=True)
+        try:
+            self.renderer = Renderer(self.window, accelerated=accelerated)
+        except Exception:
+            # No accelerated driver: SDL's software renderer
+            self.renderer = Renderer(self.window, accelerated=0)
+        self.texture = Texture(self.renderer, (WIDTH, HEIGHT), streaming=True)
+
+    def get_size(self):
+        return self.window.size
+
+    def resize(self, size):
+        # The window is already resized by SDL; the renderer scales to its output size
+        pass
+
+    def present(self, frame_surface):
+        self.flip(self.prepare(frame_surface))
+
+    def prepare(self, frame_surface, staging=None):
+        # The upload belongs to the thread that owns the renderer: done in flip
+        return frame_surface
+
+    def flip(self, prepared):
+        self.texture.update(prepared)
+        self.renderer.clear()
+        self.texture.draw()
+        self.renderer.present()
+
+    def close(self):
+        self.window.destroy()
+
+
+class PipelinedPresenter:
+    """Two-stage presentation: composite + scale on a worker thread, flip on the main thread."""
+
+    name = "pipelined"
+
+    def __init__(self, presenter):
+        self.presenter = presenter
+        # Hand-off copies of the game surface: the worker reads one while the
+        # main thread fills the other (the game surface itself stays with the
+        # scenes, which rely on it keeping its content)
+        self.buffers = [pygame.Surface((GAME_WIDTH, GAME_HEIGHT)) for _ in range(2)]
+        self.frame_surface = pygame.Surface((WIDTH, HEIGHT))
+        # Window-sized target of the worker's scaling (software backend only)
+        self._staging = None
+        self._next = 0
+        self._job = None  # (buffer, scanlines, staging, submitted at, capture tag)
+        self._prepared = None  # (submitted at, prepared frame) ready to flip
+        self._error = None  # raised by the worker, re-raised on the main thread
+        self._cond = threading.Condition()
+        self._stopping = False
+        # Optional game.capture.FrameCapture fed with the composed frames (on the worker)
+        self.capture = None
+        # Latency (submit → flip) and worker time, in seconds
+        self.frames = 0
+        self.latency_total = 0.0
+        self.worker_total = 0.0
+        self._thread = threading.Thread(target=self._run, name="render-compositor", daemon=True)
+        self._thread.start()
+
+    @property
+    def screen(self):
+        return self.presenter.screen
+
+    def get_size(self):
+        return self.presenter.get_size()
+
+    def resize(self, size):
+        self.sync()
+        self.presenter.resize(size)
+
+    def submit(self, game_surface, scanlines, capture_tag=None):
+        """Hand this frame's game surface to the worker; shows the previous frame."""
+        submitted = time.perf_counter()
+        buffer = self.buffers[self._next]
+        self._next ^= 1
+        buffer.blit(game_surface, (0, 0))
+        self._wait_idle()
+        self._flip_prepared()
+        staging = self._staging_surface()
+        with self._cond:
+            self._job = (buffer, scanlines, staging, submitted, capture_tag)
+            self._cond.notify()
+
+    def present(self, frame_surface):
+        """Direct presentation (CRT effects): drains the pipeline first."""
+        self.sync()
+        self.presenter.present(frame_surface)
+
+    def sync(self):
+        """Wait for the worker and show the frame it was working on."""
+        self._wait_idle()
+        self._flip_prepared()
+
+    def latency_ms(self):
+        return self.latency_total * 1000.0 / self.frames if self.frames else 0.0
+
+    def worker_ms(self):
+        return self.worker_total * 1000.0 / self.frames if self.frames else 0.0
+
+    def close(self):
+        self.sync()
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+        self._thread.join()
+        if hasattr(self.presenter, "close"):
+            self.presenter.close()
+
+    def _staging_surface(self):
+        """Worker target at the current window size (main thread, worker idle); None: no window surface."""
+        screen = self.presenter.screen
+        if screen is None:
+            return None
+        if self._staging is None or self._staging.get_size() != screen.get_size():
+            # Same format as the window: the copy in flip is a plain memcpy
+            self._staging = pygame.Surface(screen.get_size(), 0, screen)
+        return self._staging
+
+    def _wait_idle(self):
+        with self._cond:
+            while self._job is not None:
+                self._cond.wait()
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def _flip_prepared(self):
+        if self._prepared is None:
+            return
+        submitted, prepared = self._prepared
+        self._prepared = None
+        self.presenter.flip(prepared)
+        self.latency_total += time.perf_counter() - submitted
+        self.frames += 1
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._job is None and not self._stopping:
+                    self._cond.wait()
+                if self._job is None:
+                    return
+                buffer, scanlines, staging, submitted, capture_tag = self._job
+            prepared = None
+            try:
+                start = time.perf_counter()
+                compose_frame(self.frame_surface, buffer, scanlines)
+                if self.capture is not None:
+                    self.capture.add(self.frame_surface, capture_tag)
+                prepared = (submitted, self.presenter.prepare(self.frame_surface, staging))
+                self.worker_total += time.perf_counter() - start
+            except BaseException as exc:
+                self._error = exc
+            finally:
+                # Always release the main thread, even when the frame failed
+                with self._cond:
+                    self._prepared = prepared
+                    self._job = None
+                    self._cond.notify_all()
+
+
+PRESENTERS = {
+    SoftwarePresenter.name: SoftwarePresenter,
+    RendererPresenter.name: RendererPresenter,
+}
+
+
+def create_presenter(name, size=(WIDTH, HEIGHT), pipelined=False):
+    """Build the requested backend, falling back to the software path."""
+    cls = PRESENTERS.get(name, SoftwarePresenter)
+    try:
+        presenter = cls(size)
+    except Exception:
+        if cls is SoftwarePresenter:
+            raise
+        presenter = SoftwarePresenter(size)
+    return PipelinedPresenter(presenter) if pipelined else presenter
@@ -0,0 +1,168 @@
+"""Quality tiers: picked by a startup micro-benchmark, adjusted at runtime.
+
+QUALITY_TIERS (config.py) lists the render-cost knobs of each tier, best
+first:
+- ``fps``: frame rate of the pacer;
+- ``smoothscale``: filtered (``smoothscale``) or nearest-neighbour
+  (``scale``) resizing in ``load_image`` and the comic's ``fit_image``;
+- ``scanline_alpha``: CRT scanline overlay (0: no overlay, one full-frame
+  alpha blit less);
+- ``comic_shadows`` / ``comic_pulse``: drop shadows of the comic tiles and
+  pulsing highlight (a constant alpha repaints nothing between moves);
+- ``crt_ms``: CRT shutdown / power-on around the leaderboard (0: none).
+
+With QUALITY_TIER = "auto", ``Game.run`` first draws QUALITY_BENCH_FRAMES
+frames of each tier offscreen (bezel, alpha cards, scanlines, composed and
+scaled to the window size, never flipped: nothing shows on the window) and
+keeps the best tier whose frame fits in
+QUALITY_HEADROOM of its frame budget. While playing, the governor takes
+the median work per animated frame (input, update, draw, present; not the
+wait) over QUALITY_WINDOW frames: above QUALITY_DOWN of the budget it
+steps one tier down; after QUALITY_UP_WINDOWS windows in a row under
+QUALITY_UP of the better tier's budget it steps back up.
+
+``python -m game.bench quality`` prints the startup measurement.
+"""
+import statistics
+import time
+from typing import Dict, List, NamedTuple, Tuple
+
+import pygame
+
+from .config import (BG_COLOR, GAME_HEIGHT, GAME_WIDTH, QUALITY_BENCH_FRAMES, QUALITY_DOWN, QUALITY_GOVERNOR,
+                     QUALITY_HEADROOM, QUALITY_TIER, QUALITY_TIERS, QUALITY_UP, QUALITY_UP_WINDOWS, QUALITY_WINDOW,
+                     WIDTH, HEIGHT)
+
+
+class QualityTier(NamedTuple):
+    name: str
+    fps: int
+    smoothscale: bool
+    scanline_alpha: int
+    comic_shadows: bool
+    comic_pulse: bool
+    crt_ms: int
+
+
+TIERS: List[QualityTier] = [QualityTier(name, **knobs) for name, knobs in QUALITY_TIERS.items()]
+
+# Read by the loaders and scenes when they build or draw
+_current = TIERS[0]
+
+
+def current_tier() -> QualityTier:
+    return _current
+
+
+def get_tier(name: str) -> QualityTier:
+    for tier in TIERS:
+        if tier.name == name:
+            return tier
+    raise ValueError(f"quality tier must be 'auto' or one of {[t.name for t in TIERS]}, got {name!r}")
+
+
+def benchmark_tier(presenter, tier: QualityTier, frames: int = QUALITY_BENCH_FRAMES) -> float:
+    """Mean ms of a representative frame drawn, composed and scaled to the window at ``tier`` (not shown)."""
+    from .present import compose_frame
+    from .utils import create_scanlines
+
+    game_surface = pygame.Surface((GAME_WIDTH, GAME_HEIGHT))
+    frame_surface = pygame.Surface((WIDTH, HEIGHT))
+    scanlines = create_scanlines(GAME_WIDTH, GAME_HEIGHT, alpha=tier.scanline_alpha) if tier.scanline_alpha else None
+    card = pygame.Surface((GAME_WIDTH // 5, GAME_HEIGHT // 2), pygame.SRCALPHA)
+    pygame.draw.rect(card, (30, 34, 44), card.get_rect(), border_radius=16)
+    shadow = None
+    if tier.comic_shadows:
+        shadow = pygame.Surface(card.get_size(), pygame.SRCALPHA)
+        pygame.draw.rect(shadow, (0, 0, 0, 70), shadow.get_rect(), border_radius=16)
+    # The backend's CPU part of present into a surface of our own (the pipeline's worker is idle here)
+    backend = getattr(presenter, "presenter", presenter)
+    screen = backend.screen
+    staging = pygame.Surface(screen.get_size(), 0, screen) if screen is not None else None
+    compose_frame(frame_surface, game_surface, scanlines)
+    backend.prepare(frame_surface, staging)  # warm-up
+    start = time.perf_counter()
+    for _ in range(frames):
+        game_surface.fill(BG_COLOR)
+        for col in range(4):
+            pos = (24 + col * (card.get_width() + 24), 120)
+            if shadow is not None:
+                game_surface.blit(shadow, (pos[0], pos[1] + 8))
+            game_surface.blit(card, pos)
+        compose_frame(frame_surface, game_surface, scanlines)
+        backend.prepare(frame_surface, staging)
+    return (time.perf_counter() - start) * 1000.0 / frames
+
+
+def pick_tier(presenter, frames: int = QUALITY_BENCH_FRAMES,
+              headroom: float = QUALITY_HEADROOM) -> Tuple[QualityTier, Dict[str, float]]:
+    """Best tier whose benchmark frame fits ``headroom`` of its budget (else the lowest); also the costs."""
+    costs = {}
+    for tier in TIERS:
+        costs[tier.name] = benchmark_tier(presenter, tier, frames)
+        if costs[tier.name] <= headroom * 1000.0 / tier.fps:
+            return tier, costs
+    return TIERS[-1], costs
+
+
+class QualityGovernor:
+    def __init__(self, game, window: int = QUALITY_WINDOW, down: float = QUALITY_DOWN, up: float = QUALITY_UP,
+                 up_windows: int = QUALITY_UP_WINDOWS, out=print):
+        self.game = game
+        self.window = window
+        self.down = down
+        self.up = up
+        self.up_windows = up_windows
+        self.out = out
+        self.enabled = False  # set by start (Game.run)
+        self.index = 0
+        self.changes = 0
+        self._samples: List[float] = []
+        self._good = 0
+
+    @property
+    def tier(self) -> QualityTier:
+        return TIERS[self.index]
+
+    def start(self, setting: str = QUALITY_TIER, governor: bool = QUALITY_GOVERNOR) -> None:
+        """Pick the starting tier (benchmark for "auto") and arm the governor."""
+        if setting == "auto":
+            tier, costs = pick_tier(self.game.presenter)
+            measured = ", ".join(f"{name} {ms:.1f} ms" for name, ms in costs.items())
+            self.out(f"quality: {measured} per frame -> {tier.name}")
+        else:
+            tier = get_tier(setting)
+        self.apply(TIERS.index(tier))
+        self.enabled = governor
+
+    def apply(self, index: int) -> None:
+        global _current
+        self.index = index
+        _current = TIERS[index]
+        self.game.apply_quality(_current)
+        self._samples = []
+        self._good = 0
+
+    def observe(self, work_ms: float) -> None:
+        """Work time of one animated frame (Game.frame, the wait excluded)."""
+        if not self.enabled:
+            return
+        self._samples.append(work_ms)
+        if len(self._samples) < self.window:
+            return
+        # Median: a scene load or the CRT transition is one slow frame, not a trend
+        typical = statistics.median(self._samples)
+        self._samples = []
+        budget = 1000.0 / self.tier.fps
+        if typical > self.down * budget and self.index < len(TIERS) - 1:
+            self.out(f"quality: {typical:.1f} ms per frame for a {budget:.1f} ms budget -> {TIERS[self.index + 1].name}")
+            self.changes += 1
+            self.apply(self.index + 1)
+        elif self.index > 0 and typical < self.up * 1000.0 / TIERS[self.index - 1].fps:
+            self._good += 1
+            if self._good >= self.up_windows:
+                self.out(f"quality: {typical:.1f} ms per frame, headroom back -> {TIERS[self.index - 1].name}")
+                self.changes += 1
+                self.apply(self.index - 1)
+        else:
+            self._good = 0
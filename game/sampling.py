@@ -0,0 +1,196 @@
+"""No-repeat sampling over content packs.
+
+Each player owns a fixed-size, two-generation Bloom filter of the items
+they have already been shown, persisted next to the leaderboard. Draws
+pick an era stratum (a contiguous index range, packs are sorted by year),
+then examine at most ``LIFE_SAMPLE_PROBES`` candidates, preferring an
+unseen one in the requested lifespan band; exhausted strata fall through
+to the other eras. Draw cost and per-player memory are therefore
+constant whatever the pack size.
+"""
+import hashlib
+import os
+import random
+import struct
+from typing import Dict, List, Optional, Tuple
+
+from .config import LIFE_ERAS, LIFE_LIFESPAN_BANDS, LIFE_SEEN_BITS, LIFE_SEEN_HASHES, LIFE_SAMPLE_PROBES
+from .content import ContentItem, ContentPack
+from .leaderboard import get_data_dir, normalize_username
+
+
+SEEN_DIRNAME = "seen"
+_SEEN_HEADER = struct.Struct("<4sIIII")
+_SEEN_MAGIC = b"GJSS"
+
+
+class SeenFilter:
+    """Bloom filter with two generations so old history ages out.
+
+    When the current generation holds ``capacity`` items it becomes the
+    previous one and a fresh generation starts; lookups check both.
+    """
+
+    def __init__(self, bits: int = LIFE_SEEN_BITS, hashes: int = LIFE_SEEN_HASHES):
+        self.bits = bits
+        self.hashes = hashes
+        # ~1% false positives per generation at this load
+        self.capacity = max(1, bits // 10)
+        self.current = bytearray(bits // 8)
+        self.previous = bytearray(bits // 8)
+        self.count = 0
+        self.prev_count = 0
+
+    def _positions(self, key: bytes):
+        digest = hashlib.blake2b(key, digest_size=8).digest()
+        h1, h2 = struct.unpack("<II", digest)
+        h2 |= 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.bits
+
+    @staticmethod
+    def _test(bitmap, positions) -> bool:
+        return all(bitmap[p >> 3] & (1 << (p & 7)) for p in positions)
+
+    def __contains__(self, key: bytes) -> bool:
+        positions = list(self._positions(key))
+        return self._test(self.current, positions) or (self.prev_count > 0 and self._test(self.previous, positions))
+
+    def add(self, key: bytes) -> None:
+        if self.count >= self.capacity:
+            self.rotate()
+        for p in self._positions(key):
+            self.current[p >> 3] |= 1 << (p & 7)
+        self.count += 1
+
+    def rotate(self) -> None:
+        self.previous, self.current = self.current, bytearray(self.bits // 8)
+        self.prev_count, self.count = self.count, 0
+
+    def clear(self) -> None:
+        self.current = bytearray(self.bits // 8)
+        self.previous = bytearray(self.bits // 8)
+        self.count = self.prev_count = 0
+
+    def to_bytes(self) -> bytes:
+        header = _SEEN_HEADER.pack(_SEEN_MAGIC, self.bits, self.hashes, self.count, self.prev_count)
+        return header + bytes(self.current) + bytes(self.previous)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "SeenFilter":
+        magic, bits, hashes, count, prev_count = _SEEN_HEADER.unpack_from(data, 0)
+        size = bits // 8
+        if magic != _SEEN_MAGIC or len(data) != _SEEN_HEADER.size + 2 * size:
+            raise ValueError("corrupt seen-set file")
+        f = cls(bits, hashes)
+        off = _SEEN_HEADER.size
+        f.current = bytearray(data[off:off + size])
+        f.previous = bytearray(data[off + size:off + 2 * size])
+        f.count, f.prev_count = count, prev_count
+        return f
+
+
+def _item_key(item: ContentItem) -> bytes:
+    # Keyed by content rather than index so rebuilding a pack keeps history
+    return f"{item.label}|{item.start}|{item.end}".encode("utf-8")
+
+
+class NoRepeatSampler:
+    """Per-player, stratified, no-repeat draws from a content pack."""
+
+    def __init__(self, pack: ContentPack, username: Optional[str] = None, pack_name: str = "pack", rng=random):
+        self.pack = pack
+        self.rng = rng
+        self.path = None
+        if username is not None:
+            fname = f"{normalize_username(username)}.{pack_name}.bin"
+            self.path = os.path.join(get_data_dir(), SEEN_DIRNAME, fname)
+        self.seen = self._load()
+        # Era strata as index ranges; computed once per sampler (O(log n) each)
+        self.strata: List[Tuple[int, int]] = []
+        for _label, y0, y1 in LIFE_ERAS:
+            lo, hi = pack.index_range(y0, y1)
+            if hi > lo:
+                self.strata.append((lo, hi))
+        if not self.strata and len(pack):
+            self.strata.append((0, len(pack)))
+
+    def _load(self) -> SeenFilter:
+        if self.path and os.path.isfile(self.path):
+            try:
+                with open(self.path, "rb") as f:
+                    return SeenFilter.from_bytes(f.read())
+            except (OSError, ValueError, struct.error):
+                pass
+        return SeenFilter()
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(self.seen.to_bytes())
+        os.replace(tmp, self.path)
+
+    def _probe(self, lo: int, hi: int, lifespan: Tuple[int, int]) -> Optional[ContentItem]:
+        size = hi - lo
+        # Small strata are scanned exhaustively from a random offset,
+        # large ones probed at random; both are bounded by LIFE_SAMPLE_PROBES
+        exhaustive = size <= LIFE_SAMPLE_PROBES
+        start = self.rng.randrange(size)
+        fallback = None
+        for n in range(min(size, LIFE_SAMPLE_PROBES)):
+            idx = lo + ((start + n) % size if exhaustive else self.rng.randrange(size))
+            item = self.pack.item(idx)
+            if _item_key(item) in self.seen:
+                continue
+            if lifespan[0] <= item.end - item.start <= lifespan[1]:
+                return item
+            if fallback is None:
+                fallback = item
+        return fallback
+
+    def draw(self, era: Optional[int] = None, lifespan: Optional[Tuple[int, int]] = None) -> ContentItem:
+        """Draw an item not yet seen by this player.
+
+        era: index into the non-empty LIFE_ERAS strata (random when None).
+        lifespan: (min, max) years lived (random LIFE_LIFESPAN_BANDS entry when None).
+        """
+        if era is None:
+            era = self.rng.randrange(len(self.strata))
+        if lifespan is None:
+            lifespan = self.rng.choice(LIFE_LIFESPAN_BANDS)
+        # Requested stratum first, then the others: at most len(LIFE_ERAS) probes runs
+        order = [self.strata[era % len(self.strata)]]
+        others = [st for st in self.strata if st is not order[0]]
+        self.rng.shuffle(others)
+        picked = None
+        for lo, hi in order + others:
+            picked = self._probe(lo, hi, lifespan)
+            if picked is not None:
+                break
+        if picked is None:
+            # Everything reachable has been seen: start a new cycle
+            if all(hi - lo <= LIFE_SAMPLE_PROBES for lo, hi in self.strata):
+                self.seen.clear()
+            else:
+                self.seen.rotate()
+            lo, hi = order[0]
+            picked = self.pack.item(self.rng.randrange(lo, hi))
+        self.seen.add(_item_key(picked))
+        return picked
+
+
+_SAMPLERS: Dict[Tuple[str, Optional[str]], NoRepeatSampler] = {}
+
+
+def get_sampler(pack: ContentPack, pack_name: str, username: Optional[str]) -> NoRepeatSampler:
+    """Return the sampler for (pack, player); only the latest player is kept warm."""
+    key = (pack_name, normalize_username(username) if username else None)
+    sampler = _SAMPLERS.get(key)
+    if sampler is None or sampler.pack is not pack:
+        _SAMPLERS.clear()
+        sampler = NoRepeatSampler(pack, username, pack_name)
+        _SAMPLERS[key] = sampler
+    return sampler
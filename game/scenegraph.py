@@ -0,0 +1,89 @@
+"""Optional dirty-rect scene base built on ``pygame.sprite.LayeredDirty``.
+
+Static layers are composed once into a background surface (batched with
+``Surface.blits``); only sprites flagged dirty are redrawn each frame and
+only their old/new rects are restored from the background. Set
+``retained = False`` to repaint everything every frame, which is what
+the imperative scenes do and what ``python -m game.bench scenegraph``
+compares against.
+"""
+import pygame
+from .core import Scene
+from .config import GAME_WIDTH, GAME_HEIGHT
+
+
+class WidgetSprite(pygame.sprite.DirtySprite):
+    """Sprite whose image comes from a cached surface (widget, prerendered image).
+
+    ``show`` only flags the sprite dirty when the surface or its position
+    actually changes, so retained widgets cost nothing while idle.
+    """
+
+    def __init__(self, image=None, layer=0, **rect_kwargs):
+        super().__init__()
+        self._layer = layer
+        self.image = image if image is not None else pygame.Surface((0, 0), pygame.SRCALPHA)
+        self.rect = self.image.get_rect(**rect_kwargs)
+        self.visible = 1 if image is not None else 0
+
+    def show(self, image, **rect_kwargs):
+        rect = image.get_rect(**rect_kwargs)
+        if image is not self.image or rect != self.rect or not self.visible:
+            self.image = image
+            self.rect = rect
+            self.visible = 1
+            self.dirty = 1
+
+    def hide(self):
+        if self.visible:
+            self.visible = 0
+
+
+class SpriteScene(Scene):
+    """Scene drawn through a LayeredDirty group over a cached background.
+
+    Subclasses implement ``build_background`` for the static layers and
+    keep their moving sprites up to date in ``sync_sprites`` (called once
+    per draw); they call ``invalidate`` when static layers change.
+    """
+
+    retained = True
+
+    def __init__(self, game, size=(GAME_WIDTH, GAME_HEIGHT)):
+        super().__init__(game)
+        self.group = pygame.sprite.LayeredDirty()
+        self.background = pygame.Surface(size).convert()
+        self._background_valid = False
+        self._last_target = None
+
+    def build_background(self, surface):
+        """Draw the static layers onto ``surface``."""
+        surface.fill((0, 0, 0))
+
+    def sync_sprites(self):
+        """Update sprite images/positions from scene state before drawing."""
+
+    def invalidate(self):
+        """Force the background to be rebuilt and the whole screen repainted."""
+        self._background_valid = False
+
+    def draw(self, screen):
+        self.sync_sprites()
+        # Another scene may have drawn on the target since our last frame: repaint everything then
+        exposed = screen is not self._last_target or getattr(self.game, "last_drawn_scene", None) not in (None, self)
+        self._last_target = screen
+        if not self.retained:
+            self.build_background(screen)
+            for spr in self.group.sprites():
+                if spr.visible:
+                    screen.blit(spr.image, spr.rect, spr.source_rect)
+            return
+        if not self._background_valid:
+            self.build_background(self.background)
+            self._background_valid = True
+            exposed = True
+        if exposed:
+            self.group.clear(screen, self.background)
+            screen.blit(self.background, (0, 0))
+            self.group.repaint_rect(screen.get_rect())
+        self.group.draw(screen)
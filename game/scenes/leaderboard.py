@@ -1,21 +1,62 @@
+from collections import OrderedDict
+
 import pygame
 from ..core import Scene
-from ..config import PRIMARY_COLOR, SECONDARY_COLOR, BG_COLOR, ACCENT_COLOR, HEIGHT, FONT_PATH
-from ..utils import blit_text_center, load_sound
-from ..leaderboard import load_entries, LeaderboardEntry
+from ..config import (PRIMARY_COLOR, SECONDARY_COLOR, BG_COLOR, ACCENT_COLOR, GAME_HEIGHT, GAME_WIDTH, FONT_PATH,
+                      LEADERBOARD_HOLD_ROWS, LEADERBOARD_ROW_CACHE, LEADERBOARD_SCROLL_RATE)
+from ..utils import blit_text_center, clamp, load_sound
+from ..leaderboard import LeaderboardPages
 from .username import UsernameScene
 
 
 class LeaderboardScene(Scene):
-    def __init__(self, game, highlight_username: str | None = None, highlight_score: int | None = None):
+    """Full leaderboard, scrollable (↑/↓, PgUp/PgDn, Home/End, wheel).
+
+    Rows are read page by page (``LeaderboardPages``) and rendered only as
+    they scroll into view (LRU of LEADERBOARD_ROW_CACHE surfaces): a frame
+    costs the same with ten entries or a million.
+    """
+
+    event_types = (pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEWHEEL)
+
+    ROW_HEIGHT = 32
+    LIST_TOP = 134
+    LIST_BOTTOM = GAME_HEIGHT - 62
+
+    def __init__(self, game, highlight_username: str | None = None, highlight_score: int | None = None,
+                 highlight_rank: int | None = None):
         super().__init__(game)
         self.title_font = pygame.font.Font(FONT_PATH, 40)
         self.row_font = pygame.font.Font(FONT_PATH, 24)
         self.hint_font = pygame.font.Font(FONT_PATH, 20)
-        self.entries = load_entries()
+        self.title = self.title_font.render("Leaderboard", True, PRIMARY_COLOR)
+        self.hint = self.hint_font.render("Haut/Bas pour défiler, Entrée pour revenir", True, SECONDARY_COLOR)
+        self.pages = LeaderboardPages()
+        self.pages.scan()
         self.highlight_username = highlight_username
         self.highlight_score = highlight_score
+        self.highlight_rank = highlight_rank
         self.snd_sarcastic = load_sound("sarcastic.wav")
+        self.list_rect = pygame.Rect(0, self.LIST_TOP, GAME_WIDTH, self.LIST_BOTTOM - self.LIST_TOP)
+        self.visible_rows = self.list_rect.height // self.ROW_HEIGHT
+        # Rows left-aligned on the width of a typical one: no sideways wobble while scrolling
+        self.row_x = (GAME_WIDTH - self.row_font.size(f"{1:>2}. {'W' * 16}  100")[0]) // 2
+        # Row shown at the top of the list (fractional while scrolling) and the one
+        # it heads to; the target may lie past the rows indexed so far
+        self.scroll = 0.0
+        self.target = 0.0
+        if highlight_rank is not None and highlight_rank > self.visible_rows:
+            self.target = float(highlight_rank - 1 - self.visible_rows // 2)
+        self.held = 0  # -1 / +1 while ↑ / ↓ is held
+        # row index → rendered row, least recently drawn first
+        self.rows = OrderedDict()
+        self._footer = (None, None)
+
+    def _max_top(self) -> int:
+        return max(0, self.pages.count() - self.visible_rows)
+
+    def _scroll_by(self, rows: float):
+        self.target = clamp(min(self.target, self._max_top()) + rows, 0, self._max_top())
 
     def update(self, dt):
         # Play sarcastic clap once on entering leaderboard
@@ -26,49 +67,91 @@ class LeaderboardScene(Scene):
                     self.snd_sarcastic.play()
                 except Exception:
                     pass
+        if not self.pages.complete:
+            self.pages.scan()
+        if self.held:
+            self._scroll_by(self.held * LEADERBOARD_HOLD_ROWS * dt)
+        goal = min(self.target, self._max_top())
+        self.scroll += (goal - self.scroll) * min(1.0, LEADERBOARD_SCROLL_RATE * dt)
+        if abs(goal - self.scroll) < 0.01:
+            self.scroll = goal
+
+    def is_animating(self):
+        return bool(self.held) or not self.pages.complete or self.scroll != min(self.target, self._max_top())
 
     def handle_event(self, e):
-        if e.type == pygame.KEYDOWN:
-            if e.key in (pygame.K_ESCAPE, pygame.K_RETURN, pygame.K_SPACE):
+        if e.type == pygame.MOUSEWHEEL:
+            self._scroll_by(-3 * e.y)
+        elif e.type == pygame.KEYUP:
+            if e.key in (pygame.K_UP, pygame.K_DOWN):
+                self.held = 0
+        elif e.type == pygame.KEYDOWN:
+            if e.key in (pygame.K_UP, pygame.K_DOWN):
+                self.held = -1 if e.key == pygame.K_UP else 1
+                self._scroll_by(self.held)
+            elif e.key in (pygame.K_PAGEUP, pygame.K_PAGEDOWN):
+                self._scroll_by(self.visible_rows * (-1 if e.key == pygame.K_PAGEUP else 1))
+            elif e.key == pygame.K_HOME:
+                self.target = 0.0
+            elif e.key == pygame.K_END:
+                self.target = float("inf")  # follows the index until the last row is known
+            elif e.key in (pygame.K_ESCAPE, pygame.K_RETURN, pygame.K_SPACE):
                 # Pop leaderboard and session scenes
                 self.game.pop_scene()
                 self.game.pop_scene()
-                
+
                 # Create a new username scene
                 def on_submit(name: str):
                     self.game.pop_scene()
                     from .session import SessionScene
                     self.game.push_scene(SessionScene(self.game, num_games=5, username=name))
-                
+
                 self.game.push_scene(UsernameScene(self.game, on_submit))
 
+    def _row_surface(self, index: int) -> pygame.Surface:
+        row = self.rows.get(index)
+        if row is not None:
+            self.rows.move_to_end(index)
+            return row
+        entry = self.pages.entry(index)
+        is_me = self.highlight_rank is not None and index == self.highlight_rank - 1
+        if entry is None:
+            text = f"{index + 1:>2}. —"
+        else:
+            text = f"{index + 1:>2}. {entry.username:<16}  {entry.score}"
+        row = self.row_font.render(text, True, ACCENT_COLOR if is_me else PRIMARY_COLOR)
+        self.rows[index] = row
+        if len(self.rows) > LEADERBOARD_ROW_CACHE:
+            self.rows.popitem(last=False)
+        return row
+
     def draw(self, screen):
         screen.fill(BG_COLOR)
-        blit_text_center(screen, self.title_font.render("Leaderboard", True, PRIMARY_COLOR), 90)
-
-        # Top 5
-        top = self.entries[:5]
-        y = 150
-        for idx, e in enumerate(top, start=1):
-            is_me = self.highlight_username is not None and e.username == self.highlight_username and (self.highlight_score is None or e.score == self.highlight_score)
-            color = ACCENT_COLOR if is_me else PRIMARY_COLOR
-            row = f"{idx:>2}. {e.username:<16}  {e.score}"
-            blit_text_center(screen, self.row_font.render(row, True, color), y)
-            y += 32
-
-        # If not in top, show rank line
-        if self.highlight_username is not None:
-            rank = None
-            for i, e in enumerate(self.entries, start=1):
-                if e.username == self.highlight_username and (self.highlight_score is None or e.score == self.highlight_score):
-                    rank = i
-                    break
-            if rank is not None and rank > 5:
-                line = f"#{rank} / {self.highlight_username} / {self.highlight_score}"
-                blit_text_center(screen, self.row_font.render(line, True, ACCENT_COLOR), y + 16)
-
-        # blit_text_center(
-        #     screen,
-        #     self.hint_font.render("Entrée/Espace/Échap pour revenir au menu", True, SECONDARY_COLOR),
-        #     HEIGHT - 40,
-        # )
+        blit_text_center(screen, self.title, 90)
+
+        count = self.pages.count()
+        first = int(self.scroll)
+        shift = (self.scroll - first) * self.ROW_HEIGHT
+        clip = screen.get_clip()
+        screen.set_clip(self.list_rect)
+        # One extra row: the partly visible one at the bottom while scrolling
+        for index in range(first, min(first + self.visible_rows + 1, count)):
+            row = self._row_surface(index)
+            y = self.LIST_TOP + (index - first) * self.ROW_HEIGHT - shift + self.ROW_HEIGHT // 2
+            screen.blit(row, row.get_rect(midleft=(self.row_x, int(y))))
+        screen.set_clip(clip)
+
+        # Rank line of the player, then position in the table
+        if self.highlight_rank is not None:
+            line = f"#{self.highlight_rank} / {self.highlight_username} / {self.highlight_score}"
+            text = f"{line}  |  {first + 1}-{min(first + self.visible_rows, count)} / {count}"
+        else:
+            text = f"{first + 1}-{min(first + self.visible_rows, count)} / {count}" if count else "Aucun score"
+        if not self.pages.complete:
+            text += "+"
+        key, footer = self._footer
+        if key != text:
+            footer = self.row_font.render(text, True, ACCENT_COLOR if self.highlight_rank is not None else SECONDARY_COLOR)
+            self._footer = (text, footer)
+        blit_text_center(screen, footer, self.LIST_BOTTOM + 18)
+        blit_text_center(screen, self.hint, GAME_HEIGHT - 20)
@@ -1,4 +1,5 @@
 import random
+import uuid
 import pygame
 from ..core import Scene
 from ..config import PRIMARY_COLOR, SECONDARY_COLOR, BG_COLOR, HEIGHT, FONT_PATH
@@ -9,6 +10,8 @@ from .leaderboard import LeaderboardScene
 
 
 class SessionScene(Scene):
+    event_types = (pygame.KEYDOWN,)
+
     def __init__(self, game, num_games: int | None = 5, username: str | None = None):
         super().__init__(game)
         self.title_font = pygame.font.Font(FONT_PATH, 40)
@@ -26,8 +29,13 @@ class SessionScene(Scene):
         self.scores = []
         self.total_score = 0
         self.current_best_score = 0
+        # Telemetry key tying the attempt records of this session together
+        self.session_id = uuid.uuid4().hex[:12]
+        # Scene of the running attempt, released to the scene pool once it pops itself
+        self.current_scene = None
         # Attempts management (shared HUD state on game)
         self.game.current_attempts_left = None
+        self.game.current_player = username
         # No error SFX on fail (disabled per request)
 
     def _push_next_if_needed(self):
@@ -35,11 +43,17 @@ class SessionScene(Scene):
             # Reset attempts for a new minigame
             self.game.current_attempts_left = self.game.max_attempts_per_game
             self.current_best_score = 0
-            mg = self.queue[self.index]
-            scene = mg.create_initial_scene(self.game)
-            self.game.push_scene(scene)
+            self._start_attempt()
             self.active = True
 
+    def _start_attempt(self):
+        mg = self.queue[self.index]
+        scene = mg.acquire_scene(self.game)
+        self.current_scene = scene
+        self.game.push_scene(scene)
+        number = self.game.max_attempts_per_game - self.game.current_attempts_left + 1
+        self.game.begin_attempt(self.session_id, mg.id, number)
+
     def handle_event(self, e):
         if e.type == pygame.KEYDOWN and e.key in (pygame.K_ESCAPE, pygame.K_m):
             # abort the session and return to menu
@@ -52,6 +66,9 @@ class SessionScene(Scene):
             return
         # If the top is back to this session, then the minigame ended (popped itself)
         if self.active and self.game.top_scene() is self:
+            if self.current_scene is not None:
+                self.queue[self.index].release_scene(self.current_scene)
+                self.current_scene = None
             # collect score and result for this attempt
             if self.game.last_minigame_score is not None:
                 # Track best attempt score for the current minigame only
@@ -82,24 +99,26 @@ class SessionScene(Scene):
                     self.active = False
                 else:
                     # retry same minigame immediately
-                    mg = self.queue[self.index]
-                    scene = mg.create_initial_scene(self.game)
-                    self.game.push_scene(scene)
+                    self._start_attempt()
                     # still active
                     return
 
             if self.index >= len(self.queue):
                 # session complete → leaderboard
-                crt_shutdown_effect(self.game.screen, 500, self.game.game_surface, get_game_area_rect())
+                crt_shutdown_effect(self.game.presenter, self.game.transition_ms, self.game.game_surface, get_game_area_rect())
                 total = self.total_score
                 highlight_name = self.username or "Anonyme"
-                add_score(highlight_name, total)
+                rank, _ = add_score(highlight_name, total)
+                self.game.telemetry.record_session(self.session_id, self.username, [mg.id for mg in self.queue],
+                                                   self.scores, total)
                 # Close session, then show leaderboard with highlight
                 self.game.pop_scene()
-                leaderboard_scene = LeaderboardScene(self.game, highlight_username=highlight_name, highlight_score=total)
+                self.game.memory.end_session(self.game.scenes)
+                leaderboard_scene = LeaderboardScene(self.game, highlight_username=highlight_name, highlight_score=total,
+                                                     highlight_rank=rank)
                 self.game.push_scene(leaderboard_scene)
                 leaderboard_scene.draw(self.game.game_surface)
-                crt_power_on_effect(self.game.screen, 500, self.game.game_surface, get_game_area_rect())
+                crt_power_on_effect(self.game.presenter, self.game.transition_ms, self.game.game_surface, get_game_area_rect())
                 return
             self._push_next_if_needed()
 
@@ -1,10 +1,13 @@
 import pygame
 from ..core import Scene
-from ..config import PRIMARY_COLOR, SECONDARY_COLOR, BG_COLOR, ACCENT_COLOR, HEIGHT, FONT_PATH
+from ..config import PRIMARY_COLOR, SECONDARY_COLOR, BG_COLOR, ACCENT_COLOR, GOOD_COLOR, HEIGHT, FONT_PATH, PLAYER_SUGGESTIONS
+from ..leaderboard import get_player_index
 from ..utils import blit_text_center, load_image, scale_mouse_to_game_surface
 
 
 class UsernameScene(Scene):
+    event_types = (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN)
+
     def __init__(self, game, on_submit):
         super().__init__(game)
         self.on_submit = on_submit
@@ -20,10 +23,41 @@ class UsernameScene(Scene):
         self.close_img = load_image("assets/images/croix.png", max_w=40, max_h=40)
         self.close_rect = self.close_img.get_rect(topleft=(20, 20))
 
+        # Personal best of the name being typed (indexed over the first frames)
+        self.players = get_player_index()
+        self.players.load()
+        self._player_line = (None, None)
+
+    def is_animating(self):
+        return not self.players.complete
+
+    def update(self, dt):
+        if not self.players.complete:
+            self.players.load()
+
+    def _render_player_line(self):
+        """Record of the typed name, or known names starting with it (cached per name)."""
+        key = (self.username, self.players.complete)
+        if self._player_line[0] == key:
+            return self._player_line[1]
+        line = None
+        stats = self.players.get(self.username) if self.username else None
+        if stats is not None:
+            parties = "partie" if stats.attempts == 1 else "parties"
+            text = f"Record : {stats.best} (#{stats.best_rank}), {stats.attempts} {parties}"
+            line = self.ui_font.render(text, True, GOOD_COLOR)
+        else:
+            known = self.players.prefix(self.username, PLAYER_SUGGESTIONS)
+            if known:
+                text = "Déjà vus : " + ", ".join(f"{p.username} ({p.best})" for p in known)
+                line = self.ui_font.render(text, True, SECONDARY_COLOR)
+        self._player_line = (key, line)
+        return line
+
     def handle_event(self, e):
         if e.type == pygame.MOUSEBUTTONDOWN:
             # Scale mouse coordinates to match the game surface resolution
-            screen_rect = self.game.screen.get_rect()
+            screen_rect = pygame.Rect((0, 0), self.game.presenter.get_size())
             scaled_pos = scale_mouse_to_game_surface(e.pos, screen_rect)
             
             if self.trophy_rect.collidepoint(scaled_pos):
@@ -59,6 +93,9 @@ class UsernameScene(Scene):
         display = self.username if self.username else "..."
         text = self.input_font.render(display, True, ACCENT_COLOR if self.username else SECONDARY_COLOR)
         blit_text_center(screen, text, 220)
+        line = self._render_player_line()
+        if line is not None:
+            blit_text_center(screen, line, 270)
 
         screen.blit(self.trophy_img, self.trophy_rect)
         screen.blit(self.close_img, self.close_rect)
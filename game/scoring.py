@@ -0,0 +1,123 @@
+"""Scoring rules of the minigames as pure functions.
+
+Each rule has a scalar form, called by the scene's ``validate``, and a
+``*_batch`` form that scores whole arrays of stop positions at once
+(simulation, telemetry replays). The batch forms use NumPy when it is
+installed (``pip install numpy``) and fall back to the scalar form element
+by element otherwise; both give identical results.
+
+Scores are ints in 0..100; ``success`` is the scene's "win".
+"""
+from typing import Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # optional: only the batch forms benefit from it
+    np = None
+
+
+# Comic: score by distance (in tiles) between the stopped tile and the middle one
+COMIC_DISTANCE_SCORES = (100, 80, 60, 40)
+
+
+def linear_score(error: float, max_error: float) -> int:
+    """100 at zero error, 0 at ``max_error`` and beyond."""
+    raw = int(100 * max(0.0, 1.0 - (error / max_error)))
+    return max(0, min(100, raw))
+
+
+def pixel_score(position: float, target: float, span: float, tolerance: float) -> Tuple[float, int, bool]:
+    """Stop at ``position`` (px) aiming at ``target``: (error_px, score, success).
+
+    The score reaches 0 at half of ``span`` (the travel length).
+    """
+    error = abs(position - target)
+    return error, linear_score(error, span / 2), error <= tolerance
+
+
+def center_word_score(cursor: float, word_width: float, tolerance: float) -> Tuple[float, int, bool]:
+    """CenterWord: ``cursor`` is the fill ratio (0..1) of a word ``word_width`` px wide."""
+    error = abs(cursor - 0.5) * word_width
+    return error, linear_score(error, word_width / 2), error <= tolerance
+
+
+def newton_score(apple_y: float, target_y: float, start_y: float, end_y: float, tolerance: float):
+    return pixel_score(apple_y, target_y, end_y - start_y, tolerance)
+
+
+def timeline_score(year: int, middle_year: float, year_min: int, year_max: int) -> Tuple[int, bool]:
+    """Timeline: the selected card's year against the arithmetic midpoint."""
+    distance = abs(year - middle_year)
+    span = max(1.0, float(year_max - year_min))
+    return linear_score(distance, max(1.0, span / 2.0)), distance == 0
+
+
+def life_score(year: int, target_year: int, min_year: int, max_year: int,
+               tolerance: int = 0, multiplier: float = 1.0) -> Tuple[int, bool]:
+    """LifeMidpoint: the selected year against the target, over the visible span."""
+    error = abs(year - target_year)
+    visible_span = max(1, abs(max_year - min_year))
+    precision = max(0.0, 1.0 - (error / (visible_span / 2)))
+    return int(100 * precision * multiplier), error <= tolerance
+
+
+def comic_score(distance: int) -> Tuple[int, bool]:
+    distance = abs(distance)
+    score = COMIC_DISTANCE_SCORES[distance] if distance < len(COMIC_DISTANCE_SCORES) else 0
+    return score, distance == 0
+
+
+# ---------------- batch forms ----------------
+def _linear_score_np(error, max_error):
+    raw = (100 * np.maximum(0.0, 1.0 - error / max_error)).astype(np.int64)
+    return np.clip(raw, 0, 100)
+
+
+def pixel_score_batch(positions: Sequence[float], target: float, span: float, tolerance: float):
+    """(scores, successes) for an array of stop positions."""
+    if np is None:
+        results = [pixel_score(p, target, span, tolerance) for p in positions]
+        return [r[1] for r in results], [r[2] for r in results]
+    error = np.abs(np.asarray(positions, dtype=np.float64) - target)
+    return _linear_score_np(error, span / 2), error <= tolerance
+
+
+def center_word_score_batch(cursors: Sequence[float], word_width: float, tolerance: float):
+    if np is None:
+        results = [center_word_score(c, word_width, tolerance) for c in cursors]
+        return [r[1] for r in results], [r[2] for r in results]
+    error = np.abs(np.asarray(cursors, dtype=np.float64) - 0.5) * word_width
+    return _linear_score_np(error, word_width / 2), error <= tolerance
+
+
+def newton_score_batch(apple_ys: Sequence[float], target_y: float, start_y: float, end_y: float, tolerance: float):
+    return pixel_score_batch(apple_ys, target_y, end_y - start_y, tolerance)
+
+
+def timeline_score_batch(years: Sequence[int], middle_year: float, year_min: int, year_max: int):
+    if np is None:
+        results = [timeline_score(y, middle_year, year_min, year_max) for y in years]
+        return [r[0] for r in results], [r[1] for r in results]
+    distance = np.abs(np.asarray(years, dtype=np.float64) - middle_year)
+    span = max(1.0, float(year_max - year_min))
+    return _linear_score_np(distance, max(1.0, span / 2.0)), distance == 0
+
+
+def life_score_batch(years: Sequence[int], target_year: int, min_year: int, max_year: int,
+                     tolerance: int = 0, multiplier: float = 1.0):
+    if np is None:
+        results = [life_score(y, target_year, min_year, max_year, tolerance, multiplier) for y in years]
+        return [r[0] for r in results], [r[1] for r in results]
+    error = np.abs(np.asarray(years, dtype=np.int64) - target_year)
+    visible_span = max(1, abs(max_year - min_year))
+    precision = np.maximum(0.0, 1.0 - error / (visible_span / 2))
+    return (100 * precision * multiplier).astype(np.int64), error <= tolerance
+
+
+def comic_score_batch(distances: Sequence[int]):
+    if np is None:
+        results = [comic_score(d) for d in distances]
+        return [r[0] for r in results], [r[1] for r in results]
+    distance = np.abs(np.asarray(distances, dtype=np.int64))
+    table = np.array(COMIC_DISTANCE_SCORES + (0,), dtype=np.int64)
+    return table[np.minimum(distance, len(COMIC_DISTANCE_SCORES))], distance == 0
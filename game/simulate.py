@@ -0,0 +1,328 @@
+"""Headless bot simulator for score and difficulty calibration.
+
+Each registered minigame scene is run with synthetic players: a bot
+watches the scene's signed distance to its ideal stop point, picks the
+first crossing after a short warm-up and presses at that moment plus a
+timing error drawn from the player's ex-Gaussian profile (SIM_PLAYERS).
+Scenes are stepped with the real ``update``/``validate`` code at 1/FPS,
+without drawing; attempts are split in chunks across a
+``ProcessPoolExecutor`` (one Game and scene per worker and parameter set).
+
+Usage:
+    python -m game.simulate [--attempts N] [--workers N] [--games ID,...]
+                            [--players NAME,...] [--set ID.PARAM=V1,V2 ...]
+
+``--set newton_apple.FALL_SPEED=150,200 --set newton_apple.TOLERANCE=2,4``
+simulates every combination of the listed values.
+
+The exit status is 1 when a more skilled profile (later in SIM_PLAYERS)
+wins less often than a weaker one by more than the sampling noise.
+"""
+import argparse
+import itertools
+import os
+import random
+import sys
+import time
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+# Workers run without a window or audio device unless told otherwise
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from .config import FPS, SIM_CHUNK, SIM_MAX_SECONDS, SIM_PLAYERS, SIM_WARMUP
+
+
+DT = 1.0 / FPS
+
+
+def _wrap(x: float) -> float:
+    """Bring a periodic error (period 1) into [-0.5, 0.5)."""
+    return (x + 0.5) % 1.0 - 0.5
+
+
+class Bot(NamedTuple):
+    # Signed distance to the ideal stop, normalized (about -1..1, period 1 for
+    # looping scenes); None when the scene has no reachable target
+    error: Callable
+    reset: Callable = lambda scene: scene.reset()
+    start: Callable = lambda scene: None
+    # The ideal point comes back (bounce/loop): the bot may let the first ones go by
+    loops: bool = True
+
+
+def _comic_error(scene):
+    if scene.story_middle_idx is None:
+        return None
+    total = len(scene.grid_order)
+    target = scene.grid_order.index(scene.story_middle_idx)
+    shown = scene.current_idx + scene.timer * scene.HIGHLIGHT_SPEED
+    return _wrap((shown - target - 0.5) / total)
+
+
+def _timeline_targets(scene):
+    # Positions in the loop of the cards closest to the midpoint year (exact when possible)
+    targets = getattr(scene, "_sim_targets", None)
+    if targets is None:
+        years = [abs(scene.pack.start_year(i) - scene.middle_year_value) for i in scene.cards]
+        best = min(years) if years else 0
+        targets = scene._sim_targets = [j for j, d in enumerate(years) if d == best]
+    return targets
+
+
+# Cards past a target before the bot aims at the next one (the card stays nearest until then)
+TIMELINE_LOCK_CARDS = 0.5
+
+
+def _timeline_error(scene):
+    """Distance to the next midpoint card ahead, kept until the cursor is half a card past it.
+
+    With several midpoint cards, the nearest one changes between two of
+    them: its signed distance would flip sign there, a false crossing. Each
+    pass is locked on one target instead and scaled to -0.5 at the previous
+    switch, 0 on the card and +0.5 at the next switch, so switching target
+    is a jump of about 1 that the bot ignores like a loop wrap.
+    """
+    targets = _timeline_targets(scene)
+    if not targets:
+        return None
+    total = len(scene.cards)
+    shown = scene.scroll_x / (scene.CARD_W + scene.GAP)
+    switched = (shown - TIMELINE_LOCK_CARDS) % total
+    i = bisect_left(targets, switched) % len(targets)
+    target, previous = targets[i], targets[i - 1]
+    span = (target - previous) % total or total  # cards between the two switches
+    offset = TIMELINE_LOCK_CARDS - (target - switched) % total  # shown - target, in cards
+    if offset < 0:
+        return 0.5 * offset / (span - TIMELINE_LOCK_CARDS)
+    return 0.5 * offset / TIMELINE_LOCK_CARDS
+
+
+def _life_reset(scene):
+    # Uniform draw from the pack: the no-repeat sampler is for real players
+    scene.reset(scene.pack.item(random.randrange(len(scene.pack))))
+
+
+def _life_start(scene):
+    # Hold → until the cursor reaches the target
+    scene.steer = 1
+
+
+BOTS: Dict[str, Bot] = {
+    "center_word": Bot(lambda s: s.cursor_x - 0.5),
+    "newton_apple": Bot(lambda s: (s.apple_y - s.target_y) / max(1, s.end_y - s.start_y), loops=False),
+    "life_midpoint": Bot(lambda s: (s.cursor_x - s.year_to_x(s.target_year)) / s.timeline_rect.width,
+                         reset=_life_reset, start=_life_start, loops=False),
+    "timeline_middle": Bot(_timeline_error, reset=lambda s: s._reset()),
+    "comic": Bot(_comic_error),
+}
+
+
+# ---------------- worker side ----------------
+_GAME = None
+_SCENES: Dict[tuple, object] = {}
+
+
+def _get_scene(game_id: str, params: Tuple[Tuple[str, float], ...]):
+    """One scene per (minigame, parameter set) and worker, sounds off."""
+    global _GAME
+    import pygame
+    from .core import Game
+    from .minigames import get_minigame_by_id
+
+    if _GAME is None:
+        _GAME = Game()
+        try:
+            pygame.mixer.music.stop()
+        except Exception:
+            pass
+    key = (game_id, params)
+    scene = _SCENES.get(key)
+    if scene is None:
+        scene = get_minigame_by_id(game_id).create_initial_scene(_GAME)
+        for name in list(vars(scene)):
+            if name.startswith("snd_"):
+                setattr(scene, name, None)
+        for name, value in params:
+            setattr(scene, name, value)
+        _SCENES[key] = scene
+    return scene
+
+
+def _begin(scene, bot: Bot, seed: int):
+    random.seed(seed)
+    bot.reset(scene)
+    bot.start(scene)
+
+
+def _finish(scene) -> Tuple[int, bool]:
+    """Press until the scene hands its result to the game (stop, then continue)."""
+    from .input import ACTION_PRESS, Action
+
+    game = scene.game
+    game.last_minigame_score = None
+    for _ in range(2):
+        scene.handle_action(Action(ACTION_PRESS))
+        if game.last_minigame_score is not None:
+            break
+    score, success = game.last_minigame_score or 0, bool(game.last_minigame_success)
+    game.last_minigame_score = game.last_minigame_success = None
+    return max(0, min(100, int(score))), success
+
+
+def run_attempt(scene, bot: Bot, rng: random.Random, profile) -> Tuple[int, bool]:
+    mu, sigma, tau = profile
+    timing_error = rng.gauss(mu, sigma) + (rng.expovariate(1.0 / tau) if tau > 0 else 0.0)
+    warmup = rng.uniform(*SIM_WARMUP) if bot.loops else 0.0
+    seed = rng.getrandbits(32)
+
+    # Step until the first crossing of the ideal point after the warm-up
+    _begin(scene, bot, seed)
+    t, prev, crossing = 0.0, None, None
+    while t < SIM_MAX_SECONDS and scene.is_animating():
+        scene.update(DT)
+        t += DT
+        err = bot.error(scene)
+        if err is None:
+            crossing = warmup
+            break
+        if t >= warmup and prev is not None and (prev < 0) != (err < 0) and abs(err - prev) < 0.5:
+            crossing = t
+            break
+        prev = err
+    if crossing is None:
+        crossing = t
+    press_at = max(0.0, crossing + timing_error)
+    if press_at < t:
+        # Anticipated press: replay the same round up to the press
+        _begin(scene, bot, seed)
+        t = 0.0
+    while t + DT / 2 < press_at and scene.is_animating():
+        scene.update(DT)
+        t += DT
+    return _finish(scene)
+
+
+def simulate_chunk(game_id: str, params, player: str, seed: int, attempts: int):
+    """Worker task: returns (score histogram 0..100, wins)."""
+    scene = _get_scene(game_id, params)
+    bot = BOTS[game_id]
+    profile = SIM_PLAYERS[player]
+    rng = random.Random(seed)
+    hist = [0] * 101
+    wins = 0
+    for _ in range(attempts):
+        score, success = run_attempt(scene, bot, rng, profile)
+        hist[score] += 1
+        wins += success
+    return hist, wins
+
+
+# ---------------- driver side ----------------
+def skill_inversions(results, runs) -> List[str]:
+    """Runs where a more skilled player (later in SIM_PLAYERS) wins less than a weaker one, beyond noise."""
+    ranks = {name: i for i, name in enumerate(SIM_PLAYERS)}
+    rates = {}
+    for game_id, params, player in runs:
+        hist, wins = results[(game_id, params, player)]
+        rates.setdefault((game_id, params), []).append((ranks[player], player, wins / max(1, sum(hist)), sum(hist)))
+    found = []
+    for (game_id, params), players in rates.items():
+        players.sort()
+        for i, (_, weak, weak_rate, weak_n) in enumerate(players):
+            for _, strong, strong_rate, strong_n in players[i + 1:]:
+                # Three standard errors of the difference of two proportions
+                p = (weak_rate + strong_rate) / 2
+                noise = 3 * (p * (1 - p) * (1 / max(1, weak_n) + 1 / max(1, strong_n))) ** 0.5
+                if strong_rate < weak_rate - noise:
+                    label = " ".join(f"{name}={value:g}" for name, value in params) or "(defaults)"
+                    found.append(f"{game_id} {label}: {strong} {100 * strong_rate:.1f}% < {weak} {100 * weak_rate:.1f}%")
+    return found
+
+
+def _percentile(hist: List[int], q: float) -> int:
+    total = sum(hist)
+    rank = q * (total - 1)
+    seen = 0
+    for score, count in enumerate(hist):
+        seen += count
+        if seen > rank:
+            return score
+    return 100
+
+
+def _parse_sets(values) -> Dict[str, Dict[str, List[float]]]:
+    grids: Dict[str, Dict[str, List[float]]] = {}
+    for value in values or ():
+        target, _, choices = value.partition("=")
+        game_id, _, param = target.partition(".")
+        if not param or not choices:
+            raise SystemExit(f"--set expects ID.PARAM=V1[,V2...], got {value!r}")
+        grids.setdefault(game_id, {})[param] = [float(v) for v in choices.split(",")]
+    return grids
+
+
+def _param_sets(grid: Optional[Dict[str, List[float]]]):
+    if not grid:
+        return [()]
+    names = sorted(grid)
+    return [tuple(zip(names, combo)) for combo in itertools.product(*(grid[n] for n in names))]
+
+
+def main(argv) -> int:
+    from .minigames import get_all_minigames
+
+    parser = argparse.ArgumentParser(prog="python -m game.simulate", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--attempts", type=int, default=100_000, help="attempts per minigame, parameter set and player")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--games", help="comma-separated minigame ids (default: all)")
+    parser.add_argument("--players", default=",".join(SIM_PLAYERS), help="comma-separated SIM_PLAYERS names")
+    parser.add_argument("--set", action="append", metavar="ID.PARAM=V1,V2", help="parameter values to sweep")
+    parser.add_argument("--chunk", type=int, default=SIM_CHUNK)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    game_ids = args.games.split(",") if args.games else [mg.id for mg in get_all_minigames() if mg.id in BOTS]
+    players = args.players.split(",")
+    grids = _parse_sets(args.set)
+    runs = [(g, params, p) for g in game_ids for params in _param_sets(grids.get(g)) for p in players]
+
+    seeds = random.Random(args.seed)
+    results = {run: ([0] * 101, 0) for run in runs}
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = {}
+        for run in runs:
+            for first in range(0, args.attempts, args.chunk):
+                n = min(args.chunk, args.attempts - first)
+                futures[pool.submit(simulate_chunk, *run, seeds.getrandbits(32), n)] = run
+        for future in as_completed(futures):
+            run = futures[future]
+            hist, wins = future.result()
+            total_hist, total_wins = results[run]
+            results[run] = ([a + b for a, b in zip(total_hist, hist)], total_wins + wins)
+    elapsed = time.perf_counter() - start
+
+    print(f"{'minigame':<16}{'params':<28}{'player':<8}{'attempts':>10}{'win %':>8}{'mean':>7}{'p10':>5}{'p50':>5}{'p90':>5}")
+    for run in runs:
+        game_id, params, player = run
+        hist, wins = results[run]
+        total = sum(hist)
+        mean = sum(score * count for score, count in enumerate(hist)) / max(1, total)
+        label = " ".join(f"{name}={value:g}" for name, value in params) or "(defaults)"
+        print(f"{game_id:<16}{label:<28}{player:<8}{total:>10}{100.0 * wins / max(1, total):>8.1f}{mean:>7.1f}"
+              f"{_percentile(hist, 0.1):>5}{_percentile(hist, 0.5):>5}{_percentile(hist, 0.9):>5}")
+    attempts = len(runs) * args.attempts
+    print(f"{attempts} attempts in {elapsed:.1f} s with {args.workers} workers "
+          f"({attempts / elapsed:.0f} attempts/s, {attempts / elapsed / args.workers:.0f} per worker)")
+    # A bot that loses more with a better timing profile measures the bot, not the game
+    inversions = skill_inversions(results, runs)
+    for inversion in inversions:
+        print(f"simulate: SKILL INVERSION {inversion}")
+    return 1 if inversions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,291 @@
+"""Soak test: endless scripted sessions at full speed, failing on drift.
+
+``create_game()`` runs headless (SDL ``dummy`` drivers) on a scratch data
+directory (leaderboard, telemetry, per-player files) and a bot plays it
+through the real event path: it types a name in UsernameScene, presses
+Space in each minigame of the SessionScene after a random delay (holding
+→ first, which steers Life) and leaves the LeaderboardScene with Return,
+back to a new UsernameScene, over and over. Frames never wait: each one
+advances game time by 1/FPS and the CRT transitions are skipped.
+
+Every SOAK_SAMPLE_SESSIONS sessions a sample records:
+- the process RSS;
+- the objects tracked by the GC and the surfaces reachable from the
+  scenes on the stack and in the scene pool;
+- the p50 / p99 of ``Game.frame`` and the median session-end frame (the
+  one saving the leaderboard);
+- the leaderboard file size per session played.
+
+After SOAK_WARMUP_SAMPLES samples, the median of the last third of the
+samples is compared with the first third: growth beyond SOAK_DRIFT (both
+its relative and absolute part) fails the run (exit status 1).
+
+Usage:
+    python -m game.soak [--minutes M | --sessions N] [--sample N] [--seed N]
+                        [--data-dir DIR] [--csv FILE]
+"""
+import argparse
+import csv
+import gc
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+# No window or audio device
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from .config import (SOAK_DRIFT, SOAK_MIN_SAMPLES, SOAK_MINUTES, SOAK_PLAYERS, SOAK_SAMPLE_SESSIONS,
+                     SOAK_WARMUP_SAMPLES)
+from .leaderboard import LEADERBOARD_FILENAME, get_data_dir, set_data_dir
+from .pacing import FramePacer
+
+
+# Frames (at 1/FPS of game time) the bot waits before each press in a minigame
+PRESS_FRAMES = (10, 240)
+# Frames without a finished session before the run is declared stuck
+STALL_FRAMES = 50000
+
+COLUMNS = ("sessions", "minutes", "rss_mib", "objects", "surfaces", "frame_p50_ms", "frame_p99_ms",
+           "session_end_ms", "leaderboard_bytes_per_session")
+
+
+class FixedStepPacer(FramePacer):
+    """Never waits: every frame advances game time by exactly 1/fps."""
+
+    def wait(self, animating: bool):
+        self._account()
+        return 1.0 / self.fps, ()
+
+
+def _post_key(key: int, unicode: str = "", kind: int = pygame.KEYDOWN) -> None:
+    pygame.event.post(pygame.event.Event(kind, key=key, unicode=unicode, mod=0))
+
+
+class SoakBot:
+    """Scripted player: posts the SDL events the scene on top waits for."""
+
+    def __init__(self, game, rng: random.Random, players: int = SOAK_PLAYERS):
+        self.game = game
+        self.rng = rng
+        self.players = players
+        self.sessions = 0
+        # (scene, attempt) seen last: a retry reuses the pooled scene, not the attempt
+        self._current = None
+        self._fresh = False
+        self._countdown = 0
+
+    def step(self) -> bool:
+        """Script the scene now on top; True when a session just reached the leaderboard."""
+        from .scenes.leaderboard import LeaderboardScene
+        from .scenes.session import SessionScene
+        from .scenes.username import UsernameScene
+
+        scene = self.game.top_scene()
+        current = (id(scene), id(self.game.attempt))
+        if current != self._current:
+            # The input filter follows the new scene from the next poll on, and
+            # changing it drops the queued events: act from the next step
+            self._current = current
+            self._fresh = True
+            if isinstance(scene, LeaderboardScene):
+                self.sessions += 1
+                return True
+            return False
+        fresh, self._fresh = self._fresh, False
+        if isinstance(scene, UsernameScene):
+            if fresh:
+                for ch in f"soak{self.rng.randrange(self.players)}":
+                    _post_key(ord(ch), ch)
+                _post_key(pygame.K_RETURN)
+        elif isinstance(scene, LeaderboardScene):
+            if fresh:
+                _post_key(pygame.K_RETURN)
+        elif scene is not None and not isinstance(scene, SessionScene):
+            if fresh:
+                _post_key(pygame.K_RIGHT)
+                self._countdown = self.rng.randint(*PRESS_FRAMES)
+            self._countdown -= 1
+            if self._countdown <= 0:
+                # Stop (then continue from the result screen on the next press)
+                _post_key(pygame.K_RIGHT, kind=pygame.KEYUP)
+                _post_key(pygame.K_SPACE, " ")
+                self._countdown = self.rng.randint(*PRESS_FRAMES)
+        return False
+
+
+def rss_mib() -> Optional[float]:
+    """Resident set size; the peak where only ``resource`` is available, None on Windows."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1048576.0
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1048576.0 if sys.platform == "darwin" else peak / 1024.0
+
+
+def _percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+
+def take_sample(game, sessions: int, elapsed: float, frames_ms: List[float], ends_ms: List[float]) -> Dict:
+    from .memory import scene_assets
+    from .minigames import get_scene_pool
+
+    gc.collect()
+    live = list(game.scenes) + get_scene_pool().scenes()
+    path = os.path.join(get_data_dir(), LEADERBOARD_FILENAME)
+    size = os.path.getsize(path) if os.path.exists(path) else 0
+    return {
+        "sessions": sessions,
+        "minutes": elapsed / 60.0,
+        "rss_mib": rss_mib(),
+        "objects": len(gc.get_objects()),
+        "surfaces": sum(scene_assets(scene).surfaces for scene in live),
+        "frame_p50_ms": _percentile(frames_ms, 0.50),
+        "frame_p99_ms": _percentile(frames_ms, 0.99),
+        "session_end_ms": statistics.median(ends_ms) if ends_ms else 0.0,
+        "leaderboard_bytes_per_session": size / sessions if sessions else 0.0,
+    }
+
+
+def find_drift(samples: List[Dict], warmup: int = SOAK_WARMUP_SAMPLES, min_samples: int = SOAK_MIN_SAMPLES,
+               limits=SOAK_DRIFT) -> Optional[List[str]]:
+    """Metrics whose last-third median outgrew the first-third one; None with too few samples."""
+    judged = samples[warmup:]
+    if len(judged) < min_samples:
+        return None
+    third = len(judged) // 3
+    drifts = []
+    for metric, (relative, absolute) in limits.items():
+        first = [s[metric] for s in judged[:third] if s.get(metric) is not None]
+        last = [s[metric] for s in judged[-third:] if s.get(metric) is not None]
+        if not first or not last:
+            continue
+        before, after = statistics.median(first), statistics.median(last)
+        allowed = max(relative * abs(before), absolute)
+        if after - before > allowed:
+            drifts.append(f"{metric}: {before:.2f} -> {after:.2f} (+{after - before:.2f}, allowed +{allowed:.2f})")
+    return drifts
+
+
+def _format_row(sample: Dict) -> str:
+    rss = sample["rss_mib"]
+    return (f"{sample['sessions']:>9}{sample['minutes']:>9.1f}{rss if rss is not None else float('nan'):>9.1f}"
+            f"{sample['objects']:>10}{sample['surfaces']:>10}{sample['frame_p50_ms']:>9.2f}"
+            f"{sample['frame_p99_ms']:>9.2f}{sample['session_end_ms']:>9.1f}"
+            f"{sample['leaderboard_bytes_per_session']:>10.1f}")
+
+
+def soak(minutes: Optional[float] = SOAK_MINUTES, sessions: Optional[int] = None,
+         sample_every: int = SOAK_SAMPLE_SESSIONS, seed: Optional[int] = None, out=print) -> List[Dict]:
+    """Play sessions until ``sessions`` or ``minutes`` is reached; returns the samples.
+
+    The data directory must already point somewhere disposable (``set_data_dir``).
+    """
+    from .main import create_game
+
+    if seed is not None:
+        random.seed(seed)  # minigame order and content draws
+    game = create_game()
+    game.pacer = FixedStepPacer(game.clock)
+    game.transition_ms = 0
+    bot = SoakBot(game, random.Random(seed))
+    samples: List[Dict] = []
+    frames_ms: List[float] = []
+    ends_ms: List[float] = []
+    out(f"{'sessions':>9}{'minutes':>9}{'rss MiB':>9}{'objects':>10}{'surfaces':>10}{'p50 ms':>9}"
+        f"{'p99 ms':>9}{'end ms':>9}{'lb B/ses':>10}")
+    start = time.perf_counter()
+    stalled = 0
+    try:
+        while game.running and game.top_scene() is not None:
+            begin = time.perf_counter_ns()
+            game.frame()
+            frame_ms = (time.perf_counter_ns() - begin) / 1e6
+            frames_ms.append(frame_ms)
+            stalled += 1
+            if not bot.step():
+                if stalled > STALL_FRAMES:
+                    raise RuntimeError(f"no session finished in {STALL_FRAMES} frames "
+                                       f"(top scene: {type(game.top_scene()).__name__})")
+                continue
+            # The frame that pushed the leaderboard scored and saved the session
+            ends_ms.append(frame_ms)
+            stalled = 0
+            if bot.sessions % sample_every == 0:
+                elapsed = time.perf_counter() - start
+                samples.append(take_sample(game, bot.sessions, elapsed, frames_ms, ends_ms))
+                out(_format_row(samples[-1]))
+                frames_ms, ends_ms = [], []
+                if sessions is not None and bot.sessions >= sessions:
+                    break
+                if sessions is None and minutes is not None and elapsed >= minutes * 60.0:
+                    break
+    finally:
+        game.telemetry.close()
+        if hasattr(game.presenter, "close"):
+            game.presenter.close()
+    return samples
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m game.soak", description=__doc__.split("\n\n")[0])
+    length = parser.add_mutually_exclusive_group()
+    length.add_argument("--minutes", type=float, default=SOAK_MINUTES, help="run length (default %(default)s)")
+    length.add_argument("--sessions", type=int, help="number of sessions instead of a duration")
+    parser.add_argument("--sample", type=int, default=SOAK_SAMPLE_SESSIONS, help="sessions between samples")
+    parser.add_argument("--seed", type=int, help="seed of the bot and of the minigame draws")
+    parser.add_argument("--data-dir", help="keep the leaderboard and telemetry there (default: a temporary dir)")
+    parser.add_argument("--csv", help="also write the samples to this CSV file")
+    args = parser.parse_args(argv)
+    if args.sample < 1:
+        parser.error("--sample must be at least 1")
+
+    scratch = None
+    if args.data_dir:
+        os.makedirs(args.data_dir, exist_ok=True)
+        data_dir = args.data_dir
+    else:
+        scratch = tempfile.TemporaryDirectory(prefix="soak-")
+        data_dir = scratch.name
+    set_data_dir(data_dir)
+    try:
+        samples = soak(args.minutes, args.sessions, args.sample, args.seed)
+    finally:
+        set_data_dir(None)
+        if scratch is not None:
+            scratch.cleanup()
+        pygame.quit()
+
+    if args.csv:
+        with open(args.csv, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=COLUMNS)
+            writer.writeheader()
+            writer.writerows(samples)
+
+    drifts = find_drift(samples)
+    if drifts is None:
+        print(f"soak: {len(samples)} samples, need {SOAK_WARMUP_SAMPLES + SOAK_MIN_SAMPLES} to judge drift "
+              f"(run longer or lower --sample)")
+        return 0
+    for drift in drifts:
+        print(f"soak: DRIFT {drift}")
+    print(f"soak: {'FAILED' if drifts else 'ok'}, {samples[-1]['sessions']} sessions, {len(samples)} samples")
+    return 1 if drifts else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,207 @@
+"""Per-attempt telemetry.
+
+The render thread only builds a small dict and appends it to a
+``collections.deque`` (append/popleft are atomic: no lock is taken on
+either side). A daemon writer thread wakes every TELEMETRY_FLUSH_SECONDS,
+drains the deque and appends the batch as one gzip member to the current
+JSONL segment under ``<data dir>/telemetry/``; segments rotate every
+TELEMETRY_SEGMENT_RECORDS records. ``python -m game.bench telemetry``
+measures the cost per attempt on the emitting side.
+
+Record types:
+- ``attempt``: minigame, attempt number, reaction time, stop error,
+  score, success and frame-time stats of the attempt;
+- ``session``: player, minigame ids and scores, total.
+"""
+import gzip
+import json
+import os
+import socket
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+from .config import (FPS, TELEMETRY_BUFFER_RECORDS, TELEMETRY_CABINET, TELEMETRY_ENABLED,
+                     TELEMETRY_FLUSH_SECONDS, TELEMETRY_SEGMENT_RECORDS)
+from .leaderboard import get_data_dir
+
+
+TELEMETRY_DIRNAME = "telemetry"
+SEGMENT_SUFFIX = ".jsonl.gz"
+
+# Frames longer than this many frame budgets (at the pacer's current fps) count as late
+LATE_FRAME_FACTOR = 1.5
+
+
+def get_telemetry_dir() -> str:
+    return os.path.join(get_data_dir(), TELEMETRY_DIRNAME)
+
+
+class FrameStats:
+    """Frame-time accumulator for one attempt (no per-frame allocation)."""
+
+    __slots__ = ("count", "total", "worst", "late")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.worst = 0.0
+        self.late = 0
+
+    def add(self, dt: float, fps: float = FPS) -> None:
+        """One frame of ``dt`` seconds, paced at ``fps`` (the quality tier may lower it; 0: unpaced)."""
+        self.count += 1
+        self.total += dt
+        if dt > self.worst:
+            self.worst = dt
+        if fps and dt > LATE_FRAME_FACTOR / fps:
+            self.late += 1
+
+    def as_dict(self) -> dict:
+        mean = self.total / self.count if self.count else 0.0
+        return {"count": self.count, "mean_ms": round(mean * 1000.0, 3),
+                "max_ms": round(self.worst * 1000.0, 3), "late": self.late}
+
+
+class Attempt:
+    """What the game knows about the running attempt until complete_minigame."""
+
+    __slots__ = ("session", "minigame", "number", "started", "stopped", "frames")
+
+    def __init__(self, session: str, minigame: str, number: int):
+        self.session = session
+        self.minigame = minigame
+        self.number = number
+        self.started = time.perf_counter()
+        self.stopped: Optional[float] = None
+        self.frames = FrameStats()
+
+    def mark_stopped(self) -> None:
+        if self.stopped is None:
+            self.stopped = time.perf_counter()
+
+
+class SegmentWriter(threading.Thread):
+    """Background thread draining the buffer into rotating gzip JSONL segments."""
+
+    def __init__(self, buffer: deque, directory: str, segment_records: int = TELEMETRY_SEGMENT_RECORDS,
+                 interval: float = TELEMETRY_FLUSH_SECONDS):
+        super().__init__(name="telemetry-writer", daemon=True)
+        self.buffer = buffer
+        self.directory = directory
+        self.segment_records = segment_records
+        self.interval = interval
+        self.written = 0
+        self._segment_path: Optional[str] = None
+        self._segment_count = 0
+        self._sequence = 0
+        self._wake = threading.Event()
+        self._stopping = False
+
+    def run(self) -> None:
+        while not self._stopping:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            self.flush()
+        self.flush()
+
+    def stop(self) -> None:
+        self._stopping = True
+        self._wake.set()
+        self.join()
+
+    def _new_segment(self) -> str:
+        self._sequence += 1
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        name = f"{stamp}-{os.getpid()}-{self._sequence:04d}{SEGMENT_SUFFIX}"
+        self._segment_count = 0
+        return os.path.join(self.directory, name)
+
+    def flush(self) -> None:
+        batch = []
+        try:
+            while True:
+                batch.append(self.buffer.popleft())
+        except IndexError:
+            pass
+        while batch:
+            if self._segment_path is None or self._segment_count >= self.segment_records:
+                self._segment_path = self._new_segment()
+            room = self.segment_records - self._segment_count
+            chunk, batch = batch[:room], batch[room:]
+            data = "".join(json.dumps(r, ensure_ascii=False, separators=(",", ":")) + "\n" for r in chunk)
+            os.makedirs(self.directory, exist_ok=True)
+            # One gzip member per flush: the segment stays readable while it grows
+            with gzip.open(self._segment_path, "ab") as f:
+                f.write(data.encode("utf-8"))
+            self._segment_count += len(chunk)
+            self.written += len(chunk)
+
+
+class Telemetry:
+    def __init__(self, enabled: bool = TELEMETRY_ENABLED, directory: Optional[str] = None,
+                 buffer_records: int = TELEMETRY_BUFFER_RECORDS):
+        self.enabled = enabled
+        self.cabinet = TELEMETRY_CABINET or socket.gethostname()
+        self.buffer: deque = deque(maxlen=buffer_records)
+        self.dropped = 0
+        # Cost on the emitting (render) thread
+        self.emitted = 0
+        self.emit_ns = 0
+        self._writer: Optional[SegmentWriter] = None
+        if enabled:
+            self._writer = SegmentWriter(self.buffer, directory or get_telemetry_dir())
+            self._writer.start()
+
+    def emit(self, record: dict) -> None:
+        if not self.enabled:
+            return
+        if len(self.buffer) == self.buffer.maxlen:
+            self.dropped += 1  # the writer fell behind: the oldest record goes
+        self.buffer.append(record)
+
+    def record_attempt(self, attempt: Attempt, scene, score, success) -> None:
+        if not self.enabled or attempt is None:
+            return
+        start = time.perf_counter_ns()
+        reaction = attempt.stopped - attempt.started if attempt.stopped is not None else None
+        stop_error = getattr(scene, "stop_error", None)
+        if isinstance(stop_error, float):
+            stop_error = round(stop_error, 3)
+        self.emit({
+            "type": "attempt",
+            "ts": time.time(),
+            "cabinet": self.cabinet,
+            "session": attempt.session,
+            "minigame": attempt.minigame,
+            "attempt": attempt.number,
+            "reaction_ms": round(reaction * 1000.0, 1) if reaction is not None else None,
+            "stop_error": stop_error,
+            "score": score,
+            "success": bool(success),
+            "frames": attempt.frames.as_dict(),
+        })
+        self.emitted += 1
+        self.emit_ns += time.perf_counter_ns() - start
+
+    def record_session(self, session: str, player: Optional[str], minigames, scores, total: int) -> None:
+        self.emit({
+            "type": "session",
+            "ts": time.time(),
+            "cabinet": self.cabinet,
+            "session": session,
+            "player": player,
+            "minigames": list(minigames),
+            "scores": list(scores),
+            "total": total,
+        })
+
+    def emit_cost_us(self) -> float:
+        """Mean render-thread cost of record_attempt, in microseconds."""
+        return self.emit_ns / self.emitted / 1000.0 if self.emitted else 0.0
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.stop()
+            self._writer = None
@@ -1,6 +1,8 @@
 import os
 import pygame
-from .config import WIDTH, HEIGHT, SND_DIR, FONT_PATH, NOT_CENTER_MSG, WIN_MSG, PRIMARY_COLOR, SECONDARY_COLOR, GOOD_COLOR, BAD_COLOR, FRAME_BEZEL_THICKNESS, FRAME_CHIN_HEIGHT, GAME_WIDTH, GAME_HEIGHT
+from .config import WIDTH, HEIGHT, SND_DIR, FONT_PATH, FRAME_BEZEL_THICKNESS, FRAME_CHIN_HEIGHT, GAME_WIDTH, GAME_HEIGHT
+from . import manifest as asset_manifest
+from .quality import current_tier
 
 
 def clamp(value, min_value, max_value):
@@ -29,13 +31,31 @@ def draw_center_line(surface, x, y, height, color, thickness=3):
     pygame.draw.line(surface, color, (x, y - height // 2), (x, y + height // 2), thickness)
 
 
+def fit_size(size, max_w, max_h):
+    """Size of an image scaled down (never up) to fit in max_w × max_h."""
+    w, h = size
+    scale = min(max_w / w, max_h / h, 1.0)
+    if scale == 1.0:
+        return (w, h)
+    return (int(w * scale), int(h * scale))
+
+
 def load_image(path, max_w=720, max_h=400):
-    if os.path.isfile(path):
+    manifest = asset_manifest.get_manifest()
+    if manifest is not None:
+        # Baked assets: no filesystem lookups, pre-scaled variant when available
+        baked = asset_manifest.baked_variant_path(manifest, path, max_w, max_h)
+        if baked:
+            return pygame.image.load(baked).convert_alpha()
+        exists = asset_manifest.has_image(manifest, path)
+    else:
+        exists = os.path.isfile(path)
+    if exists:
         img = pygame.image.load(path).convert_alpha()
-        w, h = img.get_size()
-        scale = min(max_w / w, max_h / h, 1.0)
-        if scale != 1.0:
-            img = pygame.transform.smoothscale(img, (int(w * scale), int(h * scale)))
+        size = fit_size(img.get_size(), max_w, max_h)
+        if size != img.get_size():
+            scale = pygame.transform.smoothscale if current_tier().smoothscale else pygame.transform.scale
+            img = scale(img, size)
         return img
     else:
         surf = pygame.Surface((max_w, int(max_h * 0.75)), pygame.SRCALPHA)
@@ -72,6 +92,13 @@ def _resolve_sound_filename(name: str) -> str | None:
     return actual
 
 
+def _sound_exists(actual_name: str) -> bool:
+    manifest = asset_manifest.get_manifest()
+    if manifest is not None:
+        return asset_manifest.has_sound(manifest, actual_name)
+    return os.path.isfile(os.path.join(SND_DIR, actual_name))
+
+
 def load_sound(name):
     if name in _SOUND_CACHE:
         return _SOUND_CACHE[name]
@@ -80,7 +107,7 @@ def load_sound(name):
         _SOUND_CACHE[name] = None
         return None
     path = os.path.join(SND_DIR, actual_name)
-    if os.path.isfile(path):
+    if _sound_exists(actual_name):
         try:
             snd = pygame.mixer.Sound(path)
             vol = _DEFAULT_VOLUME.get(name)
@@ -103,17 +130,7 @@ def get_music_path(name: str) -> str | None:
     if not actual_name:
         return None
     path = os.path.join(SND_DIR, actual_name)
-    return path if os.path.isfile(path) else None
-
-
-def render_not_center_message(font) -> pygame.Surface:
-    """Render the shared 'not center' message with the given font in error color."""
-    return font.render(NOT_CENTER_MSG, True, BAD_COLOR)
-
-
-def render_win_message(font) -> pygame.Surface:
-    """Render the shared win message with the given font in success color."""
-    return font.render(WIN_MSG, True, GOOD_COLOR)
+    return path if _sound_exists(actual_name) else None
 
 
 def get_game_area_rect() -> pygame.Rect:
@@ -213,8 +230,8 @@ def create_scanlines(width, height, line_height=2, alpha=30):
     return scanline_surface
 
 
-def crt_shutdown_effect(screen, duration, game_surface, game_area):
-    """Simulate a CRT screen shutting down."""
+def crt_shutdown_effect(presenter, duration, game_surface, game_area):
+    """Simulate a CRT screen shutting down (presenter: see game.present)."""
     snapshot = game_surface.copy()
     
     # Shrink and brighten effect
@@ -234,28 +251,25 @@ def crt_shutdown_effect(screen, duration, game_surface, game_area):
         frame_surface.blit(scaled, (game_area.left, y))
         
         # Scale and draw to screen
-        screen.blit(pygame.transform.scale(frame_surface, screen.get_rect().size), (0, 0))
-        pygame.display.flip()
+        presenter.present(frame_surface)
         pygame.time.delay(duration // 20)
 
     # Final white line
     frame_surface = pygame.Surface((WIDTH, HEIGHT))
     draw_80s_computer_frame(frame_surface)
     pygame.draw.line(frame_surface, (255, 255, 255), (game_area.left, game_area.centery), (game_area.right, game_area.centery), 4)
-    screen.blit(pygame.transform.scale(frame_surface, screen.get_rect().size), (0, 0))
-    pygame.display.flip()
-    pygame.time.delay(200)
+    presenter.present(frame_surface)
+    pygame.time.delay(duration * 2 // 5)  # white line held (200 ms at 500 ms)
 
 
-def crt_power_on_effect(screen, duration, final_surface, game_area):
-    """Simulate a CRT screen powering on."""
+def crt_power_on_effect(presenter, duration, final_surface, game_area):
+    """Simulate a CRT screen powering on (presenter: see game.present)."""
     # Start with a white line
     frame_surface = pygame.Surface((WIDTH, HEIGHT))
     draw_80s_computer_frame(frame_surface)
     pygame.draw.line(frame_surface, (255, 255, 255), (game_area.left, game_area.centery), (game_area.right, game_area.centery), 4)
-    screen.blit(pygame.transform.scale(frame_surface, screen.get_rect().size), (0, 0))
-    pygame.display.flip()
-    pygame.time.delay(200)
+    presenter.present(frame_surface)
+    pygame.time.delay(duration * 2 // 5)  # white line held (200 ms at 500 ms)
 
     # Expand and fade in effect
     for i in range(0, 101, 5):
@@ -274,24 +288,5 @@ def crt_power_on_effect(screen, duration, final_surface, game_area):
         frame_surface.blit(scaled, (game_area.left, y))
         
         # Scale and draw to screen
-        screen.blit(pygame.transform.scale(frame_surface, screen.get_rect().size), (0, 0))
-        pygame.display.flip()
+        presenter.present(frame_surface)
         pygame.time.delay(duration // 20)
-
-
-def draw_attempts(surface, game, pos=(None, 24)):
-    """Draw attempts HUD as small circles. pos: (x, y); x=None → right margin."""
-    if getattr(game, "max_attempts_per_game", None) is None:
-        return
-    max_att = int(game.max_attempts_per_game)
-    left = int(game.current_attempts_left) if game.current_attempts_left is not None else max_att
-    y = pos[1] if pos[1] is not None else 24
-    radius = 8
-    gap = 8
-    total_w = max_att * (radius * 2) + (max_att - 1) * gap
-    x0 = GAME_WIDTH - 20 - total_w if pos[0] is None else pos[0]
-    for i in range(max_att):
-        cx = x0 + i * (radius * 2 + gap) + radius
-        color = GOOD_COLOR if i < left else (90, 90, 90)
-        pygame.draw.circle(surface, color, (cx, y), radius)
-        pygame.draw.circle(surface, (30, 30, 30), (cx, y), radius, 2)
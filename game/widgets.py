@@ -0,0 +1,128 @@
+"""Retained-mode HUD widgets.
+
+Each widget keeps its rendered surface and only re-renders when the state
+passed to ``draw`` differs from the previous frame, so static headers,
+attempt counters and result panels cost a single blit per frame.
+"""
+import pygame
+from .config import BAD_COLOR, GAME_WIDTH, GOOD_COLOR, NOT_CENTER_MSG, WIN_MSG
+from .utils import blit_text_center
+
+
+_OVERLAY_CACHE = {}
+
+
+def get_overlay(size, alpha=150):
+    """Shared translucent black overlay used behind result panels."""
+    key = (tuple(size), alpha)
+    overlay = _OVERLAY_CACHE.get(key)
+    if overlay is None:
+        overlay = pygame.Surface(size, pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, alpha))
+        _OVERLAY_CACHE[key] = overlay
+    return overlay
+
+
+class Label:
+    """A line of text centered horizontally at ``y`` (or placed at ``pos``)."""
+
+    def __init__(self, font, y=None, color=(255, 255, 255), pos=None):
+        self.font = font
+        self.y = y
+        self.pos = pos
+        self.color = color
+        self._key = None
+        self.surface = None
+
+    def render(self, text, color=None):
+        """Return the cached surface, re-rendering only if text or color changed."""
+        color = color or self.color
+        key = (text, color)
+        if key != self._key:
+            self._key = key
+            self.surface = self.font.render(text, True, color)
+        return self.surface
+
+    def draw(self, surface, text, color=None):
+        surf = self.render(text, color)
+        if self.pos is not None:
+            surface.blit(surf, self.pos)
+        else:
+            blit_text_center(surface, surf, self.y)
+
+
+class AttemptsHud:
+    """Attempts left as small circles; re-rendered when the counts change."""
+
+    RADIUS = 8
+    GAP = 8
+
+    def __init__(self, game, pos=(None, 24)):
+        self.game = game
+        self.pos = pos
+        self._key = None
+        self.surface = None
+
+    def _render(self, max_att, left):
+        r = self.RADIUS
+        total_w = max_att * (r * 2) + (max_att - 1) * self.GAP
+        surf = pygame.Surface((max(1, total_w), r * 2 + 1), pygame.SRCALPHA)
+        for i in range(max_att):
+            cx = i * (r * 2 + self.GAP) + r
+            color = GOOD_COLOR if i < left else (90, 90, 90)
+            pygame.draw.circle(surf, color, (cx, r), r)
+            pygame.draw.circle(surf, (30, 30, 30), (cx, r), r, 2)
+        return surf
+
+    def render(self):
+        """Return (surface, topleft), or (None, None) when attempts are disabled."""
+        if getattr(self.game, "max_attempts_per_game", None) is None:
+            return None, None
+        max_att = int(self.game.max_attempts_per_game)
+        left = int(self.game.current_attempts_left) if self.game.current_attempts_left is not None else max_att
+        key = (max_att, left)
+        if key != self._key:
+            self._key = key
+            self.surface = self._render(max_att, left)
+        y = self.pos[1] if self.pos[1] is not None else 24
+        x0 = GAME_WIDTH - 20 - self.surface.get_width() if self.pos[0] is None else self.pos[0]
+        return self.surface, (x0, y - self.RADIUS)
+
+    def draw(self, surface):
+        surf, topleft = self.render()
+        if surf is not None:
+            surface.blit(surf, topleft)
+
+
+class ResultPanel:
+    """Dimmed overlay plus a stack of centered lines, cached as one surface.
+
+    ``lines`` is a sequence of (font, text, color, y) tuples; the composed
+    panel is rebuilt only when that sequence changes.
+    """
+
+    def __init__(self, size, alpha=150):
+        self.size = size
+        self.alpha = alpha
+        self._key = None
+        self.surface = None
+
+    @staticmethod
+    def title(win, font, font_small):
+        """First line of a result panel: shared win / not-center message (without its y)."""
+        if win:
+            return (font, WIN_MSG, GOOD_COLOR)
+        return (font_small, NOT_CENTER_MSG, BAD_COLOR)
+
+    def render(self, lines):
+        key = tuple((id(font), text, color, y) for font, text, color, y in lines)
+        if key != self._key:
+            self._key = key
+            panel = get_overlay(self.size, self.alpha).copy()
+            for font, text, color, y in lines:
+                blit_text_center(panel, font.render(text, True, color), y)
+            self.surface = panel
+        return self.surface
+
+    def draw(self, surface, lines):
+        surface.blit(self.render(lines), (0, 0))